@@ -1,96 +1,91 @@
+import time
+MOMENT_PORNIRE = time.perf_counter()
 import sys
 import os
 import csv
 import json
+import logging
+import queue
+import threading
 from datetime import datetime, timedelta
-import pandas as pd
-import numpy as np
+
+if __name__ == '__main__' and '--check' in sys.argv[1:]:
+    # Verificarea fără interfață (cron, server fără ecran) nu are nevoie de Qt
+    import reminder_check
+    sys.exit(reminder_check.main(sys.argv[1:]))
+
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
                              QMessageBox, QTextEdit, QSystemTrayIcon, QMenu, QAction, QStyle, QDialog, 
                              QComboBox, QScrollArea, QSpinBox, QTableView, QHeaderView, QFileDialog, 
                              QStyledItemDelegate, QDateEdit, QAbstractItemView, QToolTip, QTimeEdit, 
-                             QCheckBox, QDesktopWidget, QShortcut)
+                             QCheckBox, QDesktopWidget, QShortcut, QListView, QUndoStack, QUndoCommand, QLineEdit)
 from PyQt5.QtCore import (QTimer, Qt, QSettings, pyqtSignal, QRect, QDate, QAbstractTableModel, 
-                          QModelIndex, QVariant, QEvent, QTime, QPoint, QItemSelection, QItemSelectionModel)
-from PyQt5.QtGui import QFont, QColor, QIcon, QCursor, QKeySequence, QFontMetrics
+                          QModelIndex, QVariant, QEvent, QTime, QPoint, QSize, QItemSelection, QItemSelectionModel,
+                          QFileSystemWatcher, QAbstractListModel, QSortFilterProxyModel, QMimeData)
+from PyQt5.QtGui import (QFont, QColor, QIcon, QCursor, QKeySequence, QFontMetrics, QTextDocument,
+                         QTextOption)
 import traceback
-from dateutil.relativedelta import relativedelta
+import reminder_engine
+import reminder_storage
+from reminder_engine import LUNI_RO
+from reminder_calendar import BusinessCalendar
+from reminder_scheduler import NotificationScheduler, urmatoarea_zi, momente_program_lucru
+from reminder_history import HistoryWriter
+from reminder_settings import SettingsStore, DEFAULT_SETTINGS
+from reminder_snapshot import NotificationSnapshot, amprenta
+from reminder_table import (TableStore, intervale, fara_diacritice, citeste_bloc, scrie_bloc_tsv,
+                            scrie_bloc_html, converteste_lipire, muta)
+
+# pandas și NumPy nu se încarcă aici (vezi reminder_engine.importa_lenes), deci acesta e costul importurilor reale
+MOMENT_IMPORTURI = time.perf_counter()
+
+logger = logging.getLogger('reminder')
+
+def creeaza_timer_setari(functie):
+    """Timerul cu o singură declanșare folosit de SettingsStore pentru scrierea amânată."""
+    timer = QTimer()
+    timer.setSingleShot(True)
+    timer.timeout.connect(functie)
+    return timer
 
 def get_romanian_weekday(date):
     weekdays = ['Luni', 'Marți', 'Miercuri', 'Joi', 'Vineri', 'Sâmbătă', 'Duminică']
     return weekdays[date.weekday()]
 
-DEFAULT_SETTINGS = {
-    'x': 500,
-    'y': 1,
-    'width': 581,
-    'height': 1155,
-    'eventNameFont': 28,
-    'serviceEventFont': 24,
-    'dateFont': 24,
-    'deadlineFont': 24,
-    'csvFontSize': 14,
-    'tooltipFontSize': 12,
-    'commemorationTypeFont': 14,
-    'visibility_index': 1,
-    'service_visibility': 'Evenimente serviciu vizibile',
-    'use_work_schedule': False,
-    'show_commemorations': True,
-    'work_schedule': {
-        'Luni': {'start': '08:00', 'end': '16:00', 'day_off': False},
-        'Marți': {'start': '08:00', 'end': '16:00', 'day_off': False},
-        'Miercuri': {'start': '08:00', 'end': '16:00', 'day_off': False},
-        'Joi': {'start': '08:00', 'end': '16:00', 'day_off': False},
-        'Vineri': {'start': '08:00', 'end': '16:00', 'day_off': False},
-        'Sâmbătă': {'start': '00:00', 'end': '00:00', 'day_off': True},
-        'Duminică': {'start': '00:00', 'end': '00:00', 'day_off': True}
-    },
-    'aniversari.csv_column_widths': {
-        '0': 550, '1': 150, '2': 70, '3': 150, '4': 77, '5': 150, '6': 485
-    },
-    'informatii.csv_column_widths': {
-        '0': 373, '1': 150, '2': 70, '3': 150, '4': 100, '5': 77, '6': 150, '7': 100, '8': 334
-    },
-    'sarbatori.csv_column_widths': {
-        '0': 373, '1': 70, '2': 100, '3': 70, '4': 77, '5': 150, '6': 150, '7': 150
-    },
-    'mainButtonsFontSize': 14,
-    'buttonSpacing': 2,
-    'buttonVerticalPadding': 5,
-    'maximized': False
-}
-
-LUNI_RO = ['Ianuarie', 'Februarie', 'Martie', 'Aprilie', 'Mai', 'Iunie', 'Iulie', 'August', 'Septembrie', 'Octombrie', 'Noiembrie', 'Decembrie']
-LUNI_EN = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
-
-def convert_luna(luna):
-    if luna in LUNI_EN:
-        return LUNI_RO[LUNI_EN.index(luna)]
-    return luna
-
-def obtine_mesaj_eveniment(data_curenta, data_eveniment, considera_weekend):
+def _zi_libera(zi):
+    """Numele zilei nelucrătoare în mesaje: weekend sau zi liberă (program de lucru, sărbătoare)."""
+    return "weekend" if zi.weekday() >= 5 else "zi liberă"
+
+def obtine_mesaj_eveniment(data_curenta, data_eveniment, considera_weekend, calendar=None):
     zile_pana_la_eveniment = (data_eveniment - data_curenta).days
 
     if considera_weekend:
-        zile_lucratoare = sum(1 for zi in range(zile_pana_la_eveniment) 
-                              if (data_curenta + timedelta(days=zi)).weekday() < 5)
-        
+        if calendar is None:
+            calendar = BusinessCalendar()
+        # Toate ramurile urmează calendarul (programul de lucru și sărbătorile cu cruce roșie),
+        # ca mesajul să nu contrazică numărul de zile lucrătoare afișat lângă el
+        zile_lucratoare = int(calendar.zile_lucratoare(data_curenta, data_eveniment)) if zile_pana_la_eveniment > 0 else 0
+        azi_lucratoare = calendar.este_zi_lucratoare(data_curenta)
+        eveniment_liber = not calendar.este_zi_lucratoare(data_eveniment)
+        pica = "în weekend" if data_eveniment.weekday() >= 5 else "într-o zi liberă"
+
         if zile_pana_la_eveniment == 0:
-            if data_curenta.weekday() >= 5:
-                return "evenimentul este astăzi, e weekend și probabil că nu mai pot fi efectuate acțiuni"
+            if not azi_lucratoare:
+                return f"evenimentul este astăzi, e {_zi_libera(data_curenta)} și probabil că nu mai pot fi efectuate acțiuni"
             else:
                 return "evenimentul este astăzi"
         elif zile_pana_la_eveniment == 1:
-            if data_curenta.weekday() == 5:  # Sâmbătă
-                return "evenimentul este mâine, e weekend și probabil că nu mai pot fi efectuate acțiuni"
+            if not azi_lucratoare and eveniment_liber:
+                return f"evenimentul este mâine, e {_zi_libera(data_curenta)} și probabil că nu mai pot fi efectuate acțiuni"
             else:
                 return "evenimentul este mâine"
-        elif data_curenta.weekday() == 4 and data_eveniment.weekday() >= 5:  # Vineri
-            return "astăzi e ultima zi utilă, deoarece evenimentul pică în weekend"
-        elif data_curenta.weekday() == 3 and data_eveniment.weekday() >= 5:  # Joi
-            return "mai sunt două zile utile, astăzi și mâine, deoarece evenimentul pică în weekend"
+        elif eveniment_liber and azi_lucratoare and zile_lucratoare == 1:
+            return f"astăzi e ultima zi utilă, deoarece evenimentul pică {pica}"
+        elif (eveniment_liber and azi_lucratoare and zile_lucratoare == 2
+              and calendar.este_zi_lucratoare(data_curenta + timedelta(days=1))):
+            return f"mai sunt două zile utile, astăzi și mâine, deoarece evenimentul pică {pica}"
         else:
-            if data_eveniment.weekday() >= 5:
+            if eveniment_liber:
                 return f"mai sunt {zile_lucratoare} zile lucrătoare"
             else:
                 return f"mai sunt {zile_lucratoare} zile lucrătoare, cu tot cu ziua evenimentului"
@@ -109,32 +104,105 @@ def obtine_mesaj_eveniment(data_curenta, data_eveniment, considera_weekend):
         else:
             return f"mai sunt {zile_pana_la_eveniment} zile calendaristice"
 
+INDEX_LUNA = {luna: i for i, luna in enumerate(LUNI_RO)}
+
+OPTIUNI_CICLU = (['', 'lunar', 'anual'] + [f'la {i} {"luni" if i != 1 else "luna"}' for i in range(2, 12)]
+                 + [f'la {i} {"ani" if i != 1 else "an"}' for i in range(2, 11)])
+
 class CustomTableModel(QAbstractTableModel):
-    def __init__(self, data, headers):
+    loadingFinished = pyqtSignal()
+
+    def __init__(self, data, headers, ids=None):
         super().__init__()
-        self._data = data
+        # Datele se țin pe coloane codificate prin dicționar (vezi reminder_table), deja ca text de afișat
+        self._store = TableStore(headers, data, ids)
         self._headers = headers
         self._sort_column = None
         self._sort_order = Qt.AscendingOrder
-        print("CustomTableModel inițializat cu succes")
+        self._undo_stack = None
+        self._loading = False
+        self._chunks = None
+        self._fetch_timer = None
+        logger.debug("CustomTableModel inițializat cu succes")
+
+    def loadInBackground(self, chunks):
+        """
+        Adaugă rândurile din `chunks` (iterator de (rânduri, indecși)) pe măsură ce sunt
+        convertite, pe un fir separat. View-ul le cere prin fetchMore, iar un timer le
+        adaugă oricum pe toate, ca la final modelul să conțină tot tabelul.
+        """
+        self._chunks = queue.Queue()
+        self._loading = True
+        threading.Thread(target=self._readChunks, args=(chunks, self._chunks),
+                         name='CSVEditorLoader', daemon=True).start()
+        self._fetch_timer = QTimer(self)
+        self._fetch_timer.timeout.connect(self.fetchMore)
+        self._fetch_timer.start(50)
+
+    @staticmethod
+    def _readChunks(chunks, output):
+        try:
+            for chunk in chunks:
+                output.put(chunk)
+        except Exception as e:
+            logger.error("Eroare la încărcarea rândurilor în editor: %s", e)
+        finally:
+            output.put(None)
+
+    def isLoading(self):
+        return self._loading
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        self._fetchChunks(block=False)
+
+    def fetchAll(self):
+        """Așteaptă restul rândurilor; se apelează înainte de sortare, adăugare sau salvare."""
+        while self._loading:
+            self._fetchChunks(block=True)
+
+    def _fetchChunks(self, block):
+        if not self._loading:
+            return
+        chunks = []
+        try:
+            chunks.append(self._chunks.get(block=block))
+            while True:
+                chunks.append(self._chunks.get_nowait())
+        except queue.Empty:
+            pass
+        rows, ids = [], []
+        for chunk in chunks:
+            if chunk is None:
+                self._loading = False
+            else:
+                rows.extend(chunk[0])
+                ids.extend(chunk[1])
+        if rows:
+            self.insertRowValues(len(self._store), rows, ids)
+        if not self._loading:
+            self._fetch_timer.stop()
+            logger.debug("Încărcare în editor terminată: %s rânduri", len(self._store))
+            self.loadingFinished.emit()
+
+    def setUndoStack(self, undo_stack):
+        """Editările din view și sortările se înregistrează ca comenzi în `undo_stack`."""
+        self._undo_stack = undo_stack
 
     def rowCount(self, parent=QModelIndex()):
-        return len(self._data)
+        return 0 if parent.isValid() else len(self._store)
 
     def columnCount(self, parent=QModelIndex()):
-        return len(self._headers)
+        return 0 if parent.isValid() else len(self._headers)
 
     def data(self, index, role=Qt.DisplayRole):
         if not index.isValid():
             return QVariant()
         
         if role == Qt.DisplayRole or role == Qt.EditRole:
-            value = self._data[index.row()][index.column()]
-            if pd.isna(value):
-                return ""
-            if isinstance(value, (int, float)):
-                return str(value)
-            return value
+            return self._store.value(index.row(), index.column())
         elif role == Qt.TextAlignmentRole:
             if index.column() == 0:
                 return Qt.AlignLeft | Qt.AlignVCenter
@@ -145,51 +213,155 @@ class CustomTableModel(QAbstractTableModel):
 
     def setData(self, index, value, role=Qt.EditRole):
         if role == Qt.EditRole:
-            self._data[index.row()][index.column()] = value
-            self.dataChanged.emit(index, index)
+            row, column = index.row(), index.column()
+            value = '' if value is None else str(value)
+            old_value = self._store.value(row, column)
+            if value == old_value:
+                return True
+            if self._undo_stack is not None:
+                self._undo_stack.push(EditCellsCommand(self, [(row, column, old_value, value)]))
+            else:
+                self.setCells([(row, column, value)])
             return True
         return False
 
+    def setCells(self, changes):
+        """Scrie valorile (rând, coloană, valoare) fără a le înregistra în jurnal."""
+        if not changes:
+            return
+        for row, column, value in changes:
+            self._store.set_value(row, column, value)
+        rows = [row for row, _, _ in changes]
+        columns = [column for _, column, _ in changes]
+        self.dataChanged.emit(self.index(min(rows), min(columns)), self.index(max(rows), max(columns)))
+
+    def rows(self):
+        """Toate rândurile, ca liste de text, în ordinea afișată."""
+        return self._store.rows()
+
+    def copyBlock(self, rows, columns):
+        """Valorile text ale celulelor date, direct din coloane (fără data())."""
+        return [[self._store.value(row, column) for column in columns] for row in rows]
+
+    def preparePaste(self, target_rows, left_column, block, column_types, new_rows):
+        """
+        Pregătește lipirea lui `block` începând cu coloana `left_column`: primele rânduri
+        ale blocului merg pe `target_rows`, restul completează `new_rows` (rânduri noi,
+        cu valorile implicite). Valorile se convertesc pe coloane, după `column_types`.
+        Întoarce (modificări (rând, coloană, vechi, nou), rânduri noi, erori (rând bloc, antet, valoare)).
+        """
+        columns = range(left_column, min(left_column + max(len(row) for row in block), self.columnCount()))
+        converted = {}
+        errors = []
+        for j, column in enumerate(columns):
+            values = [row[j] if j < len(row) else None for row in block]
+            present = [i for i, value in enumerate(values) if value is not None]
+            results = converteste_lipire(column_types[column], [values[i] for i in present])
+            for i, value in zip(present, results):
+                if value is None:
+                    errors.append((i, self._headers[column], values[i]))
+                else:
+                    converted[i, column] = value
+        changes = []
+        for (i, column), value in converted.items():
+            if i < len(target_rows):
+                row = target_rows[i]
+                old_value = self._store.value(row, column)
+                if value != old_value:
+                    changes.append((row, column, old_value, value))
+            else:
+                new_rows[i - len(target_rows)][column] = value
+        errors.sort()
+        return changes, new_rows, errors
+
+    def filterRows(self, terms, predicates):
+        """Câte un bool pe rând, vezi TableStore.filtreaza."""
+        return self._store.filtreaza(terms, predicates)
+
+    def filterRowRange(self, first, last, terms, predicates):
+        """filterRows doar pentru rândurile first..last (inclusiv), vezi TableStore.filtreaza_interval."""
+        return self._store.filtreaza_interval(first, last + 1, terms, predicates)
+
+    def rowValues(self, row):
+        return self._store.row(row)
+
+    def rowId(self, row):
+        """Indexul rândului în tabelul din depozit, sau None pentru un rând adăugat în editor."""
+        return self._store.ids[row]
+
+    def resetRowIds(self):
+        # După o salvare completă depozitul numerotează rândurile în ordinea din editor
+        self._store.ids = list(range(len(self._store)))
+
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
             return self._headers[section]
         return QVariant()
 
     def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
         return Qt.ItemIsEditable | Qt.ItemIsEnabled | Qt.ItemIsSelectable
 
     def sort(self, column, order):
-        print(f"Sortare începută pentru coloana {column}")
-        self.layoutAboutToBeChanged.emit()
-        self._sort_column = column
-        self._sort_order = order
-        
-        if self._headers[column] == 'luna':
-            self._data.sort(key=lambda row: LUNI_RO.index(row[column]) if row[column] in LUNI_RO else -1,
-                            reverse=(order == Qt.DescendingOrder))
-        elif self._headers[column] == 'ziua':
-            self._data.sort(key=lambda row: (LUNI_RO.index(row[self._headers.index('luna')]), int(row[column])),
-                            reverse=(order == Qt.DescendingOrder))
-        elif self._headers[column] == 'data':
-            self._data.sort(key=lambda row: self.getSortKeyForDate(row[column]),
-                            reverse=(order == Qt.DescendingOrder))
+        if self._headers[column] == 'ziua' and 'luna' in self._headers:
+            # Ziua are sens doar împreună cu luna
+            self.sortBy([(self._headers.index('luna'), order), (column, order)])
         else:
-            self._data.sort(key=lambda row: self.getSortKey(row[column]),
-                            reverse=(order == Qt.DescendingOrder))
-        
+            self.sortBy([(column, order)])
+
+    def sortBy(self, criteria):
+        """
+        Sortare stabilă după mai multe coloane; `criteria` este o listă de (coloană, ordine),
+        prima fiind cheia principală. Cheile se calculează o singură dată pe valoare
+        distinctă a coloanei, deci o nouă sortare nu mai interpretează celulele.
+        """
+        logger.debug("Sortare începută după %s", criteria)
+        self.fetchAll()
+        order = list(range(len(self._store)))
+        for column, column_order in reversed(criteria):
+            keys = self._store.sort_keys(column, self._sortKeyFunction(column))
+            order.sort(key=keys.__getitem__, reverse=(column_order == Qt.DescendingOrder))
+        self._sort_column, self._sort_order = criteria[0]
+        if order != list(range(len(order))):
+            if self._undo_stack is not None:
+                self._undo_stack.push(SortRowsCommand(self, order))
+            else:
+                self.applyOrder(order)
+        logger.debug("Sortare finalizată după %s", criteria)
+
+    def applyOrder(self, order):
+        self.layoutAboutToBeChanged.emit()
+        self._reorderRows(order)
         self.layoutChanged.emit()
-        print(f"Sortare finalizată pentru coloana {column}")
-        print(f"Primele 5 rânduri după sortare: {self._data[:5]}")
+
+    def _reorderRows(self, order):
+        """Aplică permutarea `order` (poziții vechi în ordinea nouă) și mută indecșii persistenți."""
+        new_position = [0] * len(order)
+        for new_row, old_row in enumerate(order):
+            new_position[old_row] = new_row
+        self._store.reorder(order)
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [self.index(new_position[i.row()], i.column()) for i in old_indexes])
+
+    def _sortKeyFunction(self, column):
+        header = self._headers[column]
+        if header == 'luna':
+            return self.getSortKeyForMonth
+        if header == 'ziua':
+            return self.getSortKeyForDay
+        if header == 'data':
+            return self.getSortKeyForDate
+        return self.getSortKey
 
     def getSortKey(self, value):
-        print(f"Obținere cheie de sortare pentru valoarea: {value}")
-        if pd.isna(value) or value == '':
+        if este_gol(value) or value == '':
             return (0, '')  # Valori goale vor fi sortate la început
         if isinstance(value, str):
             if value.lower() in ['true', 'false']:
                 return (1, value.lower() == 'true')
-            if value in LUNI_RO:
-                return (2, LUNI_RO.index(value))
+            if value in INDEX_LUNA:
+                return (2, INDEX_LUNA[value])
             try:
                 return (3, int(value))
             except ValueError:
@@ -205,34 +377,255 @@ class CustomTableModel(QAbstractTableModel):
         try:
             date = datetime.strptime(date_string, '%d-%m-%Y')
             return (date.month, date.day, date.year)
-        except ValueError:
+        except (ValueError, TypeError):
             return (13, 32, 9999)
 
+    def getSortKeyForMonth(self, value):
+        return INDEX_LUNA.get(value, -1)
+
+    def getSortKeyForDay(self, value):
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return -1
+
     def updateData(self, new_data):
         self.beginResetModel()
-        self._data = new_data
+        self._store = TableStore(self._headers, new_data)
         self.endResetModel()
 
-    def insertRow(self, position, parent=QModelIndex()):
-        self.beginInsertRows(parent, position, position)
-        empty_row = [''] * self.columnCount()
-        self._data.insert(position, empty_row)
-        self.endInsertRows()
+    def insertRow(self, position, parent=QModelIndex(), values=None):
+        self.insertRowValues(position, [values if values is not None else [''] * self.columnCount()])
         return True
 
-    def removeRow(self, position, parent=QModelIndex()):
-        self.beginRemoveRows(parent, position, position)
-        del self._data[position]
+    def insertRowValues(self, position, rows, ids=None):
+        self.beginInsertRows(QModelIndex(), position, position + len(rows) - 1)
+        self._store.insert_rows(position, rows, ids)
+        self.endInsertRows()
+
+    def takeRows(self, position, count):
+        """Scoate `count` rânduri de la `position` și le întoarce, împreună cu indecșii lor."""
+        rows = [self._store.row(row) for row in range(position, position + count)]
+        ids = self._store.ids[position:position + count]
+        self.beginRemoveRows(QModelIndex(), position, position + count - 1)
+        self._store.remove_rows(position, count)
         self.endRemoveRows()
+        return rows, ids
+
+    def removeRows(self, position, count, parent=QModelIndex()):
+        self.takeRows(position, count)
         return True
 
-    def moveRow(self, sourceParent, sourceRow, destinationParent, destinationChild):
-        self.beginMoveRows(sourceParent, sourceRow, sourceRow, destinationParent, destinationChild)
-        row = self._data.pop(sourceRow)
-        self._data.insert(destinationChild, row)
+    def moveRows(self, sourceParent, sourceRow, count, destinationParent, destinationChild):
+        # destinationChild are semantica Qt: poziția, înainte de mutare, în fața căreia ajung rândurile
+        if not self.beginMoveRows(sourceParent, sourceRow, sourceRow + count - 1, destinationParent, destinationChild):
+            return False
+        new_start = destinationChild if destinationChild < sourceRow else destinationChild - count
+        self._store.move_rows(sourceRow, count, new_start)
         self.endMoveRows()
         return True
 
+    def moveRowRange(self, start, count, new_start):
+        """Mută rândurile [start, start + count) astfel încât primul să ajungă pe poziția `new_start`."""
+        destination = new_start if new_start < start else new_start + count
+        return self.moveRows(QModelIndex(), start, count, QModelIndex(), destination)
+
+class FilterProxyModel(QSortFilterProxyModel):
+    """
+    Filtrul editorului. Rezultatul (câte un bool pe rândurile modelului sursă) se calculează
+    în bloc de CustomTableModel.filterRows și apoi se actualizează doar pentru rândurile
+    editate, inserate, șterse sau mutate; se recalculează integral numai la resetarea sau
+    reordonarea sursei. Sortarea se face în modelul sursă, ca noua ordine să poată fi
+    salvată și anulată.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._terms = []
+        self._predicates = []
+        self._accepted = None
+
+    def setSourceModel(self, model):
+        # Ne conectăm înaintea QSortFilterProxyModel, ca rezultatul să fie actualizat
+        # înainte ca proxy-ul să reevalueze rândurile schimbate
+        model.layoutAboutToBeChanged.connect(self.invalidateAccepted)
+        model.modelAboutToBeReset.connect(self.invalidateAccepted)
+        model.dataChanged.connect(self.onSourceDataChanged)
+        model.rowsInserted.connect(self.onSourceRowsInserted)
+        model.rowsRemoved.connect(self.onSourceRowsRemoved)
+        model.rowsMoved.connect(self.onSourceRowsMoved)
+        super().setSourceModel(model)
+
+    def invalidateAccepted(self, *args):
+        self._accepted = None
+
+    def onSourceDataChanged(self, top_left, bottom_right, roles=()):
+        if self._accepted is not None:
+            first, last = top_left.row(), bottom_right.row()
+            self._accepted[first:last + 1] = self.sourceModel().filterRowRange(
+                first, last, self._terms, self._predicates)
+
+    def onSourceRowsInserted(self, parent, first, last):
+        if self._accepted is not None:
+            self._accepted[first:first] = self.sourceModel().filterRowRange(
+                first, last, self._terms, self._predicates)
+
+    def onSourceRowsRemoved(self, parent, first, last):
+        if self._accepted is not None:
+            del self._accepted[first:last + 1]
+
+    def onSourceRowsMoved(self, parent, start, end, destination, row):
+        if self._accepted is not None:
+            count = end - start + 1
+            muta(self._accepted, start, count, row if row < start else row - count)
+
+    def isFiltering(self):
+        return bool(self._terms or self._predicates)
+
+    def setFilter(self, text, predicates):
+        """`text`: termeni căutați în eveniment și observații; `predicates`: (coloană, funcție)."""
+        self._terms = fara_diacritice(text).split()
+        self._predicates = predicates
+        self._accepted = None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._terms and not self._predicates:
+            return True
+        if self._accepted is None:
+            self._accepted = self.sourceModel().filterRows(self._terms, self._predicates)
+        return self._accepted[source_row]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+class EditCellsCommand(QUndoCommand):
+    """Modificarea unor celule; `changes` conține (rând, coloană, valoare veche, valoare nouă)."""
+    def __init__(self, model, changes, text='Editare celulă'):
+        super().__init__(text)
+        self.model = model
+        self.changes = changes
+
+    def redo(self):
+        self.model.setCells([(row, column, new) for row, column, _, new in self.changes])
+
+    def undo(self):
+        self.model.setCells([(row, column, old) for row, column, old, _ in reversed(self.changes)])
+
+    def changedRows(self):
+        return {row for row, _, _, _ in self.changes}
+
+class PasteCommand(QUndoCommand):
+    """Lipirea unui bloc: modificări de celule și, dacă blocul trece de final, rânduri noi."""
+    def __init__(self, model, changes, new_rows, text='Lipire'):
+        super().__init__(text)
+        self.model = model
+        self.changes = changes
+        self.new_rows = new_rows
+        self.position = model.rowCount()
+
+    def redo(self):
+        self.model.setCells([(row, column, new) for row, column, _, new in self.changes])
+        if self.new_rows:
+            self.model.insertRowValues(self.position, self.new_rows)
+
+    def undo(self):
+        if self.new_rows:
+            self.new_rows, _ = self.model.takeRows(self.position, len(self.new_rows))
+        self.model.setCells([(row, column, old) for row, column, old, _ in reversed(self.changes)])
+
+    def changedRows(self):
+        if self.new_rows:
+            return None
+        return {row for row, _, _, _ in self.changes}
+
+class InsertRowsCommand(QUndoCommand):
+    def __init__(self, model, position, rows, text='Adăugare rând'):
+        super().__init__(text)
+        self.model = model
+        self.position = position
+        self.rows = rows
+        self.ids = None
+
+    def redo(self):
+        self.model.insertRowValues(self.position, self.rows, self.ids)
+
+    def undo(self):
+        self.rows, self.ids = self.model.takeRows(self.position, len(self.rows))
+
+    def changedRows(self):
+        # Schimbările de structură cer rescrierea întregului tabel
+        return None
+
+class RemoveRowsCommand(QUndoCommand):
+    """Ștergerea unor rânduri, câte un interval contiguu odată (de jos în sus)."""
+    def __init__(self, model, rows, text='Ștergere rânduri'):
+        super().__init__(text)
+        self.model = model
+        self.ranges = intervale(rows)
+        self.removed = []
+
+    def redo(self):
+        self.removed = [(start, self.model.takeRows(start, count)) for start, count in reversed(self.ranges)]
+
+    def undo(self):
+        for start, (rows, ids) in reversed(self.removed):
+            self.model.insertRowValues(start, rows, ids)
+        self.removed = []
+
+    def changedRows(self):
+        return None
+
+class MoveRowsCommand(QUndoCommand):
+    """Mută rândurile selectate cu o poziție, câte un interval contiguu odată; `step` este -1 (sus) sau 1 (jos)."""
+    def __init__(self, model, rows, step, text='Mutare rânduri'):
+        super().__init__(text)
+        self.model = model
+        ranges = intervale(rows)
+        self.ranges = ranges if step < 0 else ranges[::-1]
+        self.step = step
+
+    def redo(self):
+        for start, count in self.ranges:
+            self.model.moveRowRange(start, count, start + self.step)
+
+    def undo(self):
+        for start, count in reversed(self.ranges):
+            self.model.moveRowRange(start + self.step, count, start)
+
+    def changedRows(self):
+        return None
+
+class SortRowsCommand(QUndoCommand):
+    """
+    O sortare, ca permutare (pozițiile vechi în ordinea nouă). Sortările consecutive
+    se combină într-o singură comandă, deci un Ctrl+Z revine la ordinea de dinainte.
+    """
+    ID = 1
+
+    def __init__(self, model, order, text='Sortare'):
+        super().__init__(text)
+        self.model = model
+        self.order = order
+
+    def id(self):
+        return self.ID
+
+    def mergeWith(self, other):
+        self.order = [self.order[i] for i in other.order]
+        return True
+
+    def redo(self):
+        self.model.applyOrder(self.order)
+
+    def undo(self):
+        inverse = [0] * len(self.order)
+        for new_row, old_row in enumerate(self.order):
+            inverse[old_row] = new_row
+        self.model.applyOrder(inverse)
+
+    def changedRows(self):
+        return None
+
 class ComboBoxDelegate(QStyledItemDelegate):
     def __init__(self, parent, items):
         super().__init__(parent)
@@ -288,7 +681,7 @@ class DateDelegate(QStyledItemDelegate):
             if date.isValid():
                 editor.setDate(date)
         except:
-            print(f"Eroare la setarea datei pentru valoarea: {value}")
+            logger.warning("Eroare la setarea datei pentru valoarea: %s", value)
 
     def setModelData(self, editor, model, index):
         value = editor.date().toString("dd-MM-yyyy")
@@ -303,20 +696,41 @@ class CSVEditorDialog(QDialog):
         self.tooltips = {}
         self.current_sort_column = -1
         self.current_sort_order = Qt.AscendingOrder
-        self.initial_data = None
+        self.sort_criteria = []
+        self.table_name = os.path.basename(csv_file)
+        self.saved = False
         self.clipboard = QApplication.clipboard()
+        # Jurnalul modificărilor: undo/redo și starea „modificat” fără a compara tabelul
+        self.undoStack = QUndoStack(self)
+        self.undoStack.cleanChanged.connect(self.onCleanChanged)
         self.initUI()
         self.loadCSV()
 
     def initUI(self):
-        self.setWindowTitle(f'Editare {os.path.basename(self.csv_file)}')
+        self.setWindowTitle(f'Editare {os.path.basename(self.csv_file)}[*]')
         
-        settings = QSettings('MyCompany', 'ReminderApp')
-        geometry = settings.value(f'{os.path.basename(self.csv_file)}_geometry', QRect(100, 100, 800, 600))
-        self.setGeometry(geometry)
+        self.setGeometry(self.savedGeometry())
 
         layout = QVBoxLayout()
 
+        # Bara de filtrare; filtrele pe coloane se adaugă în setupFilterBar, după antet
+        self.filterLayout = QHBoxLayout()
+        self.filterEdit = QLineEdit()
+        self.filterEdit.setPlaceholderText('Caută în eveniment și observații (Ctrl+F)')
+        self.filterEdit.setClearButtonEnabled(True)
+        self.filterLayout.addWidget(self.filterEdit, 1)
+        self.filterStatusLabel = QLabel()
+        self.filterLayout.addWidget(self.filterStatusLabel)
+        layout.addLayout(self.filterLayout)
+
+        self.filterTimer = QTimer(self)
+        self.filterTimer.setSingleShot(True)
+        self.filterTimer.setInterval(200)
+        self.filterTimer.timeout.connect(self.applyFilter)
+        self.filterEdit.textChanged.connect(self.filterTimer.start)
+        self.dateFilterCheck = None
+        self.filterCombos = {}
+
         self.table = QTableView()
         self.table.setSortingEnabled(True)
         self.table.horizontalHeader().sectionClicked.connect(self.onHeaderClicked)
@@ -363,48 +777,36 @@ class CSVEditorDialog(QDialog):
 
         QShortcut(QKeySequence.Copy, self, self.copySelection)
         QShortcut(QKeySequence.Paste, self, self.pasteSelection)
+        QShortcut(QKeySequence.Find, self, self.focusFilter)
+        QShortcut(QKeySequence.Undo, self, self.undoStack.undo)
+        redo_keys = {QKeySequence('Ctrl+Y').toString(), QKeySequence(QKeySequence.Redo).toString()}
+        for key in redo_keys:
+            QShortcut(QKeySequence(key), self, self.undoStack.redo)
 
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.showContextMenu)
 
-        print("Inițializare UI completă")
+        logger.debug("Inițializare UI completă")
 
     def loadCSV(self):
-        print(f"Încărcare CSV: {self.csv_file}")
+        logger.debug("Încărcare CSV: %s", self.csv_file)
         try:
-            if not os.path.exists(self.csv_file):
-                print(f"Fișierul {self.csv_file} nu există. Se creează un fișier gol.")
-                self.createEmptyCSV(self.csv_file)
-            
-            df = pd.read_csv(self.csv_file, encoding='utf-8')
-            print(f"Date încărcate din {self.csv_file}:")
-            print(df.head())
-            print(f"Tipuri de date: {df.dtypes}")
-            
-            headers = df.columns.tolist()
-            data = df.values.tolist()
-
-            for row in data:
-                for i, value in enumerate(row):
-                    if isinstance(value, pd.Timestamp):
-                        row[i] = value.strftime('%d-%m-%Y')
-                    elif pd.isna(value):
-                        row[i] = ''
-                    elif isinstance(value, bool):
-                        row[i] = str(value)
-
-            if self.csv_file.endswith('sarbatori.csv'):
-                for row in data:
-                    luna_index = headers.index('luna')
-                    row[luna_index] = convert_luna(row[luna_index])
-                if 'sarbatoare_cruce_rosie' not in headers:
-                    headers.append('sarbatoare_cruce_rosie')
-                    for row in data:
-                        row.append('')
-                print("Coloane în sarbatori.csv:", headers)
-
-            self.model = CustomTableModel(data, headers)
-            self.table.setModel(self.model)
+            # Datele vin din depozitul aplicației, deja citite și normalizate
+            # Prima bucată se afișează imediat; restul se convertește pe un fir separat
+            headers, chunks = self.parent.repository.bucati_editor(self.table_name)
+            data, ids = next(chunks, ([], []))
+            logger.debug("Prima bucată din %s: %s rânduri, coloane: %s", self.csv_file, len(data), headers)
+
+            self.model = CustomTableModel(data, headers, ids)
+            self.model.loadInBackground(chunks)
+            self.proxy = FilterProxyModel(self)
+            self.proxy.setSourceModel(self.model)
+            for signal in (self.proxy.rowsInserted, self.proxy.rowsRemoved, self.proxy.layoutChanged, self.proxy.modelReset):
+                signal.connect(self.updateFilterStatus)
+            self.table.setModel(self.proxy)
+            self.model.setUndoStack(self.undoStack)
+            self.undoStack.clear()
+            self.setupFilterBar(headers)
 
             self.column_widths = self.parent.settings.get(f'{os.path.basename(self.csv_file)}_column_widths', {})
             
@@ -425,30 +827,79 @@ class CSVEditorDialog(QDialog):
                     self.table.horizontalHeader().setDefaultAlignment(Qt.AlignCenter)
 
             self.setupDelegates(headers)
-            self.initial_data = [row[:] for row in self.model._data]  # Copie profundă a datelor inițiale
             
-            print("Finalizare încărcare CSV și setare delegați")
+            logger.debug("Finalizare încărcare CSV și setare delegați")
         except Exception as e:
             error_msg = f"Eroare la încărcarea {self.csv_file}: {str(e)}\n{traceback.format_exc()}"
-            print(error_msg)
+            logger.error(error_msg)
             self.parent.log_error(error_msg)
             QMessageBox.critical(self, "Eroare", f"Nu s-a putut încărca fișierul {self.csv_file}. Se va crea un fișier gol.")
             self.createEmptyCSV(self.csv_file)
 
     def createEmptyCSV(self, filename):
-        headers = []
-        if filename == 'informatii.csv':
-            headers = ['eveniment', 'data', 'avanszile', 'ciclu', 'weekend', 'rosu', 'stare', 'serviciu', 'observatii', 'data_notificare']
-        elif filename == 'aniversari.csv':
-            headers = ['eveniment', 'data', 'avanszile', 'ciclu', 'rosu', 'stare', 'observatii', 'data_notificare']
-        elif filename == 'sarbatori.csv':
-            headers = ['eveniment', 'ziua', 'luna', 'avanszile', 'rosu', 'tip', 'sarbatoare_cruce_rosie', 'observatii', 'data_notificare']
-        df = pd.DataFrame(columns=headers)
-        df.to_csv(filename, index=False, encoding='utf-8')
+        reminder_storage.creeaza_csv_gol(filename)
+
+    def setupFilterBar(self, headers):
+        if 'data' in headers:
+            self.dateFilterCheck = QCheckBox('Data între')
+            self.dateFromEdit = QDateEdit(QDate.currentDate())
+            self.dateToEdit = QDateEdit(QDate.currentDate().addYears(1))
+            self.filterLayout.insertWidget(self.filterLayout.count() - 1, self.dateFilterCheck)
+            for date_edit in (self.dateFromEdit, self.dateToEdit):
+                date_edit.setCalendarPopup(True)
+                date_edit.setDisplayFormat("dd-MM-yyyy")
+                date_edit.dateChanged.connect(self.filterTimer.start)
+                self.filterLayout.insertWidget(self.filterLayout.count() - 1, date_edit)
+            self.dateFilterCheck.toggled.connect(self.filterTimer.start)
+
+        for column, options in (('stare', ['pastreaza', 'indeplinit']), ('serviciu', ['True', 'False']),
+                                ('ciclu', OPTIUNI_CICLU)):
+            if column not in headers:
+                continue
+            combo = QComboBox()
+            combo.addItem(f'{column}: toate', None)
+            for option in options:
+                combo.addItem(option or 'fără ciclu', option)
+            combo.currentIndexChanged.connect(self.filterTimer.start)
+            self.filterLayout.insertWidget(self.filterLayout.count() - 1, combo)
+            self.filterCombos[column] = combo
+
+    def focusFilter(self):
+        self.filterEdit.setFocus()
+        self.filterEdit.selectAll()
+
+    def applyFilter(self):
+        headers = self.model._headers
+        predicates = []
+        if self.dateFilterCheck is not None and self.dateFilterCheck.isChecked():
+            predicates.append((headers.index('data'),
+                               self.dateRangePredicate(self.dateFromEdit.date().toPyDate(), self.dateToEdit.date().toPyDate())))
+        for column, combo in self.filterCombos.items():
+            value = combo.currentData()
+            if value is not None:
+                predicates.append((headers.index(column), value.__eq__))
+        self.proxy.setFilter(self.filterEdit.text(), predicates)
+        self.updateFilterStatus()
+        logger.debug("Filtru aplicat: %s din %s rânduri", self.proxy.rowCount(), self.model.rowCount())
+
+    @staticmethod
+    def dateRangePredicate(start, end):
+        def accepts(value):
+            try:
+                return start <= datetime.strptime(value, '%d-%m-%Y').date() <= end
+            except ValueError:
+                return False
+        return accepts
+
+    def updateFilterStatus(self, *args):
+        if self.proxy.isFiltering():
+            self.filterStatusLabel.setText(f'{self.proxy.rowCount()} din {self.model.rowCount()} rânduri')
+        else:
+            self.filterStatusLabel.clear()
 
     def setupDelegates(self, headers):
-        print("Începe setarea delegaților...")
-        print(f"Headerele tabelului: {headers}")
+        logger.debug("Începe setarea delegaților...")
+        logger.debug("Headerele tabelului: %s", headers)
         
         self.tooltips = {}
         if 'avanszile' in headers:
@@ -466,35 +917,34 @@ class CSVEditorDialog(QDialog):
         
         if 'ciclu' in headers:
             ciclu_column = headers.index('ciclu')
-            ciclu_options = ['', 'lunar', 'anual'] + [f'la {i} {"luni" if i != 1 else "luna"}' for i in range(2, 12)] + [f'la {i} {"ani" if i != 1 else "an"}' for i in range(2, 11)]
-            ciclu_delegate = ComboBoxDelegate(self.table, ciclu_options)
+            ciclu_delegate = ComboBoxDelegate(self.table, OPTIUNI_CICLU)
             self.table.setItemDelegateForColumn(ciclu_column, ciclu_delegate)
-            print(f"Delegat setat pentru coloana Ciclu (index {ciclu_column})")
+            logger.debug("Delegat setat pentru coloana Ciclu (index %s)", ciclu_column)
         
         for bool_column in ['weekend', 'serviciu']:
             if bool_column in headers:
                 column_index = headers.index(bool_column)
                 bool_delegate = ComboBoxDelegate(self.table, ['True', 'False'])
                 self.table.setItemDelegateForColumn(column_index, bool_delegate)
-                print(f"Delegat setat pentru coloana {bool_column} (index {column_index})")
+                logger.debug("Delegat setat pentru coloana %s (index %s)", bool_column, column_index)
         
         if 'stare' in headers:
             stare_column = headers.index('stare')
             stare_delegate = ComboBoxDelegate(self.table, ['pastreaza', 'indeplinit'])
             self.table.setItemDelegateForColumn(stare_column, stare_delegate)
-            print(f"Delegat setat pentru coloana Stare (index {stare_column})")
+            logger.debug("Delegat setat pentru coloana Stare (index %s)", stare_column)
 
         if 'data' in headers:
             data_column = headers.index('data')
             data_delegate = DateDelegate(self)
             self.table.setItemDelegateForColumn(data_column, data_delegate)
-            print(f"Delegat setat pentru coloana Data (index {data_column})")
+            logger.debug("Delegat setat pentru coloana Data (index %s)", data_column)
 
         if 'luna' in headers:
             luna_column = headers.index('luna')
             luna_delegate = ComboBoxDelegate(self.table, LUNI_RO)
             self.table.setItemDelegateForColumn(luna_column, luna_delegate)
-            print(f"Delegat setat pentru coloana Luna (index {luna_column})")
+            logger.debug("Delegat setat pentru coloana Luna (index %s)", luna_column)
 
         if 'tip' in headers:
             tip_column = headers.index('tip')
@@ -510,114 +960,117 @@ class CSVEditorDialog(QDialog):
             ]
             tip_delegate = ComboBoxDelegate(self.table, tip_options)
             self.table.setItemDelegateForColumn(tip_column, tip_delegate)
-            print(f"Delegat setat pentru coloana Tip (index {tip_column})")
+            logger.debug("Delegat setat pentru coloana Tip (index %s)", tip_column)
 
         if 'sarbatoare_cruce_rosie' in headers:
             cruce_rosie_column = headers.index('sarbatoare_cruce_rosie')
             cruce_rosie_options = ['', 'sărbătoare cu cruce roșie']
             cruce_rosie_delegate = ComboBoxDelegate(self.table, cruce_rosie_options)
             self.table.setItemDelegateForColumn(cruce_rosie_column, cruce_rosie_delegate)
-            print(f"Delegat setat pentru coloana Sărbătoare cu cruce roșie (index {cruce_rosie_column})")
+            logger.debug("Delegat setat pentru coloana Sărbătoare cu cruce roșie (index %s)", cruce_rosie_column)
 
         for col, header in enumerate(headers):
             if header not in ['ciclu', 'weekend', 'serviciu', 'stare', 'data', 'luna', 'tip', 'sarbatoare_cruce_rosie']:
                 self.table.setItemDelegateForColumn(col, QStyledItemDelegate(self.table))
-                print(f"Delegat implicit setat pentru coloana {header} (index {col})")
+                logger.debug("Delegat implicit setat pentru coloana %s (index %s)", header, col)
 
-        print("Finalizarea setării delegaților")
+        logger.debug("Finalizarea setării delegaților")
 
     def addRow(self):
-        print("Începe adăugarea unui rând nou")
+        logger.debug("Începe adăugarea unui rând nou")
+        self.model.fetchAll()
         
         # Obținem numărul curent de rânduri, care va fi poziția noului rând
         rowPosition = self.model.rowCount()
-        print(f"Poziția noului rând: {rowPosition}")
+        logger.debug("Poziția noului rând: %s", rowPosition)
+
+        new_row = self.defaultRow()
+
+        if 'data_notificare' in self.model._headers:
+            data_notificare_column = self.model._headers.index('data_notificare')
+            self.tooltips[data_notificare_column] = "Data calculată automat când începe notificarea pentru acest eveniment"
+
+        # Adăugăm noul rând la datele modelului
+        self.undoStack.push(InsertRowsCommand(self.model, rowPosition, [new_row]))
+        logger.debug("Rând nou adăugat la datele modelului")
+
+        logger.debug("Rând nou adăugat cu succes la poziția %s", rowPosition)
 
+    def defaultRow(self):
+        """Un rând nou, cu valorile implicite ale fiecărei coloane."""
         # Creăm un nou rând gol cu numărul corect de coloane
         new_row = [''] * self.model.columnCount()
-        print(f"Rând nou creat cu {len(new_row)} coloane")
+        logger.debug("Rând nou creat cu %s coloane", len(new_row))
 
         # Obținem headerele pentru a putea seta valori implicite corecte
         headers = self.model._headers
-        print(f"Headerele tabelului: {headers}")
+        logger.debug("Headerele tabelului: %s", headers)
 
         # Setăm valori implicite pentru fiecare coloană relevantă
         if 'data' in headers:
             data_column = headers.index('data')
             new_row[data_column] = datetime.now().strftime("%d-%m-%Y")
-            print(f"Data implicită setată: {new_row[data_column]}")
+            logger.debug("Data implicită setată: %s", new_row[data_column])
 
         if 'ziua' in headers:
             ziua_column = headers.index('ziua')
             new_row[ziua_column] = str(datetime.now().day)
-            print(f"Ziua implicită setată: {new_row[ziua_column]}")
+            logger.debug("Ziua implicită setată: %s", new_row[ziua_column])
 
         if 'luna' in headers:
             luna_column = headers.index('luna')
             new_row[luna_column] = LUNI_RO[datetime.now().month - 1]
-            print(f"Luna implicită setată: {new_row[luna_column]}")
+            logger.debug("Luna implicită setată: %s", new_row[luna_column])
 
         if 'avanszile' in headers:
             avanszile_column = headers.index('avanszile')
             new_row[avanszile_column] = '0'
-            print("Avanszile implicit setat la 0")
+            logger.debug("Avanszile implicit setat la 0")
 
         if 'ciclu' in headers:
             ciclu_column = headers.index('ciclu')
             new_row[ciclu_column] = ''
-            print("Ciclu implicit setat la gol")
+            logger.debug("Ciclu implicit setat la gol")
 
         if 'weekend' in headers:
             weekend_column = headers.index('weekend')
             new_row[weekend_column] = 'False'
-            print("Weekend implicit setat la False")
+            logger.debug("Weekend implicit setat la False")
 
         if 'rosu' in headers:
             rosu_column = headers.index('rosu')
             new_row[rosu_column] = '0'
-            print("Rosu implicit setat la 0")
+            logger.debug("Rosu implicit setat la 0")
 
         if 'stare' in headers:
             stare_column = headers.index('stare')
             new_row[stare_column] = 'pastreaza'
-            print("Stare implicită setată la 'pastreaza'")
+            logger.debug("Stare implicită setată la 'pastreaza'")
 
         if 'serviciu' in headers:
             serviciu_column = headers.index('serviciu')
             new_row[serviciu_column] = 'False'
-            print("Serviciu implicit setat la False")
+            logger.debug("Serviciu implicit setat la False")
 
         if 'observatii' in headers:
             observatii_column = headers.index('observatii')
             new_row[observatii_column] = ''
-            print("Observații implicite setate la gol")
+            logger.debug("Observații implicite setate la gol")
 
         if 'tip' in headers:
             tip_column = headers.index('tip')
             new_row[tip_column] = ''
-            print("Tip implicit setat la gol")
+            logger.debug("Tip implicit setat la gol")
 
         if 'sarbatoare_cruce_rosie' in headers:
             cruce_rosie_column = headers.index('sarbatoare_cruce_rosie')
             new_row[cruce_rosie_column] = ''
-            print("Sărbătoare cu cruce roșie implicită setată la gol")
+            logger.debug("Sărbătoare cu cruce roșie implicită setată la gol")
 
-        if 'data_notificare' in headers:
-            data_notificare_column = headers.index('data_notificare')
-            self.tooltips[data_notificare_column] = "Data calculată automat când începe notificarea pentru acest eveniment"
-
-        # Adăugăm noul rând la datele modelului
-        self.model._data.append(new_row)
-        print(f"Rând nou adăugat la datele modelului")
-
-        # Notificăm modelul că layout-ul s-a schimbat
-        self.model.layoutChanged.emit()
-        print("Notificare emisă pentru schimbarea layout-ului modelului")
-
-        print(f"Rând nou adăugat cu succes la poziția {rowPosition}")
+        return new_row
 
     def deleteRow(self):
-        selectedRows = set(index.row() for index in self.table.selectionModel().selectedIndexes())
+        selectedRows = self.selectedRows()
         if not selectedRows:
             QMessageBox.warning(self, "Avertisment", "Vă rugăm să selectați cel puțin un rând pentru ștergere.")
             return
@@ -627,38 +1080,48 @@ class CSVEditorDialog(QDialog):
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if reply == QMessageBox.Yes:
-            for row in sorted(selectedRows, reverse=True):
-                self.model.removeRow(row)
-            self.model._data = [row for i, row in enumerate(self.model._data) if i not in selectedRows]
-            self.model.layoutChanged.emit()
-            print(f"Rânduri șterse: {selectedRows}")
+            self.undoStack.push(RemoveRowsCommand(self.model, selectedRows))
+            logger.info("Rânduri șterse: %s", selectedRows)
         else:
-            print("Ștergerea rândurilor a fost anulată de utilizator.")
+            logger.debug("Ștergerea rândurilor a fost anulată de utilizator.")
 
     def saveCSV(self):
-        print("Începe salvarea CSV...")
-        headers = self.model._headers
-        data = self.model._data
-        
-        df = pd.DataFrame(data, columns=headers)
-        
-        if 'data' in df.columns:
-            df['data'] = pd.to_datetime(df['data'], format='%d-%m-%Y', errors='coerce')
-            df['data'] = df['data'].dt.strftime('%d-%m-%Y')
-        
-        for bool_column in ['weekend', 'serviciu']:
-            if bool_column in df.columns:
-                df[bool_column] = df[bool_column].map({'True': True, 'False': False})
-        
-        df.to_csv(self.csv_file, index=False, encoding='utf-8')
-        print(f"Date salvate în fișierul {self.csv_file}")
+        logger.debug("Începe salvarea CSV...")
+        self.model.fetchAll()
+        repository = self.parent.repository
+        changed_rows = self.changedRows()
+        if changed_rows is not None and repository.actualizeaza_din_editor(
+                self.table_name, self.model._headers,
+                {self.model.rowId(row): self.model.rowValues(row) for row in changed_rows}):
+            logger.debug("Salvate doar rândurile modificate: %s", len(changed_rows))
+        else:
+            repository.inlocuieste_din_editor(self.table_name, self.model._headers, self.model.rows())
+            repository.flush(self.table_name)
+            self.model.resetRowIds()
+        self.undoStack.setClean()
+        self.saved = True
+        logger.info("Date salvate în fișierul %s", self.csv_file)
         QMessageBox.information(self, "Succes", "Datele au fost salvate cu succes!")
 
+    def savedGeometry(self):
+        cheie = f'{os.path.basename(self.csv_file)}_geometry'
+        geometrie = self.parent.settings.get(cheie)
+        if geometrie is None:
+            # Geometria salvată de versiunile vechi în QSettings se preia o singură dată
+            vechi = QSettings('MyCompany', 'ReminderApp').value(cheie)
+            if isinstance(vechi, QRect) and vechi.isValid():
+                geometrie = [vechi.x(), vechi.y(), vechi.width(), vechi.height()]
+        try:
+            return QRect(*map(int, geometrie))
+        except (TypeError, ValueError):
+            return QRect(100, 100, 800, 600)
+
     def onColumnResized(self, column, oldWidth, newWidth):
         self.column_widths[str(column)] = newWidth
         self.parent.settings[f'{os.path.basename(self.csv_file)}_column_widths'] = self.column_widths
+        # Scrierea se amână până se oprește redimensionarea
         self.parent.saveSettings()
-        print(f"Coloana {column} redimensionată de la {oldWidth} la {newWidth}")
+        logger.debug("Coloana %s redimensionată de la %s la %s", column, oldWidth, newWidth)
 
     def closeEvent(self, event):
         if self.isDataModified():
@@ -677,100 +1140,133 @@ class CSVEditorDialog(QDialog):
             event.accept()
 
         if event.isAccepted():
-            settings = QSettings('MyCompany', 'ReminderApp')
-            settings.setValue(f'{os.path.basename(self.csv_file)}_geometry', self.geometry())
+            geometrie = self.geometry()
+            self.parent.settings[f'{os.path.basename(self.csv_file)}_geometry'] = [
+                geometrie.x(), geometrie.y(), geometrie.width(), geometrie.height()]
             self.parent.settings[f'{os.path.basename(self.csv_file)}_column_widths'] = self.column_widths
             self.parent.saveSettings()
         
-        print("Fereastra de editare CSV închisă")
+        logger.debug("Fereastra de editare CSV închisă")
 
     def onHeaderClicked(self, logicalIndex):
-        print(f"Header clicked pentru coloana {logicalIndex}")
-        if self.current_sort_column == logicalIndex:
-            self.current_sort_order = Qt.DescendingOrder if self.current_sort_order == Qt.AscendingOrder else Qt.AscendingOrder
+        logger.debug("Header clicked pentru coloana %s", logicalIndex)
+        if QApplication.keyboardModifiers() & Qt.ShiftModifier and self.sort_criteria:
+            # Shift+clic adaugă o coloană secundară sau îi inversează ordinea
+            columns = [column for column, _ in self.sort_criteria]
+            if logicalIndex in columns:
+                position = columns.index(logicalIndex)
+                column, order = self.sort_criteria[position]
+                self.sort_criteria[position] = (column, Qt.DescendingOrder if order == Qt.AscendingOrder else Qt.AscendingOrder)
+            else:
+                self.sort_criteria.append((logicalIndex, Qt.AscendingOrder))
+            self.current_sort_column, self.current_sort_order = self.sort_criteria[0]
+            self.model.sortBy(self.sort_criteria)
         else:
-            self.current_sort_column = logicalIndex
-            self.current_sort_order = Qt.AscendingOrder
-        
-        print(f"Noua stare: Coloana {self.current_sort_column}, Ordine {self.current_sort_order}")
-        
-        self.model.sort(self.current_sort_column, self.current_sort_order)
+            if self.current_sort_column == logicalIndex:
+                self.current_sort_order = Qt.DescendingOrder if self.current_sort_order == Qt.AscendingOrder else Qt.AscendingOrder
+            else:
+                self.current_sort_column = logicalIndex
+                self.current_sort_order = Qt.AscendingOrder
+            self.sort_criteria = [(self.current_sort_column, self.current_sort_order)]
+            self.model.sort(self.current_sort_column, self.current_sort_order)
+
+        logger.debug("Noua stare: criterii de sortare %s", self.sort_criteria)
         self.table.horizontalHeader().setSortIndicator(self.current_sort_column, self.current_sort_order)
-        
-        self.table.reset()
-        
-        print("Reapplicăm delegații după sortare")
-        self.setupDelegates(self.model._headers)
-        
+        # Sortarea mută indecșii persistenți: selecția, celula curentă, derularea și delegații rămân
         self.checkModelViewConsistency()
 
     def checkModelViewConsistency(self):
-        print("Verificăm consistența între model și view:")
-        for row in range(min(5, self.model.rowCount())):
+        # Verificarea citește celule din model și din view; o facem doar la nivelul DEBUG
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Verificăm consistența între model și view:")
+        for row in range(min(5, self.proxy.rowCount())):
             for col in range(self.model.columnCount()):
-                model_data = self.model._data[row][col]
+                model_data = self.model._store.value(self.proxy.mapToSource(self.proxy.index(row, col)).row(), col)
                 view_data = self.table.model().data(self.table.model().index(row, col), Qt.DisplayRole)
-                print(f"Rândul {row}, Coloana {col}: Model: {model_data}, View: {view_data}")
+                logger.debug("Rândul %s, Coloana %s: Model: %s, View: %s", row, col, model_data, view_data)
                 if str(model_data) != str(view_data):
-                    print(f"Atenție: Neconcordanță la rândul {row}, coloana {col}")
-        print(f"Ordinea curentă de sortare a modelului: {self.model._sort_order}")
+                    logger.warning("Atenție: Neconcordanță la rândul %s, coloana %s", row, col)
+        logger.debug("Ordinea curentă de sortare a modelului: %s", self.model._sort_order)
+
+    def onCleanChanged(self, clean):
+        self.setWindowModified(not clean)
 
     def isDataModified(self):
-        current_data = self.model._data
-        if len(current_data) != len(self.initial_data):
-            return True
-        for current_row, initial_row in zip(current_data, self.initial_data):
-            if current_row != initial_row:
-                return True
-        return False
+        return not self.undoStack.isClean()
+
+    def changedRows(self):
+        """
+        Pozițiile rândurilor editate de la ultima salvare, din comenzile dintre starea
+        salvată și cea curentă. None dacă s-au adăugat, șters sau mutat rânduri.
+        """
+        clean_index, current_index = self.undoStack.cleanIndex(), self.undoStack.index()
+        if clean_index < 0:
+            return None
+        rows = set()
+        for i in range(min(clean_index, current_index), max(clean_index, current_index)):
+            command_rows = self.undoStack.command(i).changedRows()
+            if command_rows is None:
+                return None
+            rows |= command_rows
+        if any(self.model.rowId(row) is None for row in rows):
+            return None
+        return rows
 
     def sortChronologically(self):
         headers = self.model._headers
-        data = self.model._data
 
         if 'data' in headers:
-            date_column = headers.index('data')
-            data.sort(key=lambda x: self.model.getSortKeyForDate(x[date_column]))
+            self.model.sortBy([(headers.index('data'), Qt.AscendingOrder)])
         elif 'ziua' in headers and 'luna' in headers:
-            day_column = headers.index('ziua')
-            month_column = headers.index('luna')
-            data.sort(key=lambda x: (LUNI_RO.index(x[month_column]), int(x[day_column])))
+            self.model.sortBy([(headers.index('luna'), Qt.AscendingOrder), (headers.index('ziua'), Qt.AscendingOrder)])
         else:
             QMessageBox.warning(self, "Avertisment", "Nu s-a putut determina coloana de dată pentru sortare.")
             return
 
-        self.model.updateData(data)
         QMessageBox.information(self, "Succes", "Datele au fost sortate cronologic.")
 
+    def selectedRows(self):
+        """Rândurile modelului selectate în view, citite din intervalele selecției (nu celulă cu celulă)."""
+        rows = set()
+        for selection_range in self.table.selectionModel().selection():
+            proxy_rows = range(selection_range.top(), selection_range.bottom() + 1)
+            if self.proxy.isFiltering():
+                rows.update(self.proxy.mapToSource(self.proxy.index(row, 0)).row() for row in proxy_rows)
+            else:
+                # Fără filtru proxy-ul păstrează ordinea modelului, deci rândurile coincid
+                rows.update(proxy_rows)
+        return rows
+
+    def selectSourceRows(self, rows):
+        if self.proxy.isFiltering():
+            rows = {self.proxy.mapFromSource(self.model.index(row, 0)).row() for row in rows} - {-1}
+        selection = QItemSelection()
+        last_column = self.model.columnCount() - 1
+        for start, count in intervale(rows):
+            selection.select(self.proxy.index(start, 0), self.proxy.index(start + count - 1, last_column))
+        self.table.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
+
     def moveRowUp(self):
-        selected_rows = sorted(set(index.row() for index in self.table.selectedIndexes()))
-        if not selected_rows or selected_rows[0] == 0:
+        selected_rows = self.selectedRows()
+        if not selected_rows or min(selected_rows) == 0:
             return
-
-        for row in selected_rows:
-            self.model._data[row-1], self.model._data[row] = self.model._data[row], self.model._data[row-1]
-
-        self.model.layoutChanged.emit()
-        new_selection = QItemSelection()
-        for row in selected_rows:
-            new_selection.select(self.model.index(row-1, 0), self.model.index(row-1, self.model.columnCount()-1))
-        self.table.selectionModel().select(new_selection, QItemSelectionModel.ClearAndSelect)
-        self.table.scrollTo(self.model.index(selected_rows[0]-1, 0))
+        self.moveSelectedRows(selected_rows, -1)
+        self.table.scrollTo(self.proxy.mapFromSource(self.model.index(min(selected_rows) - 1, 0)))
 
     def moveRowDown(self):
-        selected_rows = sorted(set(index.row() for index in self.table.selectedIndexes()), reverse=True)
-        if not selected_rows or selected_rows[-1] == self.model.rowCount() - 1:
+        selected_rows = self.selectedRows()
+        if not selected_rows or max(selected_rows) == self.model.rowCount() - 1:
             return
+        self.moveSelectedRows(selected_rows, 1)
+        self.table.scrollTo(self.proxy.mapFromSource(self.model.index(max(selected_rows) + 1, 0)))
 
-        for row in selected_rows:
-            self.model._data[row], self.model._data[row+1] = self.model._data[row+1], self.model._data[row]
-
-        self.model.layoutChanged.emit()
-        new_selection = QItemSelection()
-        for row in selected_rows:
-            new_selection.select(self.model.index(row+1, 0), self.model.index(row+1, self.model.columnCount()-1))
-        self.table.selectionModel().select(new_selection, QItemSelectionModel.ClearAndSelect)
-        self.table.scrollTo(self.model.index(selected_rows[-1]+1, 0))
+    def moveSelectedRows(self, rows, step):
+        # Selecția se golește înainte de mutare: altfel Qt ar urmări fiecare celulă selectată
+        # ca index persistent. După mutare se reselectează aceleași intervale, deplasate.
+        self.table.selectionModel().clearSelection()
+        self.undoStack.push(MoveRowsCommand(self.model, rows, step))
+        self.selectSourceRows({row + step for row in rows})
 
     def showContextMenu(self, position):
         menu = QMenu()
@@ -783,41 +1279,63 @@ class CSVEditorDialog(QDialog):
         elif action == pasteAction:
             self.pasteSelection()
 
+    def selectedBlock(self):
+        """Rândurile (ale modelului, în ordinea din view) și coloanele acoperite de selecție."""
+        proxy_rows, columns = set(), set()
+        for selection_range in self.table.selectionModel().selection():
+            proxy_rows.update(range(selection_range.top(), selection_range.bottom() + 1))
+            columns.update(range(selection_range.left(), selection_range.right() + 1))
+        proxy_rows = sorted(proxy_rows)
+        if self.proxy.isFiltering():
+            rows = [self.proxy.mapToSource(self.proxy.index(row, 0)).row() for row in proxy_rows]
+        else:
+            rows = proxy_rows
+        return rows, sorted(columns)
+
     def copySelection(self):
-        selection = self.table.selectedIndexes()
-        if not selection:
+        rows, columns = self.selectedBlock()
+        if not rows:
             return
 
-        rows = sorted(set(index.row() for index in selection))
-        cols = sorted(set(index.column() for index in selection))
-
-        data = []
-        for row in rows:
-            row_data = []
-            for col in cols:
-                item = self.model.data(self.model.index(row, col), Qt.DisplayRole)
-                row_data.append(str(item))
-            data.append('\t'.join(row_data))
-
-        text = '\n'.join(data)
-        self.clipboard.setText(text)
+        block = self.model.copyBlock(rows, columns)
+        mime_data = QMimeData()
+        mime_data.setText(scrie_bloc_tsv(block))
+        mime_data.setHtml(scrie_bloc_html(block))
+        self.clipboard.setMimeData(mime_data)
+        logger.debug("Copiate %s rânduri x %s coloane", len(rows), len(columns))
 
     def pasteSelection(self):
-        selection = self.table.selectedIndexes()
-        if not selection:
+        selection = self.table.selectionModel().selection()
+        if selection.isEmpty():
+            return
+        block = citeste_bloc(self.clipboard.text())
+        if not block:
             return
 
-        clipboard_text = self.clipboard.text()
-        rows = clipboard_text.split('\n')
-        paste_data = [row.split('\t') for row in rows]
-
-        top_left = selection[0]
-        for i, row_data in enumerate(paste_data):
-            for j, value in enumerate(row_data):
-                row = top_left.row() + i
-                col = top_left.column() + j
-                if row < self.model.rowCount() and col < self.model.columnCount():
-                    self.model.setData(self.model.index(row, col), value, Qt.EditRole)
+        # Lipirea începe din colțul stânga-sus al selecției și continuă pe rândurile vizibile
+        # (după filtru); ce trece de ultimul rând se adaugă ca rânduri noi, cu valorile implicite
+        top = min(selection_range.top() for selection_range in selection)
+        left = min(selection_range.left() for selection_range in selection)
+        # Rândurile încă neîncărcate se aduc înainte de a număra rândurile vizibile,
+        # altfel lipirea ar adăuga rânduri noi peste cele existente în fișier
+        if top + len(block) > self.proxy.rowCount():
+            self.model.fetchAll()
+        visible_rows = range(top, min(top + len(block), self.proxy.rowCount()))
+        if self.proxy.isFiltering():
+            target_rows = [self.proxy.mapToSource(self.proxy.index(row, 0)).row() for row in visible_rows]
+        else:
+            target_rows = list(visible_rows)
+        column_types = [reminder_storage.schema(self.table_name).get(header, 'text') for header in self.model._headers]
+        changes, new_rows, errors = self.model.preparePaste(
+            target_rows, left, block, column_types, [self.defaultRow() for _ in range(len(block) - len(target_rows))])
+
+        if changes or new_rows:
+            self.undoStack.push(PasteCommand(self.model, changes, new_rows))
+            logger.info("Lipite %s celule modificate și %s rânduri noi", len(changes), len(new_rows))
+        if errors:
+            details = '\n'.join(f"linia {row + 1}, {header}: '{value}'" for row, header, value in errors[:10])
+            QMessageBox.warning(self, "Avertisment",
+                                f"{len(errors)} valori nu au formatul coloanei și nu au fost lipite:\n{details}")
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_C and event.modifiers() & Qt.ControlModifier:
@@ -988,6 +1506,15 @@ class SettingsDialog(QDialog):
         self.showHolidaysCheckBox.stateChanged.connect(self.onShowHolidaysChanged)
         layout.addWidget(self.showHolidaysCheckBox)
 
+        storageLayout = QHBoxLayout()
+        storageLayout.addWidget(QLabel('Stocare date:'))
+        self.storageComboBox = QComboBox()
+        self.storageComboBox.addItem('Fișiere CSV', 'csv')
+        self.storageComboBox.addItem('Bază de date SQLite', 'sqlite')
+        self.storageComboBox.setCurrentIndex(max(0, self.storageComboBox.findData(self.parent.settings.get('storage_backend', 'csv'))))
+        storageLayout.addWidget(self.storageComboBox)
+        layout.addLayout(storageLayout)
+
         self.saveButton = QPushButton('Salvează Setările')
         self.saveButton.clicked.connect(self.saveSettings)
         layout.addWidget(self.saveButton)
@@ -1013,12 +1540,12 @@ class SettingsDialog(QDialog):
         return layout
 
     def onVisibilityChanged(self, index):
-        print(f"Schimbare index vizibilitate: {index}")
+        logger.debug("Schimbare index vizibilitate: %s", index)
         self.parent.settings['visibility_index'] = index
         self.parent.checkEvents()
 
     def onUseWorkScheduleChanged(self, state):
-        print(f"Schimbare stare Utilizează program de lucru: {state}")
+        logger.debug("Schimbare stare Utilizează program de lucru: %s", state)
         self.parent.settings['use_work_schedule'] = (state == Qt.Checked)
         self.parent.updateServiceVisibilityState()
         self.parent.checkEvents()
@@ -1033,7 +1560,7 @@ class SettingsDialog(QDialog):
         self.parent.checkEvents()
 
     def saveSettings(self):
-        print("Salvare setări")
+        logger.debug("Salvare setări")
         self.parent.settings['eventNameFont'] = self.eventNameFont.itemAt(1).widget().value()
         self.parent.settings['serviceEventFont'] = self.serviceEventFont.itemAt(1).widget().value()
         self.parent.settings['dateFont'] = self.dateFont.itemAt(1).widget().value()
@@ -1047,6 +1574,7 @@ class SettingsDialog(QDialog):
         self.parent.settings['visibility_index'] = self.visibilityComboBox.currentIndex()
         self.parent.settings['use_work_schedule'] = self.useWorkScheduleCheckBox.isChecked()
         self.parent.settings['show_commemorations'] = self.showHolidaysCheckBox.isChecked()
+        self.parent.changeStorageBackend(self.storageComboBox.currentData())
         self.parent.saveSettings()
         self.parent.updateServiceVisibilityState()
         self.parent.checkEvents()
@@ -1055,13 +1583,210 @@ class SettingsDialog(QDialog):
         self.parent.updateMainButtonsFont(self.parent.settings['mainButtonsFontSize'])
         self.parent.adjustAllButtonHeights()
         self.close()
-        print("Setări salvate și aplicate")
+        logger.debug("Setări salvate și aplicate")
+
+FISIER_NOTIFICARE = {'event': 'informatii.csv', 'anniversary': 'aniversari.csv', 'holiday': 'sarbatori.csv'}
+
+
+def cheie_notificare(notification):
+    """Cheia unei notificări pe panou: (fișier, rând, data apariției)."""
+    if len(notification) > 8 and notification[8] == 'event':
+        return FISIER_NOTIFICARE['event'], notification[7], notification[1]
+    if len(notification) > 6 and notification[6] == 'anniversary':
+        return FISIER_NOTIFICARE['anniversary'], notification[5], notification[1]
+    return FISIER_NOTIFICARE['holiday'], notification[4], notification[1]
+
+
+def este_gol(valoare):
+    """None sau NaN (câmp lipsă), fără pd.isna: panoul se poate desena înainte de încărcarea pandas."""
+    return valoare is None or (isinstance(valoare, float) and valoare != valoare)
+
+
+def _aceeasi_notificare(a, b):
+    """Compară două tupluri de notificare, cu NaN egal cu NaN (observații lipsă)."""
+    return len(a) == len(b) and all(
+        x == y or (isinstance(x, float) and isinstance(y, float) and x != x and y != y)
+        for x, y in zip(a, b))
+
+
+class NotificationModel(QAbstractListModel):
+    """
+    Notificările afișate pe panoul principal. Textul HTML al unui rând se construiește
+    prin `formatter` doar când rândul este cerut de view și se păstrează până la reîmprospătare.
+    """
+    def __init__(self, formatter, parent=None):
+        super().__init__(parent)
+        self.formatter = formatter
+        self.notifications = []
+        self._html = []
+        self._keys = []
+
+    def setNotifications(self, notifications):
+        self.beginResetModel()
+        self.notifications = list(notifications)
+        self._html = [None] * len(self.notifications)
+        self._keys = [cheie_notificare(n) for n in self.notifications]
+        self.endResetModel()
+
+    def updateNotifications(self, notifications):
+        """
+        Aplică doar diferențele față de lista afișată, după cheia (fișier, rând, data apariției):
+        rândurile dispărute se șterg, cele noi se inserează, iar cele rămase se actualizează doar
+        dacă s-a schimbat ceva afișat. Poziția de scroll se păstrează.
+        Întoarce (inserate, șterse, actualizate).
+        """
+        notifications = list(notifications)
+        new_keys = [cheie_notificare(n) for n in notifications]
+        new_key_set = set(new_keys)
+        old_count = len(self._keys)
+
+        # Ștergeri, de jos în sus, pe intervale contigue
+        removed = 0
+        row = len(self._keys) - 1
+        while row >= 0:
+            if self._keys[row] in new_key_set:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._keys[row] not in new_key_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self.notifications[row + 1:last + 1]
+            del self._html[row + 1:last + 1]
+            del self._keys[row + 1:last + 1]
+            self.endRemoveRows()
+            removed += last - row
+
+        # Rândurile rămase trebuie să fie în aceeași ordine ca în lista nouă; altfel reconstruim
+        remaining = set(self._keys)
+        if len(new_key_set) != len(new_keys) or [k for k in new_keys if k in remaining] != self._keys:
+            self.setNotifications(notifications)
+            return len(notifications), old_count, 0
+
+        # Inserări, pe intervale contigue
+        inserted = 0
+        row = 0
+        while row < len(new_keys):
+            if row < len(self._keys) and self._keys[row] == new_keys[row]:
+                row += 1
+                continue
+            first = row
+            while row < len(new_keys) and new_keys[row] not in remaining:
+                row += 1
+            self.beginInsertRows(QModelIndex(), first, row - 1)
+            self.notifications[first:first] = notifications[first:row]
+            self._html[first:first] = [None] * (row - first)
+            self._keys[first:first] = new_keys[first:row]
+            self.endInsertRows()
+            inserted += row - first
+
+        # Actualizări, semnalate pe intervale contigue
+        updated = 0
+        first = None
+        for row, notification in enumerate(notifications + [None]):
+            changed = False
+            if notification is not None and self.notifications[row] is not notification:
+                old, old_html = self.notifications[row], self._html[row]
+                self.notifications[row] = notification
+                changed = not _aceeasi_notificare(old, notification)
+                if old_html is not None:
+                    self._html[row] = self.formatter(notification) or ''
+                    changed = changed or self._html[row] != old_html
+            if changed:
+                updated += 1
+                if first is None:
+                    first = row
+            elif first is not None:
+                self.dataChanged.emit(self.index(first), self.index(row - 1))
+                first = None
+
+        return inserted, removed, updated
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.notifications)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+        row = index.row()
+        notification = self.notifications[row]
+        if role == Qt.DisplayRole:
+            if self._html[row] is None:
+                self._html[row] = self.formatter(notification) or ''
+            return self._html[row]
+        if role == Qt.ToolTipRole:
+            # Observațiile sunt ultimul câmp la toate tipurile de notificări
+            observatii = notification[-1]
+            if observatii and not este_gol(observatii):
+                return str(observatii)
+        if role == Qt.UserRole:
+            return notification
+        return QVariant()
+
+
+class NotificationDelegate(QStyledItemDelegate):
+    """
+    Desenează o notificare ca vechile etichete de pe panou: fundal #f0f0f0, chenar #dcdcdc,
+    padding 15px, text HTML centrat, înălțime minimă 120px. Documentele se refolosesc
+    cât timp lățimea listei nu se schimbă.
+    """
+    PADDING = 16  # 15px padding + 1px chenar
+    MIN_HEIGHT = 120
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._documents = {}
+        self._width = None
+
+    def _document(self, html, width, font):
+        if width != self._width or len(self._documents) > 2000:
+            self._documents.clear()
+            self._width = width
+        document = self._documents.get(html)
+        if document is None:
+            document = QTextDocument()
+            document.setDocumentMargin(0)
+            document.setDefaultFont(font)
+            option = QTextOption(Qt.AlignCenter)
+            option.setWrapMode(QTextOption.WordWrap)
+            document.setDefaultTextOption(option)
+            document.setHtml(html)
+            document.setTextWidth(width)
+            self._documents[html] = document
+        return document
+
+    def _textWidth(self, option):
+        view = self.parent()
+        width = view.viewport().width() - 2 * view.spacing() if view is not None else option.rect.width()
+        return max(1, width - 2 * self.PADDING)
+
+    def sizeHint(self, option, index):
+        document = self._document(index.data(Qt.DisplayRole), self._textWidth(option), option.font)
+        height = int(document.size().height()) + 2 * self.PADDING
+        return QSize(self._textWidth(option) + 2 * self.PADDING, max(self.MIN_HEIGHT, height))
+
+    def paint(self, painter, option, index):
+        rect = option.rect
+        document = self._document(index.data(Qt.DisplayRole), self._textWidth(option), option.font)
+        painter.save()
+        painter.setPen(QColor('#dcdcdc'))
+        painter.setBrush(QColor('#f0f0f0'))
+        painter.drawRect(rect.adjusted(0, 0, -1, -1))
+        top = rect.top() + max(self.PADDING, (rect.height() - document.size().height()) / 2)
+        painter.translate(rect.left() + self.PADDING, top)
+        document.drawContents(painter)
+        painter.restore()
+
 
 class ReminderApp(QWidget):
     def __init__(self):
         super().__init__()
         self.is_initial_startup = True
-        self.settings = {}
+        # Etapele pornirii (secunde de la începutul importurilor), raportate la sfârșitul delayedInit
+        self.startupTimes = {'importuri': MOMENT_IMPORTURI}
+        self.initPending = True
+        self.loadSettings()
+        self.startupTimes['setări'] = time.perf_counter()
         self.serviceVisibilityButton = None
         self.tray_icon = None
         self.openHolidaysButton = None
@@ -1069,63 +1794,125 @@ class ReminderApp(QWidget):
         self.openEventsButton = None
         self.openAnniversariesButton = None
         self.settingsButton = None
-        QTimer.singleShot(1000, self.delayedInit)
-        print(f"După __init__ - Poziție: X={self.pos().x()}, Y={self.pos().y()}")
+        self.calendar = None
+        self.repository = None
+        self.scheduler = NotificationScheduler()
+        self.wakeTimer = None
+        self.categoryNotifications = {}
+        self.lastCheckDate = None
+        self.fileWatcher = None
+        self.fileWatchTimer = None
+        self.history = None
+        self.snapshot = NotificationSnapshot()
+        self.pendingSnapshot = None
+        self.initShell()
+        logger.debug("După __init__ - Poziție: X=%s, Y=%s", self.pos().x(), self.pos().y())
 
     def moveEvent(self, event):
         super().moveEvent(event)
         # Prevenim pozițiile Y negative și logăm încercări de poziționare negativă
         if self.pos().y() < 0:
-            print(f"Încercare de poziționare negativă detectată: X={self.pos().x()}, Y={self.pos().y()}")
-            print(f"Dimensiune decorațiuni fereastră: {self.frameGeometry().height() - self.geometry().height()}")
+            logger.warning("Încercare de poziționare negativă detectată: X=%s, Y=%s", self.pos().x(), self.pos().y())
+            logger.warning("Dimensiune decorațiuni fereastră: %s", self.frameGeometry().height() - self.geometry().height())
             self.move(self.pos().x(), 1)
 
+    def initShell(self):
+        """Fereastra goală, cu titlul și geometria salvate, afișată înainte de încărcarea datelor."""
+        self.setWindowTitle('Program de Reamintire Evenimente și Aniversări')
+        self.setWindowFlags(self.windowFlags() | Qt.Tool)
+        self.setGeometry(self.settings.get('x', 300), 1,
+                         self.settings.get('width', 900), self.settings.get('height', 700))
+        self.loadingLabel = QLabel('Se încarcă...', self)
+        self.loadingLabel.setAlignment(Qt.AlignCenter)
+        self.loadingLabel.resize(self.size())
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.initPending:
+            # Datele se încarcă abia după ce fereastra a fost desenată o dată
+            self.initPending = False
+            self.startupTimes['prima afișare'] = time.perf_counter()
+            QTimer.singleShot(0, self.delayedInit)
+
+    def reportStartupTimes(self):
+        moment_anterior = MOMENT_PORNIRE
+        etape = []
+        for etapa, moment in self.startupTimes.items():
+            etape.append(f"{etapa} {(moment - moment_anterior) * 1000:.0f} ms")
+            moment_anterior = moment
+        logger.info("Pornire: %s (total %.0f ms)", ', '.join(etape), (moment_anterior - MOMENT_PORNIRE) * 1000)
+
     def delayedInit(self):
         try:
-            print(f"Început delayedInit - Poziție: X={self.pos().x()}, Y={self.pos().y()}")
-            self.loadSettings()
-            print(f"După loadSettings - Poziție: X={self.pos().x()}, Y={self.pos().y()}")
+            logger.debug("Început delayedInit - Poziție: X=%s, Y=%s", self.pos().x(), self.pos().y())
+            self.loadingLabel.deleteLater()
+            QApplication.instance().aboutToQuit.connect(self.settings.scrie_acum)
+            self.history = HistoryWriter('log.txt', self.settings.get('history_max_bytes', 1048576))
+            QApplication.instance().aboutToQuit.connect(self.history.inchide)
+            logger.debug("După loadSettings - Poziție: X=%s, Y=%s", self.pos().x(), self.pos().y())
             
             self.createEmptyCSVIfNotExists()
-            print(f"Înainte de initUI - Poziție: X={self.pos().x()}, Y={self.pos().y()}")
+            self.createRepository()
+            logger.debug("Înainte de initUI - Poziție: X=%s, Y=%s", self.pos().x(), self.pos().y())
             self.initUI()
-            print(f"După initUI - Poziție: X={self.pos().x()}, Y={self.pos().y()}")
+            logger.debug("După initUI - Poziție: X=%s, Y=%s", self.pos().x(), self.pos().y())
             
             # Verificăm și geometria ferestrei
             frameGeom = self.frameGeometry()
-            print(f"Detalii fereastră:")
-            print(f"Geometrie cadru - X={frameGeom.x()}, Y={frameGeom.y()}, Height={frameGeom.height()}")
-            print(f"Dimensiune cadru decorațiuni: {self.frameGeometry().height() - self.geometry().height()}")
-            print(f"Înălțime totală disponibilă ecran: {QDesktopWidget().availableGeometry().height()}")
+            logger.debug("Detalii fereastră:")
+            logger.debug("Geometrie cadru - X=%s, Y=%s, Height=%s", frameGeom.x(), frameGeom.y(), frameGeom.height())
+            logger.debug("Dimensiune cadru decorațiuni: %s", self.frameGeometry().height() - self.geometry().height())
+            logger.debug("Înălțime totală disponibilă ecran: %s", QDesktopWidget().availableGeometry().height())
             
-            self.loadData()
+            # Un singur timer, armat de checkEvents pentru următorul moment în care se schimbă ceva
+            self.wakeTimer = QTimer(self)
+            self.wakeTimer.setSingleShot(True)
+            self.wakeTimer.setTimerType(Qt.PreciseTimer)
+            self.wakeTimer.timeout.connect(self.onScheduledWakeup)
+
             self.updateServiceVisibilityState()
             self.set_tooltip_style(self.settings.get('tooltipFontSize', 12))
-            self.checkEvents()
-            
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.checkEvents)
-            self.timer.start(21600000)
-            
+            self.showSnapshot()
+
             self.setupTrayIcon()
-            print(f"Înainte de restoreWindowState - Poziție: X={self.pos().x()}, Y={self.pos().y()}")
+            logger.debug("Înainte de restoreWindowState - Poziție: X=%s, Y=%s", self.pos().x(), self.pos().y())
             self.restoreWindowState()
-            print(f"După restoreWindowState - Poziție: X={self.pos().x()}, Y={self.pos().y()}")
+            logger.debug("După restoreWindowState - Poziție: X=%s, Y=%s", self.pos().x(), self.pos().y())
             
             self.show()
-            print(f"După show - Poziție: X={self.pos().x()}, Y={self.pos().y()}")
-            
-            print("ReminderApp inițializat cu succes")
+            logger.debug("După show - Poziție: X=%s, Y=%s", self.pos().x(), self.pos().y())
+
+            self.startupTimes['panou'] = time.perf_counter()
+            # Datele se încarcă după ce panoul (eventual din instantaneu) a fost desenat
+            QTimer.singleShot(0, self.finishStartup)
         except Exception as e:
-            error_msg = f"Eroare în inițializarea ReminderApp: {str(e)}\n{traceback.format_exc()}"
-            print(error_msg)
-            self.log_error(error_msg)
-            QMessageBox.critical(self, "Eroare de Inițializare", f"Eroare în inițializarea ReminderApp: {str(e)}\nVerificați error_log.txt pentru detalii.")
+            self.reportInitError(e)
+
+    def finishStartup(self):
+        try:
+            self.loadData()
+            if self.pendingSnapshot is not None and self.pendingSnapshot[0] == self.snapshotFingerprint():
+                self.applySnapshot(self.pendingSnapshot[1])
+            else:
+                self.checkEvents()
+            self.pendingSnapshot = None
+
+            logger.info("ReminderApp inițializat cu succes")
+            self.startupTimes['încărcare'] = time.perf_counter()
+            self.reportStartupTimes()
+        except Exception as e:
+            self.reportInitError(e)
+
+    def reportInitError(self, e):
+        error_msg = f"Eroare în inițializarea ReminderApp: {str(e)}\n{traceback.format_exc()}"
+        logger.error(error_msg)
+        self.log_error(error_msg)
+        QMessageBox.critical(self, "Eroare de Inițializare", f"Eroare în inițializarea ReminderApp: {str(e)}\nVerificați error_log.txt pentru detalii.")
 
     def mouseReleaseEvent(self, event):
         super().mouseReleaseEvent(event)
         # Logăm poziția doar când utilizatorul termină de mutat fereastra
-        print(f"Poziție după mutare: X={self.pos().x()}, Y={self.pos().y()}")            
+        logger.debug("Poziție după mutare: X=%s, Y=%s", self.pos().x(), self.pos().y())
 
     def log_error(self, error_msg):
         try:
@@ -1133,7 +1920,7 @@ class ReminderApp(QWidget):
             with open(log_path, 'a', encoding='utf-8') as f:
                 f.write(f"{datetime.now()}: {error_msg}\n\n")
         except Exception as e:
-            print(f"Eroare la scrierea în fișierul de log: {e}")
+            logger.error("Eroare la scrierea în fișierul de log: %s", e)
             QMessageBox.warning(self, "Avertisment", f"Nu s-a putut scrie în fișierul de log: {e}")
 
     def createEmptyCSVIfNotExists(self):
@@ -1143,20 +1930,11 @@ class ReminderApp(QWidget):
                 self.createEmptyCSV(file)
 
     def createEmptyCSV(self, filename):
-        headers = []
-        if filename == 'informatii.csv':
-            headers = ['eveniment', 'data', 'avanszile', 'ciclu', 'weekend', 'rosu', 'stare', 'serviciu', 'observatii']
-        elif filename == 'aniversari.csv':
-            headers = ['eveniment', 'data', 'avanszile', 'ciclu', 'rosu', 'stare', 'observatii']
-        elif filename == 'sarbatori.csv':
-            headers = ['eveniment', 'ziua', 'luna', 'avanszile', 'rosu', 'tip', 'sarbatoare_cruce_rosie', 'observatii']
-        df = pd.DataFrame(columns=headers)
-        df.to_csv(filename, index=False, encoding='utf-8')
-        print(f"Fișier CSV gol creat: {filename}")
+        reminder_storage.creeaza_csv_gol(filename)
+        logger.info("Fișier CSV gol creat: %s", filename)
 
     def initUI(self):
-        print("Inițializare UI ReminderApp")
-        self.setWindowTitle('Program de Reamintire Evenimente și Aniversări')
+        logger.debug("Inițializare UI ReminderApp")
         
         # Obținem înălțimea decorațiunilor ferestrei
         decoration_height = self.frameGeometry().height() - self.geometry().height()
@@ -1168,18 +1946,31 @@ class ReminderApp(QWidget):
             self.settings.get('width', 900),
             self.settings.get('height', 700)
         )
-        self.setWindowFlags(self.windowFlags() | Qt.Tool)
 
         layout = QVBoxLayout()
         layout.setAlignment(Qt.AlignCenter)
         layout.setSpacing(self.settings.get('buttonSpacing', 2))
 
-        self.scrollArea = QScrollArea()
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollContents = QWidget()
-        self.scrollLayout = QVBoxLayout(self.scrollContents)
-        self.scrollArea.setWidget(self.scrollContents)
-        layout.addWidget(self.scrollArea)
+        # Lista de notificări: un singur view, rândurile se desenează doar când sunt vizibile
+        self.notificationModel = NotificationModel(self.notificationHtml, self)
+        self.notificationView = QListView()
+        self.notificationView.setModel(self.notificationModel)
+        self.notificationView.setItemDelegate(NotificationDelegate(self.notificationView))
+        self.notificationView.setSpacing(3)
+        self.notificationView.setResizeMode(QListView.Adjust)
+        self.notificationView.setLayoutMode(QListView.Batched)
+        self.notificationView.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.notificationView.setSelectionMode(QAbstractItemView.NoSelection)
+        self.notificationView.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.notificationView.setMouseTracking(True)
+        self.notificationView.clicked.connect(self.onNotificationClicked)
+        layout.addWidget(self.notificationView)
+
+        self.emptyNotificationsLabel = QLabel('Niciun eveniment, aniversare sau sărbătoare de notificat')
+        self.emptyNotificationsLabel.setFont(QFont('Arial', 18))
+        self.emptyNotificationsLabel.setAlignment(Qt.AlignCenter)
+        self.emptyNotificationsLabel.hide()
+        layout.addWidget(self.emptyNotificationsLabel)
 
         self.mainButtonsFont = QFont('Arial', self.settings.get('mainButtonsFontSize', 14))
 
@@ -1205,7 +1996,7 @@ class ReminderApp(QWidget):
 
         self.setLayout(layout)
         self.updateHolidaysButtonVisibility()
-        print("UI ReminderApp inițializat")
+        logger.debug("UI ReminderApp inițializat")
 
     def createMainButton(self, text, onClickFunction):
         button = QPushButton(text)
@@ -1241,22 +2032,16 @@ class ReminderApp(QWidget):
             main_layout.setSpacing(self.settings.get('buttonSpacing', 2))
 
     def loadSettings(self):
-        print("Încărcare setări")
-        try:
-            with open('window_settings.json', 'r', encoding='utf-8') as f:
-                self.settings = json.load(f)
-            # Forțăm Y să fie 1, indiferent de valoarea salvată
-            self.settings['y'] = 1
-            print("Setări încărcate cu succes")
-        except (FileNotFoundError, json.JSONDecodeError):
-            print("Nu s-au găsit setări sau fișierul este corupt. Se folosesc setările implicite.")
-            self.settings = DEFAULT_SETTINGS.copy()
+        logger.debug("Încărcare setări")
+        self.settings = SettingsStore.incarca('window_settings.json', DEFAULT_SETTINGS, creeaza_timer_setari)
+        # Forțăm Y să fie 1, indiferent de valoarea salvată
+        self.settings['y'] = 1
         
         # Asigurăm-ne că avem setarea pentru commemorationTypeFont
         self.settings['commemorationTypeFont'] = self.settings.get('commemorationTypeFont', 14)
 
     def saveSettings(self):
-        print("Salvare setări")
+        """Actualizează setările din memorie; fișierul se scrie amânat, doar dacă s-a schimbat ceva."""
         self.settings.update({
             'x': self.pos().x(),
             'y': 1,  # Forțăm salvarea lui Y ca 1
@@ -1265,9 +2050,6 @@ class ReminderApp(QWidget):
             'maximized': self.isMaximized(),
             'service_visibility': self.serviceVisibilityButton.text() if self.serviceVisibilityButton else 'Evenimente serviciu vizibile'
         })
-        with open('window_settings.json', 'w', encoding='utf-8') as f:
-            json.dump(self.settings, f, ensure_ascii=False, indent=4)
-        print("Setări salvate cu succes")
 
     def restoreWindowState(self):
         # Obținem înălțimea decorațiunilor ferestrei (bara de titlu + margini)
@@ -1295,69 +2077,129 @@ class ReminderApp(QWidget):
         self.saveSettings()
 
     def openSettings(self):
-        print("Deschidere dialog setări")
+        logger.debug("Deschidere dialog setări")
         settingsDialog = SettingsDialog(self)
         settingsDialog.visibilityComboBox.setCurrentIndex(self.settings.get('visibility_index', 0))
         settingsDialog.exec_()
 
+    def createRepository(self, importa_din_csv=False):
+        """
+        Creează depozitul de date cu stocarea aleasă în setări ('csv' sau 'sqlite').
+        La prima folosire a bazei SQLite tabelele goale se importă din fișierele CSV existente;
+        cu `importa_din_csv` (trecerea de pe CSV pe SQLite) se reimportă toate, ca baza să nu
+        rămână cu datele de la ultima folosire.
+        """
+        if self.settings.get('storage_backend', 'csv') == 'sqlite':
+            backend = reminder_storage.SQLiteBackend(self.settings.get('sqlite_path', 'reminder.db'))
+            for filename in reminder_storage.FISIERE:
+                if (importa_din_csv or backend.este_gol(filename)) and os.path.exists(filename):
+                    backend.importa_csv(filename, filename)
+                    logger.info("%s importat în %s", filename, backend.cale_db)
+        else:
+            backend = reminder_storage.CSVBackend()
+        self.repository = reminder_storage.DataRepository(
+            backend, self.settings.get('pandas_min_bytes', reminder_storage.PRAG_PANDAS))
+        self.categoryNotifications = {}
+        logger.info("Stocare date: %s", self.settings.get('storage_backend', 'csv'))
+        self.setupFileWatcher()
+
+    def setupFileWatcher(self):
+        """
+        Urmărește fișierele CSV (și directorul lor, pentru înlocuirile atomice) ca să preia
+        modificările făcute din afara aplicației. Cu stocarea SQLite nu se urmărește nimic.
+        """
+        if self.fileWatcher is None:
+            self.fileWatcher = QFileSystemWatcher(self)
+            self.fileWatcher.directoryChanged.connect(self.onDataFilesChanged)
+            self.fileWatcher.fileChanged.connect(self.onDataFilesChanged)
+            # O salvare produce o rafală de evenimente (scriere, redenumire); le adunăm într-una
+            self.fileWatchTimer = QTimer(self)
+            self.fileWatchTimer.setSingleShot(True)
+            self.fileWatchTimer.timeout.connect(self.reloadChangedFiles)
+
+        urmarite = self.fileWatcher.files() + self.fileWatcher.directories()
+        if urmarite:
+            self.fileWatcher.removePaths(urmarite)
+        backend = self.repository.backend
+        if not isinstance(backend, reminder_storage.CSVBackend):
+            return
+        self.fileWatcher.addPath(os.path.abspath(backend.director or os.getcwd()))
+        self.watchDataFiles()
+
+    def watchDataFiles(self):
+        """(Re)adaugă fișierele în watcher; după os.replace fișierul nou nu mai este urmărit."""
+        urmarite = set(self.fileWatcher.files())
+        for filename in reminder_storage.FISIERE:
+            cale = os.path.abspath(self.repository.backend.cale(filename))
+            if cale not in urmarite and os.path.exists(cale):
+                self.fileWatcher.addPath(cale)
+
+    def onDataFilesChanged(self, path):
+        self.fileWatchTimer.start(500)
+
+    def reloadChangedFiles(self):
+        """Reîncarcă doar fișierele schimbate pe disc și recalculează doar categoriile lor."""
+        self.watchDataFiles()
+        modificate = self.repository.modificate_extern()
+        if not modificate:
+            return
+        logger.info("Fișiere modificate extern: %s", ', '.join(modificate))
+        for filename in modificate:
+            self.loadCSV(filename)
+        self.checkEvents(modificate)
+
+    def changeStorageBackend(self, storage_backend):
+        """
+        Trece datele pe noua stocare: la revenirea pe CSV fișierele se exportă din baza SQLite,
+        iar la trecerea pe SQLite baza se reîncarcă din fișierele CSV.
+        """
+        if storage_backend == self.settings.get('storage_backend', 'csv'):
+            return
+        self.repository.flush()
+        backend_vechi = self.repository.backend
+        if isinstance(backend_vechi, reminder_storage.SQLiteBackend):
+            for filename in reminder_storage.FISIERE:
+                backend_vechi.exporta_csv(filename, filename)
+            backend_vechi.inchide()
+        self.settings['storage_backend'] = storage_backend
+        self.createRepository(importa_din_csv=(storage_backend == 'sqlite'))
+        self.loadData()
+
     def loadData(self):
-        print("Încărcare date")
-        self.loadCSV('informatii.csv')
-        self.loadCSV('aniversari.csv')
-        self.loadCSV('sarbatori.csv')
+        logger.debug("Încărcare date")
+        for filename in reminder_storage.FISIERE:
+            self.loadCSV(filename)
 
     def loadCSV(self, filename):
-        print(f"Încărcare CSV: {filename}")
+        """
+        Citește fișierul o singură dată în depozitul de date (self.repository),
+        cu tipurile normalizate după schema din reminder_storage.
+        """
+        logger.debug("Încărcare CSV: %s", filename)
         try:
-            if not os.path.exists(filename):
-                self.createEmptyCSV(filename)
-                return
-            
-            df = pd.read_csv(filename, encoding='utf-8')
-            
-            if filename != 'sarbatori.csv' and 'data' in df.columns:
-                # Convertim data în format corect și salvăm înapoi în CSV
-                df['data'] = pd.to_datetime(df['data'], format='%d-%m-%Y', errors='coerce')
-                df['data'] = df['data'].dt.strftime('%d-%m-%Y')
-                df.to_csv(filename, index=False, encoding='utf-8')
-            
-            if 'ciclu' in df.columns:
-                df['ciclu'] = df['ciclu'].fillna('').astype(str)
-            
-            for col in ['weekend', 'serviciu']:
-                if col in df.columns:
-                    df[col] = df[col].fillna(False).astype(bool)
-            
-            if 'avanszile' in df.columns:
-                df['avanszile'] = df['avanszile'].fillna(0).astype(int)
-
-            if 'rosu' in df.columns:
-                df['rosu'] = df['rosu'].fillna(0).astype(int)
-            
-            if 'stare' in df.columns:
-                df['stare'] = df['stare'].fillna('pastreaza').astype(str)
-            
-            df.to_csv(filename, index=False, encoding='utf-8')
-            print(f"Date procesate și salvate în {filename}")
+            tabel = self.repository.incarca(filename)
+            logger.debug("Date încărcate din %s: %s rânduri", filename, len(tabel))
         except Exception as e:
             error_msg = f"Eroare la încărcarea {filename}: {str(e)}\n{traceback.format_exc()}"
-            print(error_msg)
+            logger.error(error_msg)
             self.log_error(error_msg)
             self.createEmptyCSV(filename)
+            self.repository.incarca(filename)
 
     def openCSVEditor(self, filename):
-        print(f"Deschidere editor CSV pentru {filename}")
+        logger.debug("Deschidere editor CSV pentru %s", filename)
         file_path = os.path.join(os.getcwd(), filename)
-        if os.path.exists(file_path):
+        if self.repository.exista(filename):
             editor = CSVEditorDialog(file_path, self)
             editor.exec_()
-            self.loadData()
-            self.checkEvents()
+            if editor.saved:
+                # Tabelul salvat de editor este deja în depozitul de date; se recalculează doar categoria lui
+                self.checkEvents([filename])
         else:
             QMessageBox.warning(self, 'Eroare', f'Fișierul {filename} nu a fost găsit.')
 
     def updateServiceVisibilityState(self):
-        print("Actualizare stare vizibilitate evenimente de serviciu")
+        logger.debug("Actualizare stare vizibilitate evenimente de serviciu")
         if self.settings.get('use_work_schedule', True):
             current_time = QTime.currentTime()
             current_day = ['Luni', 'Marți', 'Miercuri', 'Joi', 'Vineri', 'Sâmbătă', 'Duminică'][datetime.now().weekday()]
@@ -1380,11 +2222,16 @@ class ReminderApp(QWidget):
             # Dacă programul de lucru nu este utilizat, păstrăm ultima stare cunoscută
             self.serviceVisibilityButton.setText(self.settings.get('service_visibility', 'Evenimente serviciu vizibile'))
         
-        print(f"Stare actualizată: {self.settings['service_visibility']}")
+        logger.debug("Stare actualizată: %s", self.settings['service_visibility'])
         self.saveSettings()
 
+        momente = []
+        if self.settings.get('use_work_schedule', True):
+            momente = momente_program_lucru(self.settings.get('work_schedule', {}))
+        self.scheduler.inlocuieste('program', momente, 'program de lucru')
+
     def toggleServiceVisibility(self):
-        print("Comutare vizibilitate evenimente de serviciu")
+        logger.debug("Comutare vizibilitate evenimente de serviciu")
         if self.serviceVisibilityButton.text() == 'Evenimente serviciu vizibile':
             self.serviceVisibilityButton.setText('Evenimente serviciu ascunse')
             self.settings['service_visibility'] = 'Evenimente serviciu ascunse'
@@ -1393,224 +2240,166 @@ class ReminderApp(QWidget):
             self.settings['service_visibility'] = 'Evenimente serviciu vizibile'
         self.saveSettings()
         self.checkEvents()
-        print(f"Stare actualizată: {self.settings['service_visibility']}")
+        logger.debug("Stare actualizată: %s", self.settings['service_visibility'])
 
-    def checkEvents(self):
-        print("Verificare evenimente")
+    def checkEvents(self, categorii=None):
+        """
+        Recalculează notificările și reface panoul. Cu `categorii` (nume de fișiere) se
+        recalculează doar acele tabele, dacă ziua nu s-a schimbat de la ultima verificare;
+        pentru celelalte se refolosesc notificările deja calculate.
+        """
+        logger.debug("Verificare evenimente")
         try:
             moment_curent = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            evenimente_de_notificat = []
-            aniversari_de_notificat = []
-            sarbatori_de_notificat = []
-
-            print(f"Verificare evenimente pentru data: {moment_curent}")
-
-            arata_ascunse = self.settings.get('visibility_index', 0) == 0
-            arata_serviciu = self.settings['service_visibility'] == 'Evenimente serviciu vizibile'
-            arata_sarbatori = self.settings.get('show_commemorations', True)
-            
-            # Procesare evenimente din informatii.csv
-            tabel_evenimente = pd.read_csv('informatii.csv')
-            tabel_evenimente['data'] = pd.to_datetime(tabel_evenimente['data'], format='%d-%m-%Y', errors='coerce')
-            tabel_evenimente = tabel_evenimente.sort_values('data')
-
-            for index, eveniment in tabel_evenimente.iterrows():
-                try:
-                    data_eveniment = self.adjust_date_custom(eveniment['data'], moment_curent, str(eveniment['ciclu']))
-                    
-                    if pd.notnull(data_eveniment) and eveniment['ciclu'] and eveniment['stare'] == 'indeplinit':
-                        data_originala = eveniment['data']
-                        if data_eveniment.date() != data_originala.date():
-                            tabel_evenimente.loc[index, 'stare'] = 'pastreaza'
-                            tabel_evenimente['data'] = tabel_evenimente['data'].dt.strftime('%d-%m-%Y')
-                            tabel_evenimente.to_csv('informatii.csv', index=False)
-                    
-                    if pd.notnull(data_eveniment):
-                        # Calculăm data de notificare și o salvăm
-                        data_notificare = self.calculate_notification_date(data_eveniment, eveniment['avanszile'])
-                        tabel_evenimente.loc[index, 'data_notificare'] = data_notificare
-                        
-                        zile_pana_la_eveniment = (data_eveniment - moment_curent).days
-                        este_in_perioada_notificare = zile_pana_la_eveniment <= eveniment['avanszile']
-                        este_rosu = zile_pana_la_eveniment <= eveniment['rosu'] and eveniment['rosu'] > 0
-                        
-                        if (arata_serviciu or not eveniment['serviciu']) and (arata_ascunse or eveniment['stare'] != 'indeplinit'):
-                            if este_in_perioada_notificare:
-                                zile_weekend = self.count_weekend_days(moment_curent, data_eveniment) if eveniment['weekend'] else 0
-                                zile_lucratoare = max(0, zile_pana_la_eveniment + 1 - zile_weekend)
-                                evenimente_de_notificat.append((
-                                    eveniment['eveniment'],
-                                    data_eveniment,
-                                    zile_pana_la_eveniment,
-                                    zile_lucratoare,
-                                    zile_weekend,
-                                    eveniment['weekend'],
-                                    este_rosu,
-                                    index,
-                                    'event',
-                                    eveniment['ciclu'],
-                                    eveniment['serviciu'],
-                                    eveniment['observatii']
-                                ))
-                except Exception as e:
-                    print(f"Eroare la procesarea evenimentului: {str(e)}")
-
-            # Salvăm tabelul cu datele de notificare actualizate
-            tabel_evenimente['data'] = tabel_evenimente['data'].dt.strftime('%d-%m-%Y')
-            tabel_evenimente.to_csv('informatii.csv', index=False)
-
-            # Procesare aniversări din aniversari.csv
-            tabel_aniversari = pd.read_csv('aniversari.csv', parse_dates=['data'], date_format='%d-%m-%Y')
-            tabel_aniversari = tabel_aniversari.sort_values('data')
-
-            for index, aniversare in tabel_aniversari.iterrows():
-                try:
-                    data_nastere = aniversare['data']
-                    urmatoarea_aniversare = data_nastere.replace(year=moment_curent.year)
-                    if urmatoarea_aniversare < moment_curent:
-                        urmatoarea_aniversare = urmatoarea_aniversare.replace(year=moment_curent.year + 1)
-                    
-                    # Calculăm și salvăm data de notificare pentru aniversare
-                    data_notificare = self.calculate_notification_date(urmatoarea_aniversare, aniversare['avanszile'])
-                    tabel_aniversari.loc[index, 'data_notificare'] = data_notificare
-                    
-                    zile_pana_la_aniversare = (urmatoarea_aniversare - moment_curent).days
-                    este_in_perioada_notificare = zile_pana_la_aniversare <= aniversare['avanszile']
-                    este_rosu = zile_pana_la_aniversare <= aniversare.get('rosu', 0) and aniversare.get('rosu', 0) > 0
-                    
-                    if arata_ascunse or aniversare['stare'] != 'indeplinit':
-                        if este_in_perioada_notificare:
-                            varsta = urmatoarea_aniversare.year - data_nastere.year
-                            aniversari_de_notificat.append((
-                                aniversare['eveniment'],
-                                urmatoarea_aniversare,
-                                zile_pana_la_aniversare,
-                                varsta,
-                                este_rosu,
-                                index,
-                                'anniversary',
-                                aniversare.get('observatii', '')
-                            ))
-                            print(f"Aniversare de notificat: {aniversare['eveniment']}, Data: {urmatoarea_aniversare.strftime('%d-%m-%Y')}, Zile până la aniversare: {zile_pana_la_aniversare}, Vârsta: {varsta}, Este roșu: {este_rosu}")
-                except Exception as e:
-                    print(f"Eroare la procesarea aniversării: {str(e)}")
-
-            # Salvăm tabelul aniversărilor cu datele de notificare actualizate
-            tabel_aniversari['data'] = tabel_aniversari['data'].dt.strftime('%d-%m-%Y')
-            tabel_aniversari.to_csv('aniversari.csv', index=False)
-
-            # Procesare sărbători din sarbatori.csv
-            if arata_sarbatori:
-                print("Procesare sărbători:")
-                tabel_sarbatori = pd.read_csv('sarbatori.csv')
-                tabel_sarbatori = tabel_sarbatori.sort_values(['luna', 'ziua'])
-
-                for index, sarbatoare in tabel_sarbatori.iterrows():
-                    try:
-                        index_luna = LUNI_RO.index(sarbatoare['luna']) + 1
-                        data_sarbatoare = datetime(moment_curent.year, index_luna, sarbatoare['ziua'])
-                        if data_sarbatoare < moment_curent:
-                            data_sarbatoare = data_sarbatoare.replace(year=moment_curent.year + 1)
-                        
-                        # Calculăm și salvăm data de notificare pentru sărbătoare
-                        data_notificare = self.calculate_notification_date(data_sarbatoare, sarbatoare['avanszile'])
-                        tabel_sarbatori.loc[index, 'data_notificare'] = data_notificare
-                        
-                        zile_pana_la_sarbatoare = (data_sarbatoare - moment_curent).days
-                        este_in_perioada_notificare = zile_pana_la_sarbatoare <= sarbatoare['avanszile']
-                        este_rosu = zile_pana_la_sarbatoare <= sarbatoare.get('rosu', 0) and sarbatoare.get('rosu', 0) > 0
-                        
-                        if este_in_perioada_notificare:
-                            sarbatori_de_notificat.append((
-                                sarbatoare['eveniment'],
-                                data_sarbatoare,
-                                zile_pana_la_sarbatoare,
-                                este_rosu,
-                                index,
-                                'holiday',
-                                sarbatoare['tip'],
-                                sarbatoare['sarbatoare_cruce_rosie'],
-                                sarbatoare.get('observatii', '')
-                            ))
-                            print(f"Sărbătoare de notificat: {sarbatoare['eveniment']}, Data: {data_sarbatoare.strftime('%d-%m-%Y')}, Zile până la sărbătoare: {zile_pana_la_sarbatoare}, Este roșu: {este_rosu}, Tip: {sarbatoare['tip']}, Sărbătoare cu cruce roșie: {sarbatoare['sarbatoare_cruce_rosie']}")
-                    except Exception as e:
-                        print(f"Eroare la procesarea sărbătorii: {str(e)}")
-                        print(f"Rând problematic: {sarbatoare}")
-
-                # Salvăm tabelul sărbătorilor cu datele de notificare actualizate
-                tabel_sarbatori.to_csv('sarbatori.csv', index=False)
-            else:
-                print("Afișarea sărbătorilor este dezactivată.")
-
-            toate_notificarile = sarbatori_de_notificat + evenimente_de_notificat + aniversari_de_notificat
+            logger.info("Verificare evenimente pentru data: %s", moment_curent)
+            self.updateBusinessCalendar(moment_curent)
+
+            if not categorii or moment_curent != self.lastCheckDate:
+                categorii = reminder_storage.FISIERE
+            elif 'sarbatori.csv' in categorii:
+                # Sărbătorile cu cruce roșie intră în calendarul zilelor lucrătoare
+                categorii = set(categorii) | {'informatii.csv'}
+            toate_notificarile = self.computeNotifications(moment_curent, categorii)
+            self.lastCheckDate = moment_curent
             toate_notificarile.sort(key=lambda x: x[1])
 
-            if toate_notificarile:
-                self.showNotification(toate_notificarile)
-            else:
-                self.clearNotifications()
-                eticheta = QLabel('Niciun eveniment, aniversare sau sărbătoare de notificat')
-                eticheta.setFont(QFont('Arial', 18))
-                eticheta.setAlignment(Qt.AlignCenter)
-                self.scrollLayout.addWidget(eticheta)
+            self.showNotification(toate_notificarile)
+            self.scheduleAfterCheck(toate_notificarile)
+            self.saveSnapshot(moment_curent)
 
             return True
 
         except Exception as e:
             mesaj_eroare = f"Eroare în checkEvents: {str(e)}\n{traceback.format_exc()}"
-            print(mesaj_eroare)
+            logger.error(mesaj_eroare)
             self.log_error(mesaj_eroare)
             return False
 
-    def adjust_date_custom(self, event_date, now, ciclu):
-        print(f"Ajustare dată: event_date={event_date}, now={now}, ciclu={ciclu}")
-        if pd.isna(ciclu) or ciclu == '' or not isinstance(ciclu, str):
-            return event_date
-        
-        try:
-            if pd.isna(event_date):
-                return event_date
-                
-            if not isinstance(event_date, datetime):
-                try:
-                    event_date = pd.to_datetime(event_date)
-                except:
-                    return event_date
-            
-            if ciclu == 'lunar':
-                while event_date <= now:
-                    event_date = event_date + relativedelta(months=1)
-            elif ciclu == 'anual':
-                while event_date <= now:
-                    event_date = event_date + relativedelta(years=1)
-            elif ciclu.startswith('la '):
-                parts = ciclu.split()
-                if len(parts) == 3:
-                    number = int(parts[1])
-                    unit = parts[2]
-                    while event_date <= now:
-                        if unit in ['ani', 'an']:
-                            event_date = event_date + relativedelta(years=number)
-                        elif unit in ['luni', 'luna']:
-                            event_date = event_date + relativedelta(months=number)
-            
-            return event_date
-        except Exception as e:
-            print(f"Eroare la ajustarea datei pentru ciclul '{ciclu}': {str(e)}")
-            return event_date
+    def scheduleAfterCheck(self, toate_notificarile):
+        # Zilele rămase afișate se schimbă la miezul nopții; fără notificări
+        # ne trezim doar pentru momentele din date
+        self.scheduler.inlocuieste('zi', [urmatoarea_zi()] if toate_notificarile else [])
+        self.scheduleNextWakeup()
+
+    def snapshotFingerprint(self):
+        """Amprenta intrărilor calculului: fișierele de date (sau baza SQLite) și setările relevante."""
+        if self.settings.get('storage_backend', 'csv') == 'sqlite':
+            fisiere = [self.settings.get('sqlite_path', 'reminder.db')]
+        else:
+            fisiere = list(reminder_storage.FISIERE)
+        return amprenta(fisiere, self.settings)
 
-    def calculate_notification_date(self, event_date, avanszile):
+    def showSnapshot(self):
         """
-        Calculează data la care ar trebui să înceapă notificarea pentru un eveniment.
+        Desenează panoul din ultimul instantaneu, dacă este din aceeași zi și intrările nu s-au
+        schimbat; finishStartup îl folosește apoi în locul recalculării.
         """
-        if isinstance(event_date, str):
-            event_date = datetime.strptime(event_date, '%d-%m-%Y')
-        return (event_date - timedelta(days=avanszile)).strftime('%d-%m-%Y')
+        zi = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        amprenta_intrari = self.snapshotFingerprint()
+        instantaneu = self.snapshot.incarca(zi, amprenta_intrari)
+        if instantaneu is None:
+            return
+        calendar = instantaneu['calendar']
+        self.calendar = BusinessCalendar(calendar['masca'], calendar['sarbatori'])
+        # Aceeași ordine ca în computeNotifications (sortarea după dată este stabilă)
+        notificari = [n for nume in ('sarbatori.csv', 'informatii.csv', 'aniversari.csv')
+                      for n in instantaneu['notificari'].get(nume, [])]
+        notificari.sort(key=lambda x: x[1])
+        self.showNotification(notificari)
+        self.pendingSnapshot = (amprenta_intrari, instantaneu)
+        logger.info("Panou afișat din instantaneu: %s notificări", len(notificari))
+
+    def applySnapshot(self, instantaneu):
+        """Folosește instantaneul valid ca rezultat al primei verificări (notificări și momente de trezire)."""
+        self.categoryNotifications = dict(instantaneu['notificari'])
+        for nume, momente in instantaneu['momente'].items():
+            self.scheduler.inlocuieste(nume, momente)
+        self.lastCheckDate = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        self.scheduleAfterCheck([n for lista in self.categoryNotifications.values() for n in lista])
+
+    def saveSnapshot(self, moment_curent):
+        momente = {nume: self.scheduler.momente(nume) for nume in reminder_storage.FISIERE}
+        self.snapshot.salveaza(moment_curent, self.snapshotFingerprint(), self.categoryNotifications,
+                               momente, self.calendar)
+
+    def computeNotifications(self, moment_curent, categorii=reminder_storage.FISIERE):
+        """
+        Calculează notificările pentru fiecare tabel într-o singură trecere (vezi
+        reminder_engine.calculeaza_categorie), cu aceleași rezultate ca bucla inițială,
+        rând cu rând, care rămâne disponibilă prin use_vectorized_engine = false.
+        Se recalculează doar tabelele din `categorii`; celelalte vin din ultimul calcul.
+        """
+        for nume in reminder_storage.FISIERE:
+            if nume in categorii:
+                self.categoryNotifications[nume] = self.computeCategory(nume, moment_curent)
+
+        # Fiecare fișier se scrie cel mult o dată pe verificare, doar dacă s-a modificat
+        self.repository.flush()
+
+        evenimente_de_notificat = self.categoryNotifications.get('informatii.csv', [])
+        aniversari_de_notificat = self.categoryNotifications.get('aniversari.csv', [])
+        sarbatori_de_notificat = self.categoryNotifications.get('sarbatori.csv', [])
+        logger.info("Notificări calculate: %s evenimente, %s aniversări, %s sărbători",
+                    len(evenimente_de_notificat), len(aniversari_de_notificat), len(sarbatori_de_notificat))
+        return sarbatori_de_notificat + evenimente_de_notificat + aniversari_de_notificat
+
+    def computeCategory(self, nume, moment_curent):
+        """Notificările unui singur fișier de date; actualizează și coada de trezire pentru el."""
+        arata_ascunse = self.settings.get('visibility_index', 0) == 0
+        arata_serviciu = self.settings['service_visibility'] == 'Evenimente serviciu vizibile'
+        arata_sarbatori = self.settings.get('show_commemorations', True)
+
+        if nume == 'sarbatori.csv' and not arata_sarbatori:
+            self.scheduler.inlocuieste(nume, [])
+            logger.debug("Afișarea sărbătorilor este dezactivată.")
+            return []
+
+        if self.settings.get('use_vectorized_engine', True):
+            # Se calculează doar rândurile care pot fi scadente (la SQLite, printr-o interogare pe index)
+            tabel = self.repository.candidati_scadente(nume, moment_curent)
+            calculeaza = reminder_engine.calculeaza_categorie
+        else:
+            # Varianta de rezervă: bucla inițială, rând cu rând, pe tot tabelul
+            tabel = self.repository.tabel(nume)
+            calculeaza = reminder_engine.calculeaza_categorie_iterativ
+        sortat, calcul, notificari = calculeaza(nume, tabel, moment_curent, self.calendar, arata_ascunse, arata_serviciu)
+        self.repository.aplica_calcul(nume, calcul)
+        if nume == 'informatii.csv':
+            self.repository.seteaza_valori(nume, reminder_engine.randuri_de_resetat(calcul), 'stare', 'pastreaza')
+
+        self.scheduleCategory(nume, sortat, calcul, moment_curent)
+        return notificari
+
+    def scheduleCategory(self, nume, tabel, calcul, moment_curent):
+        """Înlocuiește în coada de trezire momentele care provin dintr-un singur fișier de date."""
+        if isinstance(calcul, list):
+            momente = reminder_engine.momente_de_interes_inregistrari(tabel, calcul, moment_curent)
+        else:
+            momente = reminder_engine.momente_de_interes(tabel, calcul, moment_curent)
+        scadenta = self.repository.urmatoarea_scadenta(nume, moment_curent)
+        if scadenta is not None:
+            momente.append(scadenta)
+        self.scheduler.inlocuieste(nume, momente)
+
+    def scheduleNextWakeup(self):
+        """Armează timerul pentru cel mai apropiat moment din coadă."""
+        if self.wakeTimer is None:
+            return
+        acum = datetime.now()
+        moment, motiv = self.scheduler.urmatorul(acum)
+        # Plafonăm la o zi: QTimer nu ține cont de suspendarea sistemului sau de schimbarea orei
+        interval = timedelta(days=1) if moment is None else min(moment - acum, timedelta(days=1))
+        self.wakeTimer.start(max(1000, int(interval.total_seconds() * 1000)))
+        logger.info("Următoarea verificare: %s (%s)", acum + interval, motiv or 'verificare zilnică')
+
+    def onScheduledWakeup(self):
+        self.updateServiceVisibilityState()
+        self.checkEvents()
 
-    def count_weekend_days(self, start_date, end_date):
-        weekend_days = sum(1 for day in pd.date_range(start_date, end_date) if day.dayofweek >= 5)
-        print(f"Zile de weekend între {start_date} și {end_date}: {weekend_days}")
-        return weekend_days
+    def updateBusinessCalendar(self, moment_curent):
+        """Reconstruiește calendarul zilelor lucrătoare din programul de lucru și sarbatori.csv."""
+        self.calendar = BusinessCalendar.from_settings(self.settings.get('work_schedule', {}),
+                                                       self.repository.tabel('sarbatori.csv'), moment_curent.year)
 
     def get_holiday_time_text(self, days_until_holiday):
         if days_until_holiday == 0:
@@ -1623,159 +2412,108 @@ class ReminderApp(QWidget):
             return f"peste {days_until_holiday} zile"
 
     def showNotification(self, notifications):
-        print(f"Afișare notificări: {len(notifications)} notificări")
-        self.clearNotifications()
+        logger.debug("Afișare notificări: %s notificări", len(notifications))
+        inserate, sterse, actualizate = self.notificationModel.updateNotifications(notifications)
+        logger.info("Panou actualizat: %s rânduri inserate, %s șterse, %s actualizate", inserate, sterse, actualizate)
+        self.notificationView.setVisible(bool(notifications))
+        self.emptyNotificationsLabel.setVisible(not notifications)
+        if notifications:
+            self.logNotifications(notifications)
+        logger.debug("Notificări afișate")
+
+    def clearNotifications(self):
+        logger.debug("Ștergere notificări existente")
+        self.notificationModel.setNotifications([])
 
+    def notificationHtml(self, notification):
+        """Textul HTML al unei notificări, desenat de NotificationDelegate."""
         zile_romanesti = ['Luni', 'Marți', 'Miercuri', 'Joi', 'Vineri', 'Sâmbătă', 'Duminică']
         luni_romanesti = ['ianuarie', 'februarie', 'martie', 'aprilie', 'mai', 'iunie', 'iulie', 'august', 'septembrie', 'octombrie', 'noiembrie', 'decembrie']
 
-        for notification in notifications:
-            try:
-                if len(notification) > 8 and notification[8] == 'event':  # Eveniment obișnuit
-                    event, date, days_until_event, workdays, weekend_days, consider_weekend, is_red, index, _, ciclu, is_service, observatii = notification
-                    event_label = QLabel()
-                
-                    event_text = f"<span style='font-size: {self.settings['eventNameFont']}px;'><b>{event}</b></span><br>"
-                    if is_service:
-                        event_text += f"<span style='color: blue; font-size: {self.settings['serviceEventFont']}px;'>[Eveniment de serviciu]</span><br>"
-                    event_text += f"<span style='font-size: {self.settings['dateFont']}px;'>Data limită: {zile_romanesti[date.weekday()]}, {date.day} {luni_romanesti[date.month-1]} {date.year}</span><br>"
-                
-                    deadline_text = obtine_mesaj_eveniment(datetime.now().date(), date.date(), consider_weekend)
-                    deadline_color = "red" if is_red else "orange"
-                    event_text += f"<span style='color: {deadline_color}; font-size: {self.settings['deadlineFont']}px;'>{deadline_text}</span>"
-                    if ciclu and not pd.isna(ciclu) and ciclu.lower() != 'nan':
-                        event_text += f"<br><span style='font-size: 14px;'>Ciclu: {ciclu}</span>"
-                
-                    event_label.setText(event_text)
-                    event_label.setStyleSheet("""
-                        background-color: #f0f0f0;
-                        border: 1px solid #dcdcdc;
-                        padding: 15px;
-                    """)
-                    event_label.setAlignment(Qt.AlignCenter)
-                    event_label.setWordWrap(True)
-                    event_label.setMinimumHeight(120)
-                    event_label.mousePressEvent = lambda e, index=index: self.showEventOptions(index)
-                    
-                    if observatii and not pd.isna(observatii):
-                        event_label.setMouseTracking(True)
-                        event_label.enterEvent = lambda e, obs=observatii: QToolTip.showText(QCursor.pos(), obs)
-                        event_label.leaveEvent = lambda e: QToolTip.hideText()
-                    
-                    self.scrollLayout.addWidget(event_label)
-                
-                elif len(notification) > 6 and notification[6] == 'anniversary':  # Aniversare
-                    event, date, days_until_anniversary, age, is_red, index, _, observatii = notification
-                    event_label = QLabel()
-                    
-                    color = "red" if is_red else "black"
-                    
-                    event_text = f"<span style='font-size: {self.settings['eventNameFont']}px;'><b>{event}</b></span><br>"
-                    weekday = get_romanian_weekday(date)
-                    event_text += f"<span style='color: {color}; font-size: {self.settings['dateFont']}px;'>împlinește {age} ani peste {days_until_anniversary} zile,</span><br>"
-                    event_text += f"<span style='color: {color}; font-size: {self.settings['dateFont']}px;'>{weekday}, {date.day} {luni_romanesti[date.month-1]} {date.year}</span>"
-                    
-                    event_label.setText(event_text)
-                    event_label.setStyleSheet("""
-                        background-color: #f0f0f0;
-                        border: 1px solid #dcdcdc;
-                        padding: 15px;
-                    """)
-                    event_label.setAlignment(Qt.AlignCenter)
-                    event_label.setWordWrap(True)
-                    event_label.setMinimumHeight(120)
-                    event_label.mousePressEvent = lambda e, index=index: self.showEventOptions(index, 'aniversari.csv')
-                    
-                    if observatii and not pd.isna(observatii):
-                        event_label.setMouseTracking(True)
-                        event_label.enterEvent = lambda e, obs=observatii: QToolTip.showText(QCursor.pos(), obs)
-                        event_label.leaveEvent = lambda e: QToolTip.hideText()
-                    
-                    self.scrollLayout.addWidget(event_label)
-
-                elif len(notification) > 5 and notification[5] == 'holiday':  # Sărbătoare
-                    event, date, days_until_holiday, is_red, index, _, tip, sarbatoare_cruce_rosie, observatii = notification
-                    event_label = QLabel()
-                    
-                    color = "red" if is_red else "black"
-                    
-                    event_text = f"<span style='font-size: {self.settings['eventNameFont']}px;'><b>{event}</b></span><br>"
-                    time_text = self.get_holiday_time_text(days_until_holiday)
-                    weekday = get_romanian_weekday(date)
-                    event_text += f"<span style='color: {color}; font-size: {self.settings['dateFont']}px;'>{time_text},</span><br>"
-                    event_text += f"<span style='color: {color}; font-size: {self.settings['dateFont']}px;'>{weekday}, {date.day} {luni_romanesti[date.month-1]} {date.year}</span>"
-                    
-                    holiday_info = []
-                    if tip and not pd.isna(tip) and str(tip).strip() and str(tip).lower() != 'nan':
-                        holiday_info.append(str(tip))
-                    if sarbatoare_cruce_rosie and not pd.isna(sarbatoare_cruce_rosie) and str(sarbatoare_cruce_rosie).strip() and str(sarbatoare_cruce_rosie).lower() != 'nan':
-                        holiday_info.append(f"<span style='color: red;'>{str(sarbatoare_cruce_rosie)}</span>")
-                    
-                    if holiday_info:
-                        event_text += f"<br><span style='font-size: {self.settings['commemorationTypeFont']}px;'>{', '.join(holiday_info)}</span>"
-                    
-                    event_label.setText(event_text)
-                    event_label.setStyleSheet("""
-                        background-color: #f0f0f0;
-                        border: 1px solid #dcdcdc;
-                        padding: 15px;
-                    """)
-                    event_label.setAlignment(Qt.AlignCenter)
-                    event_label.setWordWrap(True)
-                    event_label.setMinimumHeight(120)
-                    event_label.mousePressEvent = lambda e, index=index: self.openCSVEditor('sarbatori.csv')
-                    
-                    if observatii and not pd.isna(observatii):
-                        event_label.setMouseTracking(True)
-                        event_label.enterEvent = lambda e, obs=observatii: QToolTip.showText(QCursor.pos(), obs)
-                        event_label.leaveEvent = lambda e: QToolTip.hideText()
-                    
-                    self.scrollLayout.addWidget(event_label)
-                
-                else:
-                    print(f"Notificare necunoscută: {notification}")
-                    continue
-
-            except Exception as e:
-                print(f"Eroare la procesarea notificării: {e}")
-                print(f"Notificare problematică: {notification}")
-                continue
+        try:
+            if len(notification) > 8 and notification[8] == 'event':  # Eveniment obișnuit
+                event, date, days_until_event, workdays, weekend_days, consider_weekend, is_red, index, _, ciclu, is_service, observatii = notification
+
+                event_text = f"<span style='font-size: {self.settings['eventNameFont']}px;'><b>{event}</b></span><br>"
+                if is_service:
+                    event_text += f"<span style='color: blue; font-size: {self.settings['serviceEventFont']}px;'>[Eveniment de serviciu]</span><br>"
+                event_text += f"<span style='font-size: {self.settings['dateFont']}px;'>Data limită: {zile_romanesti[date.weekday()]}, {date.day} {luni_romanesti[date.month-1]} {date.year}</span><br>"
+
+                deadline_text = obtine_mesaj_eveniment(datetime.now().date(), date.date(), consider_weekend, self.calendar)
+                deadline_color = "red" if is_red else "orange"
+                event_text += f"<span style='color: {deadline_color}; font-size: {self.settings['deadlineFont']}px;'>{deadline_text}</span>"
+                if ciclu and not este_gol(ciclu) and ciclu.lower() != 'nan':
+                    event_text += f"<br><span style='font-size: 14px;'>Ciclu: {ciclu}</span>"
+                return event_text
+
+            elif len(notification) > 6 and notification[6] == 'anniversary':  # Aniversare
+                event, date, days_until_anniversary, age, is_red, index, _, observatii = notification
+                color = "red" if is_red else "black"
+
+                event_text = f"<span style='font-size: {self.settings['eventNameFont']}px;'><b>{event}</b></span><br>"
+                weekday = get_romanian_weekday(date)
+                event_text += f"<span style='color: {color}; font-size: {self.settings['dateFont']}px;'>împlinește {age} ani peste {days_until_anniversary} zile,</span><br>"
+                event_text += f"<span style='color: {color}; font-size: {self.settings['dateFont']}px;'>{weekday}, {date.day} {luni_romanesti[date.month-1]} {date.year}</span>"
+                return event_text
+
+            elif len(notification) > 5 and notification[5] == 'holiday':  # Sărbătoare
+                event, date, days_until_holiday, is_red, index, _, tip, sarbatoare_cruce_rosie, observatii = notification
+                color = "red" if is_red else "black"
+
+                event_text = f"<span style='font-size: {self.settings['eventNameFont']}px;'><b>{event}</b></span><br>"
+                time_text = self.get_holiday_time_text(days_until_holiday)
+                weekday = get_romanian_weekday(date)
+                event_text += f"<span style='color: {color}; font-size: {self.settings['dateFont']}px;'>{time_text},</span><br>"
+                event_text += f"<span style='color: {color}; font-size: {self.settings['dateFont']}px;'>{weekday}, {date.day} {luni_romanesti[date.month-1]} {date.year}</span>"
+
+                holiday_info = []
+                if tip and not este_gol(tip) and str(tip).strip() and str(tip).lower() != 'nan':
+                    holiday_info.append(str(tip))
+                if sarbatoare_cruce_rosie and not este_gol(sarbatoare_cruce_rosie) and str(sarbatoare_cruce_rosie).strip() and str(sarbatoare_cruce_rosie).lower() != 'nan':
+                    holiday_info.append(f"<span style='color: red;'>{str(sarbatoare_cruce_rosie)}</span>")
+
+                if holiday_info:
+                    event_text += f"<br><span style='font-size: {self.settings['commemorationTypeFont']}px;'>{', '.join(holiday_info)}</span>"
+                return event_text
 
-        self.scrollLayout.addStretch()
-        self.logNotifications(notifications)
-        print("Notificări afișate")
+            else:
+                logger.warning("Notificare necunoscută: %s", notification)
 
-    def clearNotifications(self):
-        print("Ștergere notificări existente")
-        while self.scrollLayout.count():
-            child = self.scrollLayout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+        except Exception as e:
+            logger.error("Eroare la procesarea notificării: %s", e)
+            logger.error("Notificare problematică: %s", notification)
+        return None
+
+    def onNotificationClicked(self, model_index):
+        notification = model_index.data(Qt.UserRole)
+        if len(notification) > 8 and notification[8] == 'event':
+            self.showEventOptions(notification[7])
+        elif len(notification) > 6 and notification[6] == 'anniversary':
+            self.showEventOptions(notification[5], 'aniversari.csv')
+        elif len(notification) > 5 and notification[5] == 'holiday':
+            self.openCSVEditor('sarbatori.csv')
 
     def logNotifications(self, notifications):
-        print("Înregistrare notificări în log")
-        try:
-            with open('log.txt', 'a', encoding='utf-8') as log_file:
-                log_file.write(f"{datetime.now()}: Notificări:\n")
-                for notification in notifications:
-                    if len(notification) > 8 and notification[8] == 'event':  # Eveniment obișnuit
-                        event, date, days_until_event, workdays, weekend_days, consider_weekend, is_red, _, _, ciclu, is_service, observatii = notification
-                        if consider_weekend and weekend_days > 0:
-                            log_file.write(f"  - Eveniment: {event} (Data: {date.strftime('%d-%m-%Y')}, Zile weekend: {weekend_days}, Zile lucrătoare: {workdays}, Ciclu: {ciclu}, Roșu: {is_red}, Serviciu: {is_service}, Observații: {observatii})\n")
-                        else:
-                            log_file.write(f"  - Eveniment: {event} (Data: {date.strftime('%d-%m-%Y')}, Zile rămase: {days_until_event}, Ciclu: {ciclu}, Roșu: {is_red}, Serviciu: {is_service}, Observații: {observatii})\n")
-                    elif len(notification) > 6 and notification[6] == 'anniversary':  # Aniversare
-                        event, date, days_until_anniversary, age, is_red, _, _, observatii = notification
-                        log_file.write(f"  - Aniversare: {event} ({age} ani, Data: {date.strftime('%d-%m-%Y')}, Zile rămase: {days_until_anniversary}, Roșu: {is_red}, Observații: {observatii})\n")
-                    elif len(notification) > 5 and notification[5] == 'holiday':  # Sărbătoare
-                        event, date, days_until_holiday, is_red, _, _, tip, sarbatoare_cruce_rosie, observatii = notification
-                        log_file.write(f"  - Sărbătoare: {event} (Data: {date.strftime('%d-%m-%Y')}, Zile rămase: {days_until_holiday}, Roșu: {is_red}, Tip: {tip}, Sărbătoare cu cruce roșie: {sarbatoare_cruce_rosie}, Observații: {observatii})\n")
-            print("Notificări înregistrate în log")
-        except Exception as e:
-            print(f"Eroare la scrierea în fișierul de log: {e}")
+        """
+        Trimite notificările afișate la istoric (vezi reminder_history); în log.txt ajung
+        doar intrarea în fereastra de notificare și trecerea la roșu.
+        """
+        if self.history is None:
+            return
+        stari = []
+        for notification in notifications:
+            if len(notification) > 8 and notification[8] == 'event':
+                is_red = notification[6]
+            elif len(notification) > 6 and notification[6] == 'anniversary':
+                is_red = notification[4]
+            else:
+                is_red = notification[3]
+            stari.append((cheie_notificare(notification)[0], str(notification[0]),
+                          notification[1].strftime('%Y-%m-%d'), bool(is_red)))
+        self.history.inregistreaza_notificari(stari)
 
     def setupTrayIcon(self):
-        print("Configurare icon tray")
+        logger.debug("Configurare icon tray")
         self.tray_icon = QSystemTrayIcon(self)
         self.tray_icon.setIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))  # Folosim o iconiță standard
         
@@ -1839,7 +2577,7 @@ class ReminderApp(QWidget):
             )
 
     def showEventOptions(self, index, file='informatii.csv'):
-        print(f"Afișare opțiuni eveniment pentru indexul {index}")
+        logger.debug("Afișare opțiuni eveniment pentru indexul %s", index)
         dialog = QDialog(self)
         dialog.setWindowTitle("Opțiuni Eveniment")
         layout = QVBoxLayout()
@@ -1872,17 +2610,21 @@ class ReminderApp(QWidget):
         dialog.exec_()
 
     def updateEventStatus(self, index, status, dialog, file):
-        print(f"Actualizare stare eveniment: index={index}, status={status}, file={file}")
+        logger.debug("Actualizare stare eveniment: index=%s, status=%s, file=%s", index, status, file)
         try:
-            df = pd.read_csv(file)
-            df.loc[index, 'stare'] = status
-            df.to_csv(file, index=False)
+            self.repository.seteaza_valoare(file, index, 'stare', status)
+            self.repository.flush(file)
+            if status == 'indeplinit' and self.history is not None:
+                for notification in self.notificationModel.notifications:
+                    if cheie_notificare(notification)[:2] == (file, index):
+                        self.history.inregistreaza_indeplinit(file, str(notification[0]),
+                                                              notification[1].strftime('%Y-%m-%d'))
             dialog.accept()
             self.checkEvents()
-            print("Stare eveniment actualizată cu succes")
+            logger.info("Stare eveniment actualizată cu succes")
         except Exception as e:
             error_msg = f"Nu s-a putut actualiza starea evenimentului: {str(e)}"
-            print(error_msg)
+            logger.error(error_msg)
             QMessageBox.critical(self, "Eroare", error_msg)
 
     def set_tooltip_style(self, font_size=12):
@@ -1918,7 +2660,30 @@ class ReminderApp(QWidget):
                 self.createEmptyCSV(file)
         # Verificați și alte condiții de integritate aici
 
+def configureaza_logging(argv):
+    """
+    Nivelul de logging vine din linia de comandă (--log-level DEBUG) sau din 'log_level'
+    din window_settings.json. Mesajele folosesc formatare leneșă (logger.debug("%s", x)),
+    deci la un nivel dezactivat nu se construiește niciun text.
+    """
+    nivel = None
+    for i, arg in enumerate(argv):
+        if arg.startswith('--log-level='):
+            nivel = arg.split('=', 1)[1]
+        elif arg == '--log-level' and i + 1 < len(argv):
+            nivel = argv[i + 1]
+    if nivel is None:
+        try:
+            with open('window_settings.json', 'r', encoding='utf-8') as f:
+                nivel = json.load(f).get('log_level')
+        except (OSError, ValueError, AttributeError):
+            pass
+    nivel = str(nivel or DEFAULT_SETTINGS['log_level']).upper()
+    logging.basicConfig(level=getattr(logging, nivel, logging.INFO),
+                        format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+
 def main():
+    configureaza_logging(sys.argv)
     app = QApplication(sys.argv)
     app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     
@@ -1931,7 +2696,7 @@ def main():
         sys.exit(app.exec_())
     except Exception as e:
         error_msg = f"Eroare la inițializarea aplicației: {str(e)}\n{traceback.format_exc()}"
-        print(error_msg)
+        logger.critical(error_msg)
         with open('error_log.txt', 'w', encoding='utf-8') as f:
             f.write(error_msg)
         QMessageBox.critical(None, "Eroare de Inițializare", f"Eroare la inițializarea aplicației: {str(e)}\nVerificați error_log.txt pentru detalii.")
@@ -1939,8 +2704,7 @@ def main():
 
 def global_exception_handler(exctype, value, tb):
     error_msg = ''.join(traceback.format_exception(exctype, value, tb))
-    print("A apărut o excepție neașteptată:")
-    print(error_msg)
+    logger.critical("A apărut o excepție neașteptată:\n%s", error_msg)
     with open('error_log.txt', 'w', encoding='utf-8') as f:
         f.write(error_msg)
     QMessageBox.critical(None, "Eroare", "A apărut o excepție neașteptată. Verificați error_log.txt pentru detalii.")
@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('icon.ico', '.')],
-    hiddenimports=[],
+    hiddenimports=['pandas', 'numpy', 'dateutil.relativedelta'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
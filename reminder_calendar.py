@@ -0,0 +1,89 @@
+"""
+Calendarul zilelor lucrătoare folosit la numărarea zilelor rămase până la un eveniment.
+
+Zilele libere din săptămână vin din setarea 'work_schedule', iar sărbătorile
+marcate 'sărbătoare cu cruce roșie' din sarbatori.csv sunt tratate ca zile
+nelucrătoare. Numărarea se face cu np.busday_count, deci costă O(1) pentru o
+pereche de date și funcționează direct pe vectori.
+"""
+from datetime import date, datetime
+
+from reminder_engine import LUNI_RO, importa_lenes
+
+np = importa_lenes('numpy')
+pd = importa_lenes('pandas')
+
+ZILE_SAPTAMANA = ['Luni', 'Marți', 'Miercuri', 'Joi', 'Vineri', 'Sâmbătă', 'Duminică']
+SARBATOARE_CRUCE_ROSIE = 'sărbătoare cu cruce roșie'
+MASCA_IMPLICITA = [True, True, True, True, True, False, False]
+
+
+def _ca_zi(valoare):
+    """Convertește o dată (datetime, Timestamp, date sau vector) în datetime64[D]."""
+    # pd.Timestamp este subclasă de datetime; nu e nevoie să încărcăm pandas pentru test
+    if isinstance(valoare, datetime):
+        return np.datetime64(valoare.date(), 'D')
+    if isinstance(valoare, date):
+        return np.datetime64(valoare, 'D')
+    return np.asarray(valoare).astype('datetime64[D]')
+
+
+class BusinessCalendar:
+    def __init__(self, masca_saptamana=None, sarbatori=()):
+        masca = list(masca_saptamana) if masca_saptamana is not None else MASCA_IMPLICITA
+        if not any(masca):
+            # np.busdaycalendar nu acceptă o săptămână fără zile lucrătoare
+            masca = MASCA_IMPLICITA
+        self.masca_saptamana = masca
+        self.sarbatori = np.unique(np.asarray(list(sarbatori), dtype='datetime64[D]'))
+        self._calendar = np.busdaycalendar(weekmask=masca, holidays=self.sarbatori)
+
+    @classmethod
+    def from_settings(cls, work_schedule, tabel_sarbatori=None, an_curent=None, ani_in_avans=10):
+        """
+        Construiește calendarul din programul de lucru și din sărbătorile cu cruce roșie.
+        Sărbătorile (zi + lună) se repetă din anul trecut până la `ani_in_avans` ani înainte.
+        """
+        masca = None
+        if work_schedule:
+            masca = [not work_schedule.get(zi, {}).get('day_off', zi in ['Sâmbătă', 'Duminică'])
+                     for zi in ZILE_SAPTAMANA]
+
+        sarbatori = []
+        if tabel_sarbatori is not None and len(tabel_sarbatori) and 'sarbatoare_cruce_rosie' in tabel_sarbatori.columns:
+            an_curent = an_curent or datetime.now().year
+            if hasattr(tabel_sarbatori, 'randuri'):
+                # reminder_storage.TabelInregistrari, citit fără pandas
+                perechi = [(rand.get('ziua'), rand.get('luna')) for rand in tabel_sarbatori.randuri
+                           if rand.get('sarbatoare_cruce_rosie') == SARBATOARE_CRUCE_ROSIE]
+            else:
+                rosii = tabel_sarbatori[tabel_sarbatori['sarbatoare_cruce_rosie'] == SARBATOARE_CRUCE_ROSIE]
+                perechi = [(None if pd.isna(ziua) else ziua, luna)
+                           for ziua, luna in zip(pd.to_numeric(rosii['ziua'], errors='coerce'), rosii['luna'])]
+            for ziua, luna in perechi:
+                if ziua is None or luna not in LUNI_RO:
+                    continue
+                for an in range(an_curent - 1, an_curent + ani_in_avans + 1):
+                    try:
+                        sarbatori.append(date(an, LUNI_RO.index(luna) + 1, int(ziua)))
+                    except ValueError:
+                        continue
+        return cls(masca, sarbatori)
+
+    def este_zi_lucratoare(self, zi):
+        return bool(np.is_busday(_ca_zi(zi), busdaycal=self._calendar))
+
+    def zile_lucratoare(self, start, sfarsit):
+        """Zilele lucrătoare din intervalul [start, sfarsit) — scalari sau vectori."""
+        return np.busday_count(_ca_zi(start), _ca_zi(sfarsit), busdaycal=self._calendar)
+
+    def zile_nelucratoare(self, start, sfarsit):
+        """
+        Zilele nelucrătoare (weekend sau sărbătoare) din [start, sfarsit], inclusiv capetele.
+        Pentru sfarsit < start rezultatul este 0, ca la pd.date_range gol.
+        """
+        start = _ca_zi(start)
+        sfarsit = _ca_zi(sfarsit)
+        lungime = (sfarsit - start).astype(np.int64) + 1
+        lucratoare = np.busday_count(start, sfarsit + 1, busdaycal=self._calendar)
+        return np.where(lungime > 0, lungime - lucratoare, 0)
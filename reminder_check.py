@@ -0,0 +1,167 @@
+"""
+Verificarea scadențelor fără interfață grafică: `python Reminder.py --check`.
+
+Pentru cron sau pentru un server fără ecran. Folosește același motor ca fereastra
+(reminder_engine.calculeaza_categorie), aceleași fișiere de date și aceleași setări
+din window_settings.json, dar nu importă Qt și nu salvează rezultatul calculului:
+datele de notificare, avansarea ciclurilor și resetarea stărilor rămân în grija
+aplicației. Singura scriere posibilă este normalizarea unui fișier CSV editat de mână,
+exact ca la pornirea ferestrei.
+
+    python Reminder.py --check [--date 2026-12-24] [--data-dir DIR] [--format json]
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+
+import reminder_engine
+import reminder_storage
+from reminder_calendar import BusinessCalendar
+from reminder_settings import SettingsStore, DEFAULT_SETTINGS
+
+logger = logging.getLogger(__name__)
+
+# Ordinea din ReminderApp.computeNotifications; sortarea după dată este stabilă
+ORDINE_CATEGORII = ('sarbatori.csv', 'informatii.csv', 'aniversari.csv')
+CATEGORII = {'informatii.csv': 'eveniment', 'aniversari.csv': 'aniversare', 'sarbatori.csv': 'sarbatoare'}
+
+
+class EroareVerificare(Exception):
+    """Director de date sau setări care nu permit verificarea."""
+
+
+def citeste_data(text):
+    """Data din linia de comandă: aaaa-ll-zz sau zz-ll-aaaa (formatul din fișierele CSV)."""
+    for format_data in ('%Y-%m-%d', reminder_engine.FORMAT_DATA):
+        try:
+            return datetime.strptime(text, format_data)
+        except ValueError:
+            continue
+    raise argparse.ArgumentTypeError(f"data invalidă: {text} (se așteaptă aaaa-ll-zz sau zz-ll-aaaa)")
+
+
+def creeaza_depozit(director, setari):
+    """DataRepository pe stocarea din setări, fără a crea fișiere sau baze de date lipsă."""
+    if setari.get('storage_backend', 'csv') == 'sqlite':
+        cale_db = os.path.join(director, setari.get('sqlite_path', 'reminder.db'))
+        if not os.path.exists(cale_db):
+            raise EroareVerificare(f"baza de date {cale_db} nu există")
+        backend = reminder_storage.SQLiteBackend(cale_db, director)
+    else:
+        backend = reminder_storage.CSVBackend(director)
+        if not any(backend.exista(nume) for nume in reminder_storage.FISIERE):
+            raise EroareVerificare(f"directorul {director or '.'} nu conține fișiere de date")
+    return reminder_storage.DataRepository(backend, setari.get('pandas_min_bytes', reminder_storage.PRAG_PANDAS))
+
+
+def calculeaza_notificari(repository, setari, moment_curent):
+    """
+    Notificările pentru ziua `moment_curent`, ca perechi (fișier, tuplu de notificare),
+    în ordinea panoului. Vizibilitatea urmează setările salvate de aplicație.
+    """
+    arata_ascunse = setari.get('visibility_index', 0) == 0
+    arata_serviciu = setari.get('service_visibility', 'Evenimente serviciu vizibile') == 'Evenimente serviciu vizibile'
+    arata_sarbatori = setari.get('show_commemorations', True)
+    if setari.get('use_vectorized_engine', True):
+        calculeaza = reminder_engine.calculeaza_categorie
+    else:
+        calculeaza = reminder_engine.calculeaza_categorie_iterativ
+
+    prezente = [nume for nume in reminder_storage.FISIERE if repository.exista(nume)]
+    tabel_sarbatori = repository.tabel('sarbatori.csv') if 'sarbatori.csv' in prezente else None
+    calendar = BusinessCalendar.from_settings(setari.get('work_schedule', {}), tabel_sarbatori, moment_curent.year)
+
+    notificari = []
+    for nume in ORDINE_CATEGORII:
+        if nume not in prezente or (nume == 'sarbatori.csv' and not arata_sarbatori):
+            continue
+        # Tot tabelul, nu doar candidații din SQLite: data cerută poate fi și în trecut
+        _, _, lista = calculeaza(nume, repository.tabel(nume), moment_curent, calendar, arata_ascunse, arata_serviciu)
+        notificari.extend((nume, n) for n in lista)
+    notificari.sort(key=lambda x: x[1][1])
+    return notificari
+
+
+def _simplu(valoare):
+    """Valoare serializabilă în JSON: fără NaN și fără scalari NumPy."""
+    if isinstance(valoare, float) and valoare != valoare:
+        return None
+    if hasattr(valoare, 'item') and not isinstance(valoare, str):
+        return valoare.item()
+    return valoare
+
+
+def descrie(nume, n):
+    """Tuplul de notificare al categoriei, ca dicționar cu nume de câmpuri."""
+    rezultat = {'categorie': CATEGORII[nume], 'eveniment': n[0], 'data': n[1].strftime('%Y-%m-%d'),
+                'zile': n[2]}
+    if nume == 'informatii.csv':
+        rezultat.update(urgent=n[6], zile_lucratoare=n[3] if n[5] else None, ciclu=n[9],
+                        serviciu=n[10], observatii=n[11])
+    elif nume == 'aniversari.csv':
+        rezultat.update(urgent=n[4], varsta=n[3], observatii=n[7])
+    else:
+        rezultat.update(urgent=n[3], tip=n[6], cruce_rosie=n[7], observatii=n[8])
+    return {cheie: _simplu(valoare) for cheie, valoare in rezultat.items()}
+
+
+def _cand(zile):
+    if zile == 0:
+        return "azi"
+    if zile == 1:
+        return "mâine"
+    if zile < 0:
+        return f"depășit cu {-zile} zile"
+    return f"peste {zile} zile"
+
+
+def ca_text(moment_curent, elemente):
+    linii = [f"Scadențe pentru {moment_curent.strftime(reminder_engine.FORMAT_DATA)}: {len(elemente)}"]
+    for e in elemente:
+        detalii = [e['categorie']]
+        if e.get('zile_lucratoare') is not None:
+            detalii.append(f"{e['zile_lucratoare']} zile lucrătoare")
+        if e.get('varsta') is not None:
+            detalii.append(f"{e['varsta']} ani")
+        data = datetime.strptime(e['data'], '%Y-%m-%d').strftime(reminder_engine.FORMAT_DATA)
+        linii.append(f"{'!' if e['urgent'] else ' '} {data}  {_cand(e['zile']):<14} {e['eveniment']} ({', '.join(detalii)})")
+    return '\n'.join(linii)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='Reminder.py --check',
+                                     description="Afișează scadențele fără a porni interfața grafică.")
+    parser.add_argument('--check', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--date', type=citeste_data, default=None,
+                        help="ziua verificată (aaaa-ll-zz sau zz-ll-aaaa); implicit azi")
+    parser.add_argument('--data-dir', default='', help="directorul cu fișierele CSV și window_settings.json")
+    parser.add_argument('--format', choices=('text', 'json'), default='text')
+    parser.add_argument('--log-level', default='WARNING')
+    args = parser.parse_args(argv)
+
+    # stdout rămâne doar pentru rezultat; mesajele merg pe stderr
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.WARNING), stream=sys.stderr,
+                        format='%(levelname)s %(name)s: %(message)s')
+    moment_curent = (args.date or datetime.now()).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    try:
+        setari = SettingsStore.incarca(os.path.join(args.data_dir, 'window_settings.json'), DEFAULT_SETTINGS)
+        repository = creeaza_depozit(args.data_dir, setari)
+        elemente = [descrie(nume, n) for nume, n in calculeaza_notificari(repository, setari, moment_curent)]
+    except EroareVerificare as e:
+        print(f"Eroare: {e}", file=sys.stderr)
+        return 1
+
+    if args.format == 'json':
+        print(json.dumps({'data': moment_curent.strftime('%Y-%m-%d'), 'notificari': elemente},
+                         ensure_ascii=False, indent=2))
+    else:
+        print(ca_text(moment_curent, elemente))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,736 @@
+"""
+Motorul de calcul al scadențelor pentru evenimente, aniversări și sărbători.
+
+Calculele se fac pe coloane (pandas/NumPy) pentru tot tabelul odată, iar
+tuplurile de notificare au exact forma celor construite de bucla veche din
+ReminderApp.checkEvents, astfel încât afișarea și logarea rămân neschimbate.
+
+pandas și NumPy se încarcă leneș (importa_lenes): modulul se importă instant,
+iar costul real apare la primul calcul, după ce fereastra este deja afișată.
+
+Pentru tabelele mici, citite ca înregistrări (reminder_storage.TabelInregistrari),
+există o variantă rând cu rând, fără pandas (funcțiile *_inregistrari), cu aceleași
+rezultate; pandas rămâne doar un accelerator pentru fișierele mari.
+
+Bucla inițială rămâne disponibilă ca rezervă (calculeaza_categorie_iterativ,
+use_vectorized_engine = false) și este referința pentru celelalte două variante.
+"""
+import importlib.util
+import logging
+import sys
+from calendar import monthrange
+from datetime import datetime, timedelta
+from math import gcd
+
+
+def importa_lenes(nume):
+    """Modulul `nume`, încărcat efectiv abia la primul acces la un atribut (None dacă nu e instalat)."""
+    if nume in sys.modules:
+        return sys.modules[nume]
+    spec = importlib.util.find_spec(nume)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    modul = importlib.util.module_from_spec(spec)
+    sys.modules[nume] = modul
+    loader.exec_module(modul)
+    return modul
+
+
+np = importa_lenes('numpy')
+pd = importa_lenes('pandas')
+
+logger = logging.getLogger(__name__)
+
+LUNI_RO = ['Ianuarie', 'Februarie', 'Martie', 'Aprilie', 'Mai', 'Iunie', 'Iulie', 'August', 'Septembrie', 'Octombrie', 'Noiembrie', 'Decembrie']
+LUNI_EN = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
+
+FORMAT_DATA = '%d-%m-%Y'
+
+
+def _coloana(tabel, nume, implicit):
+    if nume in tabel.columns:
+        return tabel[nume]
+    return pd.Series(implicit, index=tabel.index)
+
+
+def _ca_date(serie):
+    if not pd.api.types.is_datetime64_any_dtype(serie):
+        serie = pd.to_datetime(serie, format=FORMAT_DATA, errors='coerce')
+    return serie
+
+
+def _ca_intregi(serie):
+    return pd.to_numeric(serie, errors='coerce').fillna(0).astype(np.int64)
+
+
+def _zile_in_luna(luni):
+    """Numărul de zile pentru fiecare lună dată ca datetime64[M]."""
+    return ((luni + 1).astype('datetime64[D]') - luni.astype('datetime64[D]')).astype(np.int64)
+
+
+def _construieste_date(ani, luni, zile):
+    """
+    Construiește un vector datetime64[D] din ani, luni (1-12) și zile.
+    Combinațiile inexistente (ex. 31 aprilie, 29 februarie într-un an nebisect)
+    devin NaT, la fel cum bucla veche le sărea prin ValueError.
+    """
+    ani = np.asarray(ani, dtype=np.int64)
+    luni = np.asarray(luni, dtype=np.int64)
+    zile = np.asarray(zile, dtype=np.int64)
+    luni_abs = ((ani - 1970) * 12 + (luni - 1)).astype('datetime64[M]')
+    valide = (zile >= 1) & (zile <= _zile_in_luna(luni_abs))
+    rezultat = luni_abs.astype('datetime64[D]') + (zile - 1)
+    rezultat[~valide] = np.datetime64('NaT')
+    return rezultat
+
+
+def luni_ciclu(ciclu):
+    """
+    Numărul de luni dintre două apariții ale unui ciclu ('lunar', 'anual',
+    'la N luni', 'la N ani'). Întoarce 0 pentru evenimentele nerecurente.
+    """
+    if not isinstance(ciclu, str):
+        return 0
+    if ciclu == 'lunar':
+        return 1
+    if ciclu == 'anual':
+        return 12
+    if ciclu.startswith('la '):
+        parts = ciclu.split()
+        if len(parts) == 3:
+            try:
+                number = int(parts[1])
+            except ValueError:
+                return 0
+            if parts[2] in ['ani', 'an']:
+                return max(number, 0) * 12
+            if parts[2] in ['luni', 'luna']:
+                return max(number, 0)
+    return 0
+
+
+def _zi_dupa_pasi(an, luna, zi, pas, n):
+    """
+    Ziua din lună după n adunări succesive ale ciclului de `pas` luni, pornind de la
+    zi/luna/an, ca în bucla inițială (`while data <= acum: data += relativedelta(...)`):
+    la fiecare lună mai scurtă ziua se limitează și nu mai revine, așa că 31 ianuarie
+    lunar rămâne pe 28 după februarie. Sub 29 nu se schimbă nimic.
+    """
+    if zi <= 28 or n <= 0:
+        return zi
+    start = an * 12 + luna - 1
+    februarie = None
+    for j in range(1, min(n, 12) + 1):
+        an_pas, luna_pas = divmod(start + j * pas, 12)
+        zi = min(zi, monthrange(an_pas, luna_pas + 1)[1])
+        if luna_pas == 1 and februarie is None:
+            februarie = j
+    if februarie is not None and zi > 28:
+        # Lunile se repetă la fiecare 12/cmmdc(pas, 12) pași, dar februarie poate fi
+        # bisect la o trecere și nebisect la următoarea (inclusiv anii seculari)
+        perioada = 12 // gcd(pas, 12)
+        for j in range(februarie + perioada, n + 1, perioada):
+            zi = min(zi, monthrange((start + j * pas) // 12, 2)[1])
+            if zi == 28:
+                break
+    return zi
+
+
+def _adauga_pasi(data, pas, n):
+    """`data` după n pași de `pas` luni, cu ziua limitată ca în bucla inițială (_zi_dupa_pasi)."""
+    an, luna = divmod(data.year * 12 + data.month - 1 + n * pas, 12)
+    return data.replace(year=an, month=luna + 1, day=_zi_dupa_pasi(data.year, data.month, data.day, pas, n))
+
+
+def _aparitia_urmatoare(data, moment_curent, pas):
+    luni = (moment_curent.year - data.year) * 12 + moment_curent.month - data.month
+    n = max(luni // pas, 0)
+    candidat = _adauga_pasi(data, pas, n)
+    if candidat <= moment_curent:
+        candidat = _adauga_pasi(data, pas, n + 1)
+    return candidat
+
+
+def urmatoarea_aparitie(data, moment_curent, ciclu):
+    """
+    Prima apariție a evenimentului strict după moment_curent, calculată direct din
+    diferența în luni față de data inițială, cu același rezultat ca adunarea pas cu pas
+    din bucla inițială (inclusiv limitarea zilei la sfârșit de lună, vezi _zi_dupa_pasi).
+    """
+    pas = luni_ciclu(ciclu)
+    if pas == 0 or data is None or data != data:
+        return data
+    return _aparitia_urmatoare(data, moment_curent, pas)
+
+
+def urmatoarele_aparitii(date, moment_curent, pasi):
+    """
+    Varianta pe vectori a lui urmatoarea_aparitie. `date` este un vector datetime64,
+    `pasi` numărul de luni al ciclului pentru fiecare rând (0 = nerecurent).
+    Întoarce un vector datetime64[ns]; rândurile nerecurente sau fără dată rămân neschimbate.
+    """
+    rezultat = np.asarray(date, dtype='datetime64[ns]').copy()
+    pasi = np.asarray(pasi, dtype=np.int64)
+    recurente = (pasi > 0) & ~np.isnat(rezultat)
+    if not recurente.any():
+        return rezultat
+
+    ancore = rezultat[recurente].astype('datetime64[D]')
+    pas = pasi[recurente]
+    luna_ancora = ancore.astype('datetime64[M]')
+    zi_ancora = (ancore - luna_ancora.astype('datetime64[D]')).astype(np.int64) + 1
+    acum = np.datetime64(moment_curent, 'ns')
+    luni = (np.datetime64(moment_curent, 'M') - luna_ancora).astype(np.int64)
+
+    # Doar zilele 29-31 pot fi limitate de lunile scurte; pentru ele ziua se calculează rând cu rând
+    lungi = np.flatnonzero(zi_ancora > 28)
+    luni_absolute = luna_ancora.astype(np.int64) + 1970 * 12
+
+    def aparitia(n):
+        zi = zi_ancora.copy()
+        if lungi.size:
+            zi[lungi] = [_zi_dupa_pasi(l // 12, l % 12 + 1, z, p, k) for l, z, p, k in zip(
+                luni_absolute[lungi].tolist(), zi_ancora[lungi].tolist(), pas[lungi].tolist(), n[lungi].tolist())]
+        luna = luna_ancora + n * pas
+        return (luna.astype('datetime64[D]') + np.minimum(zi, _zile_in_luna(luna)) - 1).astype('datetime64[ns]')
+
+    n = np.maximum(luni // pas, 0)
+    n = np.where(aparitia(n) <= acum, n + 1, n)
+    rezultat[recurente] = aparitia(n)
+    return rezultat
+
+
+def _zile_weekend(moment_curent, date_eveniment, mascare, calendar=None):
+    """
+    Numără zilele nelucrătoare din intervalul [moment_curent, data_eveniment], inclusiv
+    capetele, doar pentru rândurile din mascare. Fără calendar se folosește săptămâna
+    luni-vineri, fără sărbători. Intervalele inverse au 0 zile.
+    """
+    rezultat = np.zeros(len(date_eveniment), dtype=np.int64)
+    if not mascare.any():
+        return rezultat
+    sfarsit = date_eveniment[mascare].astype('datetime64[D]')
+    if calendar is not None:
+        rezultat[mascare] = calendar.zile_nelucratoare(moment_curent, sfarsit)
+        return rezultat
+    start = np.datetime64(moment_curent.date(), 'D')
+    lungime = (sfarsit - start).astype(np.int64) + 1
+    lucratoare = np.busday_count(start, sfarsit + 1)
+    rezultat[mascare] = np.where(lungime > 0, lungime - lucratoare, 0)
+    return rezultat
+
+
+def _data_notificare(date_eveniment, avanszile, valide):
+    notificare = pd.Series(date_eveniment - pd.to_timedelta(avanszile, unit='D'))
+    return notificare.dt.strftime(FORMAT_DATA).where(valide)
+
+
+def calculeaza_evenimente(tabel, moment_curent, calendar=None):
+    """
+    Calculează pentru toate rândurile din informatii.csv următoarea apariție,
+    zilele rămase, data de notificare, starea roșie și zilele nelucrătoare
+    (după `calendar`, un reminder_calendar.BusinessCalendar).
+    """
+    date = _ca_date(_coloana(tabel, 'data', pd.NaT))
+    ciclu = _coloana(tabel, 'ciclu', '').fillna('').astype(str)
+    avanszile = _ca_intregi(_coloana(tabel, 'avanszile', 0)).to_numpy()
+    rosu = _ca_intregi(_coloana(tabel, 'rosu', 0)).to_numpy()
+    weekend = _coloana(tabel, 'weekend', False).fillna(True).astype(bool).to_numpy()
+
+    pasi = ciclu.map({c: luni_ciclu(c) for c in ciclu.unique()}).to_numpy(dtype=np.int64)
+    urmatoare = pd.Series(urmatoarele_aparitii(date.to_numpy(dtype='datetime64[ns]'), moment_curent, pasi),
+                          index=tabel.index)
+
+    urmatoare_np = urmatoare.to_numpy(dtype='datetime64[ns]')
+    valide = urmatoare.notna().to_numpy()
+    zile = np.zeros(len(tabel), dtype=np.int64)
+    zile[valide] = (urmatoare_np[valide] - np.datetime64(moment_curent, 'ns')) // np.timedelta64(1, 'D')
+
+    zile_weekend = _zile_weekend(moment_curent, urmatoare_np, valide & weekend, calendar)
+    stare = _coloana(tabel, 'stare', 'pastreaza').to_numpy()
+
+    return pd.DataFrame({
+        'data_urmatoare': urmatoare,
+        'zile_ramase': zile,
+        'data_notificare': _data_notificare(urmatoare_np, avanszile, valide).to_numpy(),
+        'in_notificare': valide & (zile <= avanszile),
+        'este_rosu': valide & (zile <= rosu) & (rosu > 0),
+        'zile_weekend': zile_weekend,
+        'zile_lucratoare': np.maximum(0, zile + 1 - zile_weekend),
+        'valid': valide,
+        'resetare_stare': valide & (stare == 'indeplinit') & (ciclu != '').to_numpy()
+                          & (urmatoare_np != date.to_numpy(dtype='datetime64[ns]')),
+    }, index=tabel.index)
+
+
+def calculeaza_aniversari(tabel, moment_curent):
+    """Calculează următoarea aniversare, zilele rămase și vârsta pentru aniversari.csv."""
+    date = _ca_date(_coloana(tabel, 'data', pd.NaT))
+    avanszile = _ca_intregi(_coloana(tabel, 'avanszile', 0)).to_numpy()
+    rosu = _ca_intregi(_coloana(tabel, 'rosu', 0)).to_numpy()
+
+    existente = date.notna().to_numpy()
+    luni = date.dt.month.fillna(1).to_numpy(dtype=np.int64)
+    zile_luna = date.dt.day.fillna(1).to_numpy(dtype=np.int64)
+    an_nastere = date.dt.year.fillna(moment_curent.year).to_numpy(dtype=np.int64)
+    azi = np.datetime64(moment_curent.date(), 'D')
+
+    urmatoare = _construieste_date(np.full(len(tabel), moment_curent.year), luni, zile_luna)
+    trecute = ~np.isnat(urmatoare) & (urmatoare < azi)
+    if trecute.any():
+        urmatoare[trecute] = _construieste_date(np.full(trecute.sum(), moment_curent.year + 1),
+                                                luni[trecute], zile_luna[trecute])
+    valide = existente & ~np.isnat(urmatoare)
+    urmatoare[~valide] = np.datetime64('NaT')
+
+    zile = np.zeros(len(tabel), dtype=np.int64)
+    zile[valide] = (urmatoare[valide] - azi).astype(np.int64)
+    ani_urmatori = urmatoare.astype('datetime64[Y]').astype(np.int64) + 1970
+
+    urmatoare_ns = urmatoare.astype('datetime64[ns]')
+    return pd.DataFrame({
+        'data_urmatoare': urmatoare_ns,
+        'zile_ramase': zile,
+        'data_notificare': _data_notificare(urmatoare_ns, avanszile, valide).to_numpy(),
+        'in_notificare': valide & (zile <= avanszile),
+        'este_rosu': valide & (zile <= rosu) & (rosu > 0),
+        'varsta': np.where(valide, ani_urmatori - an_nastere, 0),
+        'valid': valide,
+    }, index=tabel.index)
+
+
+def calculeaza_sarbatori(tabel, moment_curent):
+    """Calculează următoarea apariție a fiecărei sărbători (ziua + luna) din sarbatori.csv."""
+    luna = _coloana(tabel, 'luna', '').map({nume: i + 1 for i, nume in enumerate(LUNI_RO)})
+    ziua = pd.to_numeric(_coloana(tabel, 'ziua', np.nan), errors='coerce').astype(float)
+    avanszile = _ca_intregi(_coloana(tabel, 'avanszile', 0)).to_numpy()
+    rosu = _ca_intregi(_coloana(tabel, 'rosu', 0)).to_numpy()
+
+    existente = (luna.notna() & ziua.notna() & (ziua == ziua.round())).to_numpy()
+    luni = luna.fillna(1).to_numpy(dtype=np.int64)
+    zile_luna = ziua.where(existente, 1).to_numpy(dtype=np.int64)
+    azi = np.datetime64(moment_curent.date(), 'D')
+
+    urmatoare = _construieste_date(np.full(len(tabel), moment_curent.year), luni, zile_luna)
+    trecute = ~np.isnat(urmatoare) & (urmatoare < azi)
+    if trecute.any():
+        urmatoare[trecute] = _construieste_date(np.full(trecute.sum(), moment_curent.year + 1),
+                                                luni[trecute], zile_luna[trecute])
+    valide = existente & ~np.isnat(urmatoare)
+    urmatoare[~valide] = np.datetime64('NaT')
+
+    zile = np.zeros(len(tabel), dtype=np.int64)
+    zile[valide] = (urmatoare[valide] - azi).astype(np.int64)
+
+    urmatoare_ns = urmatoare.astype('datetime64[ns]')
+    return pd.DataFrame({
+        'data_urmatoare': urmatoare_ns,
+        'zile_ramase': zile,
+        'data_notificare': _data_notificare(urmatoare_ns, avanszile, valide).to_numpy(),
+        'in_notificare': valide & (zile <= avanszile),
+        'este_rosu': valide & (zile <= rosu) & (rosu > 0),
+        'valid': valide,
+    }, index=tabel.index)
+
+
+def notificari_evenimente(tabel, calcul, arata_ascunse, arata_serviciu):
+    serviciu = _coloana(tabel, 'serviciu', False).fillna(True).astype(bool)
+    stare = _coloana(tabel, 'stare', 'pastreaza')
+    vizibile = calcul['in_notificare'] & (arata_serviciu | ~serviciu) & (arata_ascunse | (stare != 'indeplinit'))
+    t = tabel[vizibile]
+    c = calcul[vizibile]
+    return [
+        (eveniment, data, int(zile), int(lucratoare), int(weekend_zile), weekend, bool(rosu),
+         index, 'event', ciclu, este_serviciu, observatii)
+        for eveniment, data, zile, lucratoare, weekend_zile, weekend, rosu, index, ciclu, este_serviciu, observatii in zip(
+            _coloana(t, 'eveniment', ''), c['data_urmatoare'], c['zile_ramase'], c['zile_lucratoare'],
+            c['zile_weekend'], _coloana(t, 'weekend', False), c['este_rosu'], t.index,
+            _coloana(t, 'ciclu', ''), _coloana(t, 'serviciu', False), _coloana(t, 'observatii', np.nan))
+    ]
+
+
+def notificari_aniversari(tabel, calcul, arata_ascunse):
+    stare = _coloana(tabel, 'stare', 'pastreaza')
+    vizibile = calcul['in_notificare'] & (arata_ascunse | (stare != 'indeplinit'))
+    t = tabel[vizibile]
+    c = calcul[vizibile]
+    return [
+        (eveniment, data, int(zile), int(varsta), bool(rosu), index, 'anniversary', observatii)
+        for eveniment, data, zile, varsta, rosu, index, observatii in zip(
+            _coloana(t, 'eveniment', ''), c['data_urmatoare'], c['zile_ramase'], c['varsta'],
+            c['este_rosu'], t.index, _coloana(t, 'observatii', ''))
+    ]
+
+
+def notificari_sarbatori(tabel, calcul):
+    vizibile = calcul['in_notificare']
+    t = tabel[vizibile]
+    c = calcul[vizibile]
+    return [
+        (eveniment, data, int(zile), bool(rosu), index, 'holiday', tip, cruce_rosie, observatii)
+        for eveniment, data, zile, rosu, index, tip, cruce_rosie, observatii in zip(
+            _coloana(t, 'eveniment', ''), c['data_urmatoare'], c['zile_ramase'], c['este_rosu'], t.index,
+            _coloana(t, 'tip', np.nan), _coloana(t, 'sarbatoare_cruce_rosie', np.nan), _coloana(t, 'observatii', ''))
+    ]
+
+
+def momente_de_interes(tabel, calcul, moment_curent, limita=64):
+    """
+    Zilele viitoare (la miezul nopții) în care se schimbă ceva pentru rândurile
+    calculate: începe notificarea, notificarea devine roșie, apare evenimentul sau
+    se trece la următoarea apariție. Întoarce cel mult `limita` momente, sortate.
+    """
+    valide = calcul['valid'].to_numpy()
+    if not valide.any():
+        return []
+    tabel = tabel.loc[calcul.index]
+    urmatoare = calcul['data_urmatoare'].to_numpy(dtype='datetime64[ns]')[valide].astype('datetime64[D]')
+    avanszile = _ca_intregi(_coloana(tabel, 'avanszile', 0)).to_numpy()[valide]
+    rosu = _ca_intregi(_coloana(tabel, 'rosu', 0)).to_numpy()[valide]
+    momente = np.concatenate([
+        urmatoare - avanszile,
+        (urmatoare - rosu)[rosu > 0],
+        urmatoare,
+        urmatoare + 1,
+    ])
+    momente = np.unique(momente[momente > np.datetime64(moment_curent.date(), 'D')])[:limita]
+    return [pd.Timestamp(m).to_pydatetime() for m in momente]
+
+
+# Varianta fără pandas. Rândurile vin ca perechi (index, înregistrare), iar calculul
+# întoarce perechi (index, dicționar) cu aceleași chei ca tabelele de mai sus.
+
+def ordoneaza_inregistrari(perechi, dupa_luna=False):
+    """
+    Ordinea de calcul din calculeaza_categorie: după dată (sărbătorile după lună
+    și zi), stabilă, cu valorile lipsă la final.
+    """
+    if dupa_luna:
+        return sorted(perechi, key=lambda p: (p[1].get('luna', ''), p[1].get('ziua') is None, p[1].get('ziua') or 0))
+    return sorted(perechi, key=lambda p: (p[1].get('data') is None, p[1].get('data') or datetime.min))
+
+
+def _data_in_an(an, luna, zi):
+    """Data zi/luna în anul dat, sau None dacă nu există (ex. 29 februarie)."""
+    try:
+        return datetime(an, luna, zi)
+    except (TypeError, ValueError):
+        return None
+
+
+def _aniversarea_urmatoare(moment_curent, luna, zi):
+    """Apariția din anul curent sau, dacă a trecut, din anul următor (ca _construieste_date)."""
+    urmatoare = _data_in_an(moment_curent.year, luna, zi)
+    if urmatoare is not None and urmatoare < moment_curent:
+        urmatoare = _data_in_an(moment_curent.year + 1, luna, zi)
+    return urmatoare
+
+
+def _calcul_comun(urmatoare, zile, avanszile, rosu):
+    valid = urmatoare is not None
+    return {
+        'data_urmatoare': urmatoare,
+        'zile_ramase': zile,
+        'data_notificare': (urmatoare - timedelta(days=avanszile)).strftime(FORMAT_DATA) if valid else None,
+        'in_notificare': valid and zile <= avanszile,
+        'este_rosu': valid and zile <= rosu and rosu > 0,
+        'valid': valid,
+    }
+
+
+def calculeaza_evenimente_inregistrari(perechi, moment_curent, calendar=None):
+    """calculeaza_evenimente pentru înregistrări; zilele nelucrătoare se numără într-un singur apel."""
+    calcul = []
+    for index, rand in perechi:
+        data = rand.get('data')
+        ciclu = rand.get('ciclu') or ''
+        pas = luni_ciclu(ciclu)
+        urmatoare = _aparitia_urmatoare(data, moment_curent, pas) if data is not None and pas > 0 else data
+        zile = (urmatoare - moment_curent).days if urmatoare is not None else 0
+        c = _calcul_comun(urmatoare, zile, rand.get('avanszile', 0), rand.get('rosu', 0))
+        c['zile_weekend'] = 0
+        c['resetare_stare'] = (c['valid'] and rand.get('stare', 'pastreaza') == 'indeplinit'
+                               and ciclu != '' and urmatoare != data)
+        calcul.append((index, c))
+
+    cu_weekend = [c for (_, rand), (_, c) in zip(perechi, calcul) if c['valid'] and rand.get('weekend', False)]
+    if cu_weekend:
+        date_eveniment = np.array([c['data_urmatoare'] for c in cu_weekend], dtype='datetime64[D]')
+        zile_weekend = _zile_weekend(moment_curent, date_eveniment, np.ones(len(cu_weekend), dtype=bool), calendar)
+        for c, numar in zip(cu_weekend, zile_weekend.tolist()):
+            c['zile_weekend'] = numar
+    for _, c in calcul:
+        c['zile_lucratoare'] = max(0, c['zile_ramase'] + 1 - c['zile_weekend'])
+    return calcul
+
+
+def calculeaza_aniversari_inregistrari(perechi, moment_curent):
+    calcul = []
+    for index, rand in perechi:
+        data = rand.get('data')
+        urmatoare = _aniversarea_urmatoare(moment_curent, data.month, data.day) if data is not None else None
+        zile = (urmatoare - moment_curent).days if urmatoare is not None else 0
+        c = _calcul_comun(urmatoare, zile, rand.get('avanszile', 0), rand.get('rosu', 0))
+        c['varsta'] = urmatoare.year - data.year if urmatoare is not None else 0
+        calcul.append((index, c))
+    return calcul
+
+
+def calculeaza_sarbatori_inregistrari(perechi, moment_curent):
+    calcul = []
+    for index, rand in perechi:
+        luna = rand.get('luna')
+        ziua = rand.get('ziua')
+        urmatoare = None
+        if luna in LUNI_RO and ziua is not None:
+            urmatoare = _aniversarea_urmatoare(moment_curent, LUNI_RO.index(luna) + 1, ziua)
+        zile = (urmatoare - moment_curent).days if urmatoare is not None else 0
+        calcul.append((index, _calcul_comun(urmatoare, zile, rand.get('avanszile', 0), rand.get('rosu', 0))))
+    return calcul
+
+
+def notificari_evenimente_inregistrari(perechi, calcul, arata_ascunse, arata_serviciu):
+    return [
+        (rand.get('eveniment', ''), c['data_urmatoare'], c['zile_ramase'], c['zile_lucratoare'], c['zile_weekend'],
+         rand.get('weekend', False), c['este_rosu'], index, 'event', rand.get('ciclu', ''),
+         rand.get('serviciu', False), rand.get('observatii', ''))
+        for (index, rand), (_, c) in zip(perechi, calcul)
+        if c['in_notificare'] and (arata_serviciu or not rand.get('serviciu', False))
+        and (arata_ascunse or rand.get('stare', 'pastreaza') != 'indeplinit')
+    ]
+
+
+def notificari_aniversari_inregistrari(perechi, calcul, arata_ascunse):
+    return [
+        (rand.get('eveniment', ''), c['data_urmatoare'], c['zile_ramase'], c['varsta'], c['este_rosu'], index,
+         'anniversary', rand.get('observatii', ''))
+        for (index, rand), (_, c) in zip(perechi, calcul)
+        if c['in_notificare'] and (arata_ascunse or rand.get('stare', 'pastreaza') != 'indeplinit')
+    ]
+
+
+def notificari_sarbatori_inregistrari(perechi, calcul):
+    return [
+        (rand.get('eveniment', ''), c['data_urmatoare'], c['zile_ramase'], c['este_rosu'], index, 'holiday',
+         rand.get('tip', ''), rand.get('sarbatoare_cruce_rosie', ''), rand.get('observatii', ''))
+        for (index, rand), (_, c) in zip(perechi, calcul)
+        if c['in_notificare']
+    ]
+
+
+def momente_de_interes_inregistrari(perechi, calcul, moment_curent, limita=64):
+    """momente_de_interes pentru înregistrări."""
+    momente = set()
+    for (_, rand), (_, c) in zip(perechi, calcul):
+        if not c['valid']:
+            continue
+        urmatoare = c['data_urmatoare']
+        rosu = rand.get('rosu', 0)
+        momente.update((urmatoare - timedelta(days=rand.get('avanszile', 0)), urmatoare, urmatoare + timedelta(days=1)))
+        if rosu > 0:
+            momente.add(urmatoare - timedelta(days=rosu))
+    return sorted(m for m in momente if m > moment_curent)[:limita]
+
+
+# Bucla inițială din ReminderApp.checkEvents (adjust_date_custom, calculate_notification_date,
+# count_weekend_days), păstrată ca variantă de rezervă: use_vectorized_engine = false.
+# Lucrează pe orice tabel din DataRepository, nu îl reordonează și nu îl scrie; calculul
+# se întoarce ca perechi (index, dicționar), ca la variantele *_inregistrari.
+
+def _lipsa(valoare):
+    return valoare is None or valoare != valoare
+
+
+def _intreg(valoare):
+    return 0 if _lipsa(valoare) else int(valoare)
+
+
+def ajusteaza_data(event_date, now, ciclu):
+    """adjust_date_custom: adună ciclul pas cu pas cât timp data nu a trecut de `now`."""
+    from dateutil.relativedelta import relativedelta
+    if _lipsa(event_date) or not isinstance(ciclu, str) or ciclu == '':
+        return event_date
+    pas = None
+    if ciclu == 'lunar':
+        pas = relativedelta(months=1)
+    elif ciclu == 'anual':
+        pas = relativedelta(years=1)
+    elif ciclu.startswith('la '):
+        parts = ciclu.split()
+        if len(parts) == 3 and parts[1].isdigit() and int(parts[1]) > 0:
+            # 'la 0 luni' sau o unitate necunoscută blocau bucla; acum rămân nerecurente, ca în luni_ciclu
+            if parts[2] in ['ani', 'an']:
+                pas = relativedelta(years=int(parts[1]))
+            elif parts[2] in ['luni', 'luna']:
+                pas = relativedelta(months=int(parts[1]))
+    if pas is None:
+        return event_date
+    while event_date <= now:
+        event_date = event_date + pas
+    return event_date
+
+
+def _ca_data(valoare):
+    if isinstance(valoare, str):
+        try:
+            return datetime.strptime(valoare, FORMAT_DATA)
+        except ValueError:
+            return None
+    return None if _lipsa(valoare) else valoare
+
+
+def _perechi_iterativ(nume, tabel):
+    """Rândurile ca perechi (index, rând), în ordinea buclei inițiale; indecșii rămân cei din tabel."""
+    if hasattr(tabel, 'randuri'):
+        return ordoneaza_inregistrari(tabel.perechi(), dupa_luna=nume == 'sarbatori.csv')
+    if nume == 'sarbatori.csv':
+        return list(tabel.sort_values(['luna', 'ziua']).iterrows())
+    return list(tabel.loc[tabel['data'].sort_values(kind='stable').index].iterrows())
+
+
+def _calcul_iterativ(data, moment_curent, avanszile, rosu):
+    zile = (data - moment_curent).days
+    return {
+        'data_urmatoare': data,
+        'zile_ramase': zile,
+        # calculate_notification_date
+        'data_notificare': (data - timedelta(days=avanszile)).strftime(FORMAT_DATA),
+        'in_notificare': zile <= avanszile,
+        'este_rosu': zile <= rosu and rosu > 0,
+        'valid': True,
+    }
+
+
+def _eveniment_iterativ(index, eveniment, moment_curent, calendar, arata_ascunse, arata_serviciu):
+    data = _ca_data(eveniment.get('data'))
+    ciclu = eveniment.get('ciclu', '')
+    data_eveniment = ajusteaza_data(data, moment_curent, str(ciclu))
+    if data_eveniment is None:
+        return None, None
+    c = _calcul_iterativ(data_eveniment, moment_curent, _intreg(eveniment.get('avanszile')),
+                         _intreg(eveniment.get('rosu')))
+    stare = eveniment.get('stare', 'pastreaza')
+    c['resetare_stare'] = bool(ciclu) and stare == 'indeplinit' and data_eveniment.date() != data.date()
+
+    serviciu = eveniment.get('serviciu', False)
+    if not c['in_notificare'] or not (arata_serviciu or not serviciu) or not (arata_ascunse or stare != 'indeplinit'):
+        return c, None
+    weekend = eveniment.get('weekend', False)
+    # count_weekend_days
+    zile_weekend = 0
+    if weekend:
+        zile_weekend = int(_zile_weekend(moment_curent, np.array([data_eveniment], dtype='datetime64[D]'),
+                                         np.ones(1, dtype=bool), calendar)[0])
+    zile_lucratoare = max(0, c['zile_ramase'] + 1 - zile_weekend)
+    return c, (eveniment.get('eveniment', ''), data_eveniment, c['zile_ramase'], zile_lucratoare, zile_weekend,
+               weekend, c['este_rosu'], index, 'event', ciclu, serviciu, eveniment.get('observatii', ''))
+
+
+def _aniversare_iterativ(index, aniversare, moment_curent, arata_ascunse):
+    data_nastere = _ca_data(aniversare.get('data'))
+    if data_nastere is None:
+        return None, None
+    urmatoarea_aniversare = data_nastere.replace(year=moment_curent.year)
+    if urmatoarea_aniversare < moment_curent:
+        urmatoarea_aniversare = urmatoarea_aniversare.replace(year=moment_curent.year + 1)
+    c = _calcul_iterativ(urmatoarea_aniversare, moment_curent, _intreg(aniversare.get('avanszile')),
+                         _intreg(aniversare.get('rosu')))
+    if not c['in_notificare'] or not (arata_ascunse or aniversare.get('stare', 'pastreaza') != 'indeplinit'):
+        return c, None
+    return c, (aniversare.get('eveniment', ''), urmatoarea_aniversare, c['zile_ramase'],
+               urmatoarea_aniversare.year - data_nastere.year, c['este_rosu'], index, 'anniversary',
+               aniversare.get('observatii', ''))
+
+
+def _sarbatoare_iterativ(index, sarbatoare, moment_curent):
+    ziua = sarbatoare.get('ziua')
+    if _lipsa(ziua) or ziua != int(ziua):
+        return None, None
+    data_sarbatoare = datetime(moment_curent.year, LUNI_RO.index(sarbatoare.get('luna')) + 1, int(ziua))
+    if data_sarbatoare < moment_curent:
+        data_sarbatoare = data_sarbatoare.replace(year=moment_curent.year + 1)
+    c = _calcul_iterativ(data_sarbatoare, moment_curent, _intreg(sarbatoare.get('avanszile')),
+                         _intreg(sarbatoare.get('rosu')))
+    if not c['in_notificare']:
+        return c, None
+    return c, (sarbatoare.get('eveniment', ''), data_sarbatoare, c['zile_ramase'], c['este_rosu'], index, 'holiday',
+               sarbatoare.get('tip', ''), sarbatoare.get('sarbatoare_cruce_rosie', ''), sarbatoare.get('observatii', ''))
+
+
+def calculeaza_categorie_iterativ(nume, tabel, moment_curent, calendar, arata_ascunse, arata_serviciu):
+    """
+    calculeaza_categorie prin bucla inițială, rând cu rând. Rezultatele sunt aceleași;
+    rândurile care nu se pot calcula (date lipsă sau inexistente, ca 29 februarie într-un
+    an nebisect) rămân fără notificare, cu 'valid' = False.
+    """
+    sortat = _perechi_iterativ(nume, tabel)
+    calcul = []
+    notificari = []
+    for index, rand in sortat:
+        try:
+            if nume == 'informatii.csv':
+                c, notificare = _eveniment_iterativ(index, rand, moment_curent, calendar, arata_ascunse, arata_serviciu)
+            elif nume == 'aniversari.csv':
+                c, notificare = _aniversare_iterativ(index, rand, moment_curent, arata_ascunse)
+            else:
+                c, notificare = _sarbatoare_iterativ(index, rand, moment_curent)
+        except Exception as e:
+            logger.debug("%s, rândul %s nu se poate calcula: %s", nume, index, e)
+            c, notificare = None, None
+        if c is None:
+            c = {'data_urmatoare': None, 'zile_ramase': 0, 'data_notificare': None, 'in_notificare': False,
+                 'este_rosu': False, 'valid': False, 'resetare_stare': False}
+        calcul.append((index, c))
+        if notificare is not None:
+            notificari.append(notificare)
+    return sortat, calcul, notificari
+
+
+def calculeaza_categorie(nume, tabel, moment_curent, calendar, arata_ascunse, arata_serviciu):
+    """
+    Calculul complet pentru un fișier de date, pe coloane sau pe înregistrări după tipul
+    tabelului. Întoarce (sortat, calcul, notificari); `sortat` este ordinea de calcul.
+    Folosit de ReminderApp.computeCategory și de verificarea fără interfață (reminder_check).
+    """
+    inregistrari = hasattr(tabel, 'randuri')
+    if nume == 'informatii.csv':
+        # Tabelul rămâne în ordinea din fișier, doar notificările se construiesc în ordine cronologică
+        if inregistrari:
+            sortat = ordoneaza_inregistrari(tabel.perechi())
+            calcul = calculeaza_evenimente_inregistrari(sortat, moment_curent, calendar)
+            notificari = notificari_evenimente_inregistrari(sortat, calcul, arata_ascunse, arata_serviciu)
+        else:
+            sortat = tabel.loc[tabel['data'].sort_values(kind='stable').index]
+            calcul = calculeaza_evenimente(sortat, moment_curent, calendar)
+            notificari = notificari_evenimente(sortat, calcul, arata_ascunse, arata_serviciu)
+
+    elif nume == 'aniversari.csv':
+        if inregistrari:
+            sortat = ordoneaza_inregistrari(tabel.perechi())
+            calcul = calculeaza_aniversari_inregistrari(sortat, moment_curent)
+            notificari = notificari_aniversari_inregistrari(sortat, calcul, arata_ascunse)
+        else:
+            sortat = tabel.loc[tabel['data'].sort_values(kind='stable').index]
+            calcul = calculeaza_aniversari(sortat, moment_curent)
+            notificari = notificari_aniversari(sortat, calcul, arata_ascunse)
+
+    else:
+        if inregistrari:
+            sortat = ordoneaza_inregistrari(tabel.perechi(), dupa_luna=True)
+            calcul = calculeaza_sarbatori_inregistrari(sortat, moment_curent)
+            notificari = notificari_sarbatori_inregistrari(sortat, calcul)
+        else:
+            sortat = tabel.sort_values(['luna', 'ziua'])
+            calcul = calculeaza_sarbatori(sortat, moment_curent)
+            notificari = notificari_sarbatori(sortat, calcul)
+
+    return sortat, calcul, notificari
+
+
+def randuri_de_resetat(calcul):
+    """Indexul evenimentelor a căror stare trebuie readusă la 'pastreaza'."""
+    if isinstance(calcul, list):
+        return [i for i, c in calcul if c['resetare_stare']]
+    return calcul.index[calcul['resetare_stare']]
@@ -0,0 +1,199 @@
+"""
+Istoricul notificărilor (log.txt).
+
+Se scriu doar schimbările de stare ale unei notificări: intrarea în fereastra de
+notificare, trecerea la roșu și marcarea ca îndeplinită. Scrierea se face pe un
+fir separat, dintr-o coadă limitată, ca verificarea evenimentelor să nu aștepte
+după disc. Fișierul se rotește la o dimensiune maximă sau la schimbarea lunii,
+iar arhivele se comprimă cu gzip. Lângă fiecare fișier există un index binar
+(.idx) cu poziția primei înregistrări din fiecare zi, folosit de citeste_istoric.
+"""
+import bisect
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import struct
+import threading
+from datetime import date, datetime
+
+from reminder_storage import scrie_atomic
+
+logger = logging.getLogger(__name__)
+
+# O intrare în index: ziua (ordinal proleptic) și poziția în fișierul necomprimat
+FORMAT_INDEX = '<IQ'
+DIMENSIUNE_INDEX = struct.calcsize(FORMAT_INDEX)
+
+INTRAT = 'intrat'
+ROSU = 'rosu'
+INDEPLINIT = 'indeplinit'
+
+# Stările aparițiilor mai vechi de atât, care nu mai sunt afișate, se uită
+ZILE_PASTRARE_STARE = 400
+
+
+def citeste_index(cale_index):
+    """Lista de perechi (zi, poziție) dintr-un fișier .idx."""
+    try:
+        with open(cale_index, 'rb') as f:
+            continut = f.read()
+    except OSError:
+        return []
+    lungime = len(continut) - len(continut) % DIMENSIUNE_INDEX
+    return list(struct.iter_unpack(FORMAT_INDEX, continut[:lungime]))
+
+
+def citeste_istoric(cale, de_la, pana_la=None):
+    """
+    Înregistrările din `cale` (log.txt sau o arhivă .gz) dintre zilele `de_la` și `pana_la`,
+    inclusiv, ca liste de câmpuri. Citirea începe direct de la prima zi cerută, după index.
+    """
+    pana_la = pana_la or de_la
+    index = citeste_index(cale + '.idx')
+    zile = [zi for zi, _ in index]
+    pozitie = bisect.bisect_left(zile, de_la.toordinal())
+    if pozitie == len(index):
+        return []
+    deschide = gzip.open if cale.endswith('.gz') else open
+    inregistrari = []
+    with deschide(cale, 'rb') as f:
+        f.seek(index[pozitie][1])
+        for linie in f:
+            campuri = linie.decode('utf-8').rstrip('\n').split('\t')
+            zi = datetime.fromisoformat(campuri[0]).date()
+            if zi > pana_la:
+                break
+            if zi >= de_la:
+                inregistrari.append(campuri)
+    return inregistrari
+
+
+class HistoryWriter:
+    def __init__(self, cale='log.txt', dimensiune_maxima=1024 * 1024, coada_maxima=1000):
+        self.cale = cale
+        self.cale_index = cale + '.idx'
+        self.cale_stare = os.path.splitext(cale)[0] + '_stare.json'
+        self.dimensiune_maxima = dimensiune_maxima
+        self.pierdute = 0
+        self._coada = queue.Queue(maxsize=coada_maxima)
+        self._stare = {}
+        self._afisate = set()
+        self._ultima_zi = None
+        self._fir = threading.Thread(target=self._ruleaza, name='HistoryWriter', daemon=True)
+        self._fir.start()
+
+    # Apelate din firul interfeței
+
+    def inregistreaza_notificari(self, notificari):
+        """
+        Primește notificările afișate ca tupluri (fișier, eveniment, data apariției, roșu);
+        comparația cu starea anterioară se face pe firul de scriere.
+        """
+        self._pune(('notificari', datetime.now(), notificari))
+
+    def inregistreaza_indeplinit(self, fisier, eveniment, data_aparitie):
+        self._pune(('indeplinit', datetime.now(), (fisier, eveniment, data_aparitie)))
+
+    def inchide(self, timeout=2):
+        """Scrie ce a rămas în coadă și oprește firul."""
+        if self._fir.is_alive():
+            self._coada.put(None)
+            self._fir.join(timeout)
+
+    def _pune(self, mesaj):
+        try:
+            self._coada.put_nowait(mesaj)
+        except queue.Full:
+            # Coada plină înseamnă un disc blocat; nu oprim interfața pentru istoric
+            self.pierdute += 1
+
+    # Firul de scriere
+
+    def _ruleaza(self):
+        self._incarca_stare()
+        while True:
+            mesaj = self._coada.get()
+            if mesaj is None:
+                break
+            try:
+                self._proceseaza(*mesaj)
+            except Exception as e:
+                logger.error("Eroare la scrierea istoricului: %s", e)
+
+    def _incarca_stare(self):
+        try:
+            with open(self.cale_stare, encoding='utf-8') as f:
+                self._stare = {tuple(json.loads(cheie)): valoare for cheie, valoare in json.load(f).items()}
+        except (OSError, ValueError):
+            self._stare = {}
+        # Un log.txt fără index este în formatul vechi (lista completă la fiecare verificare)
+        if os.path.exists(self.cale) and not os.path.exists(self.cale_index):
+            self._roteste(datetime.now())
+        index = citeste_index(self.cale_index)
+        self._ultima_zi = index[-1][0] if index else None
+
+    def _proceseaza(self, tip, moment, continut):
+        inregistrari = []
+        if tip == 'notificari':
+            self._afisate = set()
+            for fisier, eveniment, data_aparitie, rosu in continut:
+                cheie = (fisier, eveniment, data_aparitie)
+                self._afisate.add(cheie)
+                anterior = self._stare.get(cheie)
+                if anterior is None:
+                    inregistrari.append((INTRAT, cheie))
+                    self._stare[cheie] = INTRAT
+                    anterior = INTRAT
+                if rosu and anterior == INTRAT:
+                    inregistrari.append((ROSU, cheie))
+                    self._stare[cheie] = ROSU
+        else:
+            cheie = tuple(continut)
+            if self._stare.get(cheie) != INDEPLINIT:
+                self._stare[cheie] = INDEPLINIT
+                inregistrari.append((INDEPLINIT, cheie))
+
+        if inregistrari:
+            self._scrie(moment, inregistrari)
+            self._salveaza_stare(moment)
+
+    def _scrie(self, moment, inregistrari):
+        if os.path.exists(self.cale):
+            dimensiune = os.path.getsize(self.cale)
+            luna_fisier = datetime.fromtimestamp(os.path.getmtime(self.cale)).strftime('%Y-%m')
+            if dimensiune >= self.dimensiune_maxima or luna_fisier != moment.strftime('%Y-%m'):
+                self._roteste(moment)
+        continut = ''.join(f"{moment.isoformat(timespec='seconds')}\t{tip}\t" + '\t'.join(map(str, cheie)) + '\n'
+                           for tip, cheie in inregistrari)
+        with open(self.cale, 'ab') as f:
+            pozitie = f.tell()
+            f.write(continut.encode('utf-8'))
+        zi = moment.date().toordinal()
+        if zi != self._ultima_zi:
+            with open(self.cale_index, 'ab') as f:
+                f.write(struct.pack(FORMAT_INDEX, zi, pozitie))
+            self._ultima_zi = zi
+
+    def _roteste(self, moment):
+        """Comprimă fișierul curent (cu indexul lui) și începe unul nou."""
+        baza = f"{os.path.splitext(self.cale)[0]}-{moment.strftime('%Y%m%d-%H%M%S')}"
+        arhiva, numar = baza + '.txt.gz', 1
+        while os.path.exists(arhiva):
+            arhiva, numar = f"{baza}-{numar}.txt.gz", numar + 1
+        with open(self.cale, 'rb') as sursa, gzip.open(arhiva, 'wb') as destinatie:
+            shutil.copyfileobj(sursa, destinatie)
+        if os.path.exists(self.cale_index):
+            os.replace(self.cale_index, arhiva + '.idx')
+        os.remove(self.cale)
+        self._ultima_zi = None
+
+    def _salveaza_stare(self, moment):
+        limita = date.fromordinal(moment.date().toordinal() - ZILE_PASTRARE_STARE).strftime('%Y-%m-%d')
+        self._stare = {cheie: stare for cheie, stare in self._stare.items()
+                       if cheie[2] >= limita or cheie in self._afisate}
+        scrie_atomic(self.cale_stare, json.dumps(
+            {json.dumps(list(cheie), ensure_ascii=False): stare for cheie, stare in self._stare.items()},
+            ensure_ascii=False))
@@ -0,0 +1,78 @@
+"""
+Planificarea următoarei verificări a evenimentelor.
+
+În loc de un QTimer fix la 6 ore, aplicația ține o coadă de priorități cu
+momentele la care se poate schimba ceva pe panou (începutul unei notificări,
+trecerea la roșu, schimbarea zilei, începutul/sfârșitul programului de lucru)
+și armează un singur timer pentru cel mai apropiat moment. Fiecare categorie
+(fișier de date, zi, program) se înlocuiește separat, când se schimbă datele ei.
+"""
+import heapq
+from datetime import datetime, timedelta
+
+from reminder_calendar import ZILE_SAPTAMANA
+
+
+class NotificationScheduler:
+    def __init__(self):
+        self._coada = []
+
+    def inlocuieste(self, categorie, momente, motiv=None):
+        """
+        Înlocuiește momentele unei categorii. Heap-ul se reface fără intrările vechi ale
+        categoriei, așa că nu crește de la o verificare la alta; are cel mult câteva sute
+        de momente (64 pe fișier de date), deci refacerea costă puțin.
+        """
+        motiv = motiv or categorie
+        self._coada = [intrare for intrare in self._coada if intrare[1] != categorie]
+        self._coada.extend((moment, categorie, motiv) for moment in momente)
+        heapq.heapify(self._coada)
+
+    def momente(self, categorie, acum=None):
+        """Momentele viitoare ale unei categorii, sortate."""
+        acum = acum or datetime.now()
+        return sorted(moment for moment, c, _ in self._coada if c == categorie and moment > acum)
+
+    def _curata(self, acum):
+        while self._coada and self._coada[0][0] <= acum:
+            heapq.heappop(self._coada)
+
+    def urmatorul(self, acum=None):
+        """Cel mai apropiat moment viitor și motivul lui, sau (None, None) dacă coada e goală."""
+        self._curata(acum or datetime.now())
+        if not self._coada:
+            return None, None
+        moment, _, motiv = self._coada[0]
+        return moment, motiv
+
+    def __len__(self):
+        return len(self._coada)
+
+
+def urmatoarea_zi(acum=None):
+    acum = acum or datetime.now()
+    return (acum + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def momente_program_lucru(work_schedule, acum=None, zile=7):
+    """
+    Începutul și sfârșitul programului de lucru din următoarele `zile` zile.
+    Sfârșitul este inclusiv (vezi updateServiceVisibilityState), deci
+    schimbarea are loc la o secundă după ora de final.
+    """
+    acum = acum or datetime.now()
+    momente = []
+    for i in range(zile):
+        zi = (acum + timedelta(days=i)).replace(hour=0, minute=0, second=0, microsecond=0)
+        program = work_schedule.get(ZILE_SAPTAMANA[zi.weekday()], {})
+        if not program or program.get('day_off', False):
+            continue
+        for cheie, ajustare in (('start', timedelta()), ('end', timedelta(seconds=1))):
+            try:
+                ora, minut = (int(x) for x in program[cheie].split(':'))
+            except (KeyError, ValueError):
+                continue
+            moment = zi + timedelta(hours=ora, minutes=minut) + ajustare
+            if moment > acum:
+                momente.append(moment)
+    return momente
@@ -0,0 +1,148 @@
+"""
+Setările aplicației (window_settings.json).
+
+Valorile stau în memorie, într-un dicționar. Orice atribuire, ștergere sau update
+marchează setările ca nesalvate și pornește timerul de scriere; scrierea pe disc se
+face o singură dată după ce modificările se opresc (de exemplu la sfârșitul
+redimensionării unei coloane), atomic, și numai dacă textul diferă de cel scris ultima
+dată. La ieșirea din aplicație se scrie imediat ce a rămas nesalvat. Un dicționar
+imbricat modificat pe loc (fără atribuire) trebuie semnalat cu programeaza().
+
+Modulul nu depinde de Qt: timerul vine din `fabrica_timer`, o funcție care primește
+funcția de apelat și întoarce un obiect cu start(ms) și stop(). Fără ea (verificarea
+din linia de comandă) setările se scriu doar la scrie_acum().
+"""
+import json
+import logging
+
+from reminder_storage import PRAG_PANDAS, scrie_atomic
+
+logger = logging.getLogger(__name__)
+
+# Cât se așteaptă după ultima modificare înainte de scriere (ms)
+INTARZIERE_SCRIERE = 1000
+
+# Setările de pornire când window_settings.json lipsește sau este corupt
+DEFAULT_SETTINGS = {
+    'x': 500,
+    'y': 1,
+    'width': 581,
+    'height': 1155,
+    'eventNameFont': 28,
+    'serviceEventFont': 24,
+    'dateFont': 24,
+    'deadlineFont': 24,
+    'csvFontSize': 14,
+    'tooltipFontSize': 12,
+    'commemorationTypeFont': 14,
+    'visibility_index': 1,
+    'service_visibility': 'Evenimente serviciu vizibile',
+    'use_work_schedule': False,
+    'show_commemorations': True,
+    'work_schedule': {
+        'Luni': {'start': '08:00', 'end': '16:00', 'day_off': False},
+        'Marți': {'start': '08:00', 'end': '16:00', 'day_off': False},
+        'Miercuri': {'start': '08:00', 'end': '16:00', 'day_off': False},
+        'Joi': {'start': '08:00', 'end': '16:00', 'day_off': False},
+        'Vineri': {'start': '08:00', 'end': '16:00', 'day_off': False},
+        'Sâmbătă': {'start': '00:00', 'end': '00:00', 'day_off': True},
+        'Duminică': {'start': '00:00', 'end': '00:00', 'day_off': True}
+    },
+    'aniversari.csv_column_widths': {
+        '0': 550, '1': 150, '2': 70, '3': 150, '4': 77, '5': 150, '6': 485
+    },
+    'informatii.csv_column_widths': {
+        '0': 373, '1': 150, '2': 70, '3': 150, '4': 100, '5': 77, '6': 150, '7': 100, '8': 334
+    },
+    'sarbatori.csv_column_widths': {
+        '0': 373, '1': 70, '2': 100, '3': 70, '4': 77, '5': 150, '6': 150, '7': 150
+    },
+    'mainButtonsFontSize': 14,
+    'buttonSpacing': 2,
+    'buttonVerticalPadding': 5,
+    'maximized': False,
+    'use_vectorized_engine': True,
+    'storage_backend': 'csv',
+    'sqlite_path': 'reminder.db',
+    'history_max_bytes': 1048576,
+    'pandas_min_bytes': PRAG_PANDAS,
+    'log_level': 'INFO'
+}
+
+
+class SettingsStore(dict):
+    def __init__(self, cale='window_settings.json', valori=None, intarziere=INTARZIERE_SCRIERE, fabrica_timer=None):
+        super().__init__(valori or {})
+        self.cale = cale
+        self.intarziere = intarziere
+        self.fabrica_timer = fabrica_timer
+        self.murdar = False
+        self._scris = None
+        self._timer = None
+
+    def __setitem__(self, cheie, valoare):
+        super().__setitem__(cheie, valoare)
+        self.programeaza()
+
+    def __delitem__(self, cheie):
+        super().__delitem__(cheie)
+        self.programeaza()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.programeaza()
+
+    def setdefault(self, cheie, implicit=None):
+        if cheie not in self:
+            self[cheie] = implicit
+        return self[cheie]
+
+    def pop(self, cheie, *implicit):
+        if cheie in self:
+            self.programeaza()
+        return super().pop(cheie, *implicit)
+
+    @classmethod
+    def incarca(cls, cale='window_settings.json', implicite=None, fabrica_timer=None):
+        """Citește setările din fișier; dacă lipsește sau e corupt se pornește de la `implicite`."""
+        try:
+            with open(cale, 'r', encoding='utf-8') as f:
+                text = f.read()
+            valori = json.loads(text)
+            if not isinstance(valori, dict):
+                raise ValueError("setările nu sunt un obiect JSON")
+        except (OSError, ValueError):
+            logger.warning("Nu s-au găsit setări sau fișierul este corupt. Se folosesc setările implicite.")
+            return cls(cale, dict(implicite or {}), fabrica_timer=fabrica_timer)
+        setari = cls(cale, valori, fabrica_timer=fabrica_timer)
+        setari._scris = text
+        return setari
+
+    def programeaza(self):
+        """Marchează setările ca nesalvate și (re)pornește timerul de scriere, dacă există."""
+        self.murdar = True
+        if self.fabrica_timer is None:
+            return
+        if self._timer is None:
+            self._timer = self.fabrica_timer(self.scrie_acum)
+        self._timer.start(self.intarziere)
+
+    def scrie_acum(self):
+        """Scrie setările nesalvate; întoarce True dacă fișierul a fost rescris."""
+        if self._timer is not None:
+            self._timer.stop()
+        if not self.murdar:
+            return False
+        self.murdar = False
+        text = json.dumps(self, ensure_ascii=False, indent=4)
+        if text == self._scris:
+            return False
+        try:
+            scrie_atomic(self.cale, text)
+        except OSError as e:
+            logger.error("Eroare la salvarea setărilor: %s", e)
+            self.murdar = True
+            return False
+        self._scris = text
+        logger.debug("Setări salvate în %s", self.cale)
+        return True
@@ -0,0 +1,102 @@
+"""
+Instantaneul ultimei liste de notificări (notificari_instantaneu.json).
+
+După fiecare verificare se salvează notificările calculate, momentele de trezire
+ale fiecărui fișier și calendarul zilelor lucrătoare, împreună cu ziua calculului
+și o amprentă a intrărilor: data modificării și dimensiunea fișierelor de date și
+un hash al setărilor care influențează lista. La pornire, dacă ziua și amprenta
+coincid, panoul se desenează direct din instantaneu, fără pandas și fără calcul.
+"""
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+
+from reminder_storage import scrie_atomic
+
+logger = logging.getLogger(__name__)
+
+FISIER_INSTANTANEU = 'notificari_instantaneu.json'
+VERSIUNE = 1
+
+# Setările de care depinde lista de notificări (fonturile se aplică la desenare)
+CHEI_SETARI = ('visibility_index', 'service_visibility', 'show_commemorations', 'use_work_schedule',
+               'work_schedule', 'use_vectorized_engine', 'storage_backend', 'sqlite_path')
+
+
+def amprenta(fisiere, setari):
+    """Data modificării (ns) și dimensiunea fiecărui fișier, plus hash-ul setărilor relevante."""
+    stari = {}
+    for cale in fisiere:
+        try:
+            stat = os.stat(cale)
+            stari[cale] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            stari[cale] = None
+    text_setari = json.dumps({cheie: setari.get(cheie) for cheie in CHEI_SETARI}, sort_keys=True, ensure_ascii=False)
+    return {'fisiere': stari, 'setari': hashlib.sha1(text_setari.encode('utf-8')).hexdigest()}
+
+
+def _codifica(valoare):
+    if isinstance(valoare, datetime):
+        return {'data': valoare.isoformat()}
+    if isinstance(valoare, float) and valoare != valoare:
+        return None
+    if hasattr(valoare, 'item') and not isinstance(valoare, str):
+        # Scalari NumPy (int64, bool_) din calculul pe coloane
+        return valoare.item()
+    return valoare
+
+
+def _decodifica(valoare):
+    if isinstance(valoare, dict):
+        return datetime.fromisoformat(valoare['data'])
+    return valoare
+
+
+class NotificationSnapshot:
+    def __init__(self, cale=FISIER_INSTANTANEU):
+        self.cale = cale
+        self._scris = None
+
+    def salveaza(self, zi, amprenta_intrari, notificari, momente, calendar):
+        """
+        `notificari` și `momente` sunt dicționare pe fișier de date; `calendar` este
+        BusinessCalendar-ul folosit la calcul. Fișierul se rescrie doar dacă s-a schimbat.
+        """
+        text = json.dumps({
+            'versiune': VERSIUNE,
+            'zi': zi.strftime('%Y-%m-%d'),
+            'amprenta': amprenta_intrari,
+            'notificari': {nume: [[_codifica(v) for v in n] for n in lista] for nume, lista in notificari.items()},
+            'momente': {nume: [m.isoformat() for m in lista] for nume, lista in momente.items()},
+            'calendar': {'masca': [bool(zi_lucru) for zi_lucru in calendar.masca_saptamana],
+                         'sarbatori': [str(d) for d in calendar.sarbatori]},
+        }, ensure_ascii=False)
+        if text == self._scris:
+            return
+        try:
+            scrie_atomic(self.cale, text)
+            self._scris = text
+        except OSError as e:
+            logger.warning("Instantaneul notificărilor nu a putut fi salvat: %s", e)
+
+    def incarca(self, zi, amprenta_intrari):
+        """Instantaneul decodificat, sau None dacă lipsește, e corupt sau nu mai corespunde zilei și intrărilor."""
+        try:
+            with open(self.cale, 'r', encoding='utf-8') as f:
+                continut = json.load(f)
+            if (continut.get('versiune') != VERSIUNE or continut.get('zi') != zi.strftime('%Y-%m-%d')
+                    or continut.get('amprenta') != amprenta_intrari):
+                logger.info("Instantaneul notificărilor este depășit; se recalculează")
+                return None
+            return {
+                'notificari': {nume: [tuple(_decodifica(v) for v in n) for n in lista]
+                               for nume, lista in continut['notificari'].items()},
+                'momente': {nume: [datetime.fromisoformat(m) for m in lista]
+                            for nume, lista in continut['momente'].items()},
+                'calendar': continut['calendar'],
+            }
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
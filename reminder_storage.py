@@ -0,0 +1,712 @@
+"""
+Citirea și scrierea fișierelor CSV ale aplicației.
+
+Fiecare fișier are o schemă declarată (SCHEME): la încărcare textul este citit
+o singură dată, tipurile sunt normalizate în memorie, iar fișierul se rescrie
+doar dacă normalizarea a schimbat ceva. Scrierile se fac atomic (fișier
+temporar în același director + os.replace), astfel încât o întrerupere în
+timpul salvării nu poate trunchia datele.
+
+Fișierele mici se citesc cu modulul csv din biblioteca standard, ca înregistrări
+tipizate (TabelInregistrari), după aceleași reguli ca varianta pandas; pandas se
+folosește doar pentru fișierele mai mari de PRAG_PANDAS sau pentru SQLite și
+poate lipsi cu totul.
+"""
+import csv
+import io
+import logging
+import math
+import os
+import sqlite3
+import tempfile
+from datetime import datetime
+
+from reminder_engine import LUNI_RO, LUNI_EN, FORMAT_DATA, importa_lenes
+
+pd = importa_lenes('pandas')
+
+logger = logging.getLogger(__name__)
+
+# Tipuri: text, data (zz-ll-aaaa), int, bool, stare, zi (întreg opțional), luna (nume românesc)
+SCHEME = {
+    'informatii.csv': {
+        'eveniment': 'text', 'data': 'data', 'avanszile': 'int', 'ciclu': 'text', 'weekend': 'bool',
+        'rosu': 'int', 'stare': 'stare', 'serviciu': 'bool', 'observatii': 'text', 'data_notificare': 'text',
+    },
+    'aniversari.csv': {
+        'eveniment': 'text', 'data': 'data', 'avanszile': 'int', 'ciclu': 'text', 'rosu': 'int',
+        'stare': 'stare', 'observatii': 'text', 'data_notificare': 'text',
+    },
+    'sarbatori.csv': {
+        'eveniment': 'text', 'ziua': 'zi', 'luna': 'luna', 'avanszile': 'int', 'rosu': 'int', 'tip': 'text',
+        'sarbatoare_cruce_rosie': 'text', 'observatii': 'text', 'data_notificare': 'text',
+    },
+}
+
+_VALORI_BOOL = {'true': True, 'false': False, '1': True, '0': False, '': False}
+
+# Fișierele CSV mai mari de atât (octeți) se încarcă cu pandas, dacă este instalat
+PRAG_PANDAS = 1024 * 1024
+
+
+def schema(filename):
+    return SCHEME.get(os.path.basename(filename), {})
+
+
+def _normalizeaza_coloana(valori, tip):
+    """Convertește o coloană citită ca text în tipul din schemă."""
+    if tip == 'data':
+        return pd.to_datetime(valori, format=FORMAT_DATA, errors='coerce')
+    if tip == 'int':
+        return pd.to_numeric(valori, errors='coerce').fillna(0).astype('int64')
+    if tip == 'zi':
+        return pd.to_numeric(valori, errors='coerce').round().astype('Int64')
+    if tip == 'bool':
+        return valori.str.strip().str.lower().map(_VALORI_BOOL).fillna(True).astype(bool)
+    if tip == 'stare':
+        return valori.where(valori != '', 'pastreaza').astype(object)
+    if tip == 'luna':
+        return valori.map(lambda luna: LUNI_RO[LUNI_EN.index(luna)] if luna in LUNI_EN else luna).astype(object)
+    return valori.astype(object)
+
+
+def normalizeaza(tabel_text, filename):
+    """
+    Primește un tabel citit integral ca text (celulele goale = '') și întoarce
+    tabelul tipizat după schema fișierului. Coloanele lipsă din schemă se adaugă
+    la final, iar coloanele necunoscute rămân text.
+    """
+    tabel = pd.DataFrame(index=tabel_text.index)
+    coloane = list(tabel_text.columns) + [c for c in schema(filename) if c not in tabel_text.columns]
+    for coloana in coloane:
+        valori = tabel_text[coloana] if coloana in tabel_text.columns else pd.Series('', index=tabel_text.index)
+        tabel[coloana] = _normalizeaza_coloana(valori.astype(object).fillna(''), schema(filename).get(coloana, 'text'))
+    return tabel
+
+
+def serializeaza(tabel, filename):
+    """Textul CSV al unui tabel tipizat, în formatul de pe disc (date zz-ll-aaaa, True/False)."""
+    iesire = tabel.copy()
+    for coloana, tip in schema(filename).items():
+        if coloana in iesire.columns and tip == 'data':
+            iesire[coloana] = pd.to_datetime(iesire[coloana], errors='coerce').dt.strftime(FORMAT_DATA)
+    return iesire.to_csv(index=False)
+
+
+def incarca_tabel(filename, nume=None):
+    """
+    Citește fișierul o singură dată și întoarce tabelul tipizat după schema lui
+    `nume` (implicit, numele fișierului). Fișierul se rescrie (atomic) doar dacă
+    normalizarea i-a schimbat conținutul.
+    """
+    nume = nume or filename
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    tabel_text = pd.read_csv(io.StringIO(text), dtype=str, keep_default_na=False)
+    tabel = normalizeaza(tabel_text, nume)
+    normalizat = serializeaza(tabel, nume)
+    if normalizat != text:
+        scrie_atomic(filename, normalizat)
+        logger.info("Fișierul %s a fost normalizat și salvat", filename)
+    return tabel
+
+
+def salveaza_tabel(tabel, filename, nume=None):
+    """Salvează atomic un tabel tipizat în formatul de pe disc."""
+    scrie_atomic(filename, serializeaza(tabel, nume or filename))
+
+
+def creeaza_csv_gol(filename):
+    scrie_atomic(filename, ','.join(schema(filename)) + os.linesep)
+
+
+class TabelInregistrari:
+    """Tabel citit fără pandas: coloanele și înregistrările tipizate; indexul unui rând este poziția lui."""
+    def __init__(self, coloane, randuri):
+        self.columns = list(coloane)
+        self.randuri = list(randuri)
+
+    def __len__(self):
+        return len(self.randuri)
+
+    def perechi(self):
+        return list(enumerate(self.randuri))
+
+
+def _numar(text):
+    """Textul ca număr (ca pd.to_numeric), sau None dacă nu este un număr finit."""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        numar = float(text)
+    except ValueError:
+        return None
+    return numar if math.isfinite(numar) else None
+
+
+def converteste_valoare(text, tip):
+    """Valoarea unei celule text în tipul din schemă, după regulile din _normalizeaza_coloana."""
+    if tip == 'data':
+        try:
+            return datetime.strptime(text, FORMAT_DATA)
+        except ValueError:
+            return None
+    if tip == 'int':
+        numar = _numar(text)
+        return int(numar) if numar is not None else 0
+    if tip == 'zi':
+        numar = _numar(text)
+        return int(round(numar)) if numar is not None else None
+    if tip == 'bool':
+        return _VALORI_BOOL.get(text.strip().lower(), True)
+    if tip == 'stare':
+        return text if text != '' else 'pastreaza'
+    if tip == 'luna':
+        return LUNI_RO[LUNI_EN.index(text)] if text in LUNI_EN else text
+    return text
+
+
+def _text_csv(valoare):
+    """Valoarea unei înregistrări în formatul de pe disc (ca serializeaza)."""
+    if valoare is None:
+        return ''
+    if isinstance(valoare, datetime):
+        return valoare.strftime(FORMAT_DATA)
+    return str(valoare)
+
+
+def citeste_inregistrari(linii, nume):
+    """
+    Parcurge cu modulul csv rândurile din `linii` (un fișier deschis cu newline='' sau
+    orice iterabil de linii) și întoarce coloanele și un generator de înregistrări
+    tipizate după schema lui `nume`. Coloanele lipsă din schemă se adaugă la final,
+    iar liniile goale se sar, ca la pd.read_csv.
+    """
+    cititor = csv.reader(linii)
+    antet = next(cititor, [])
+    coloane = antet + [c for c in schema(nume) if c not in antet]
+    tipuri = [schema(nume).get(c, 'text') for c in coloane]
+
+    def inregistrari():
+        for rand in cititor:
+            if not rand:
+                continue
+            valori = rand[:len(antet)] + [''] * (len(coloane) - min(len(rand), len(antet)))
+            yield {c: converteste_valoare(v, tip) for c, v, tip in zip(coloane, valori, tipuri)}
+
+    return coloane, inregistrari()
+
+
+def serializeaza_inregistrari(tabel):
+    """Textul CSV al unui TabelInregistrari, identic cu cel produs de serializeaza pentru același conținut."""
+    iesire = io.StringIO()
+    scriitor = csv.writer(iesire, lineterminator=os.linesep)
+    scriitor.writerow(tabel.columns)
+    scriitor.writerows([_text_csv(rand.get(c)) for c in tabel.columns] for rand in tabel.randuri)
+    return iesire.getvalue()
+
+
+def incarca_inregistrari(filename, nume=None):
+    """Varianta fără pandas a lui incarca_tabel; întoarce un TabelInregistrari."""
+    nume = nume or filename
+    with open(filename, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    coloane, inregistrari = citeste_inregistrari(io.StringIO(text, newline=''), nume)
+    tabel = TabelInregistrari(coloane, inregistrari)
+    normalizat = serializeaza_inregistrari(tabel)
+    if normalizat != text:
+        scrie_atomic(filename, normalizat)
+        logger.info("Fișierul %s a fost normalizat și salvat", filename)
+    return tabel
+
+
+def inregistrari_din_text(headers, randuri, nume):
+    """Rândurile text din editor ca TabelInregistrari, normalizate după schemă (ca normalizeaza)."""
+    coloane = list(headers) + [c for c in schema(nume) if c not in headers]
+    tipuri = [schema(nume).get(c, 'text') for c in coloane]
+    text = [[str(valoare) for valoare in rand] for rand in randuri]
+    return TabelInregistrari(coloane, (
+        {c: converteste_valoare(rand[i] if i < len(rand) else '', tip) for i, (c, tip) in enumerate(zip(coloane, tipuri))}
+        for rand in text))
+
+
+def scrie_atomic(filename, continut, encoding='utf-8'):
+    """Scrie textul într-un fișier temporar lângă `filename` și îl redenumește peste original."""
+    director = os.path.dirname(os.path.abspath(filename))
+    fd, cale_temporara = tempfile.mkstemp(prefix=f'.{os.path.basename(filename)}.', suffix='.tmp', dir=director)
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding, newline='') as f:
+            f.write(continut)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(cale_temporara, filename)
+    except BaseException:
+        try:
+            os.remove(cale_temporara)
+        except OSError:
+            pass
+        raise
+
+
+def actualizeaza_coloana(tabel, coloana, valori):
+    """
+    Copiază în `tabel[coloana]` valorile din seria `valori` (aliniate după index)
+    doar acolo unde diferă. Întoarce True dacă s-a modificat ceva.
+    """
+    if coloana not in tabel.columns:
+        tabel[coloana] = pd.Series(None, index=tabel.index, dtype=object)
+    if len(valori) == 0:
+        return False
+    if not (pd.api.types.is_object_dtype(tabel[coloana]) or pd.api.types.is_string_dtype(tabel[coloana])):
+        tabel[coloana] = tabel[coloana].astype(object)
+
+    vechi = tabel.loc[valori.index, coloana]
+    diferite = ~((vechi == valori) | (vechi.isna() & valori.isna()))
+    if not diferite.any():
+        return False
+    tabel.loc[valori.index[diferite], coloana] = valori[diferite]
+    return True
+
+
+FISIERE = ['informatii.csv', 'aniversari.csv', 'sarbatori.csv']
+
+
+def _text_editor_inregistrare(valoare):
+    """Valoarea unei înregistrări în forma text din editor (ca _text_editor_coloana)."""
+    if valoare is None:
+        return ''
+    if isinstance(valoare, datetime):
+        return valoare.strftime(FORMAT_DATA)
+    return valoare if isinstance(valoare, str) else str(valoare)
+
+
+def _ca_text_editor(valoare):
+    """Valoarea unei celule în forma afișată de editor (șir de caractere sau întreg)."""
+    if isinstance(valoare, pd.Timestamp):
+        return valoare.strftime(FORMAT_DATA)
+    if valoare is None or valoare is pd.NaT or (not isinstance(valoare, str) and pd.isna(valoare)):
+        return ''
+    if isinstance(valoare, bool):
+        return str(valoare)
+    if hasattr(valoare, 'item'):
+        valoare = valoare.item()
+        return str(valoare) if isinstance(valoare, bool) else valoare
+    return valoare
+
+
+def _text_editor_coloana(valori):
+    """_ca_text_editor aplicat unei coloane întregi, vectorizat pentru tipurile frecvente."""
+    if pd.api.types.is_datetime64_any_dtype(valori):
+        # Datele se repetă mult; se formatează o singură dată fiecare valoare distinctă
+        coduri, distincte = pd.factorize(valori)
+        text = distincte.strftime(FORMAT_DATA).tolist() + ['']
+        return [text[cod] for cod in coduri.tolist()]
+    if not isinstance(valori.dtype, pd.api.extensions.ExtensionDtype) and valori.dtype.kind in 'biu':
+        return valori.astype(str).tolist()
+    return [valoare if isinstance(valoare, str) else str(_ca_text_editor(valoare)) for valoare in valori.tolist()]
+
+
+class CSVBackend:
+    """Stocarea implicită: câte un fișier CSV pentru fiecare tabel."""
+    def __init__(self, director=''):
+        self.director = director
+
+    def cale(self, nume):
+        return os.path.join(self.director, nume) if self.director else nume
+
+    def exista(self, nume):
+        return os.path.exists(self.cale(nume))
+
+    def incarca(self, nume):
+        cale = self.cale(nume)
+        if not os.path.exists(cale):
+            creeaza_csv_gol(cale)
+        return incarca_tabel(cale)
+
+    def incarca_inregistrari(self, nume):
+        cale = self.cale(nume)
+        if not os.path.exists(cale):
+            creeaza_csv_gol(cale)
+        return incarca_inregistrari(cale)
+
+    def dimensiune(self, nume):
+        try:
+            return os.path.getsize(self.cale(nume))
+        except OSError:
+            return 0
+
+    def salveaza(self, nume, tabel):
+        if isinstance(tabel, TabelInregistrari):
+            scrie_atomic(self.cale(nume), serializeaza_inregistrari(tabel))
+        else:
+            salveaza_tabel(tabel, self.cale(nume))
+
+    def semnatura(self, nume):
+        """(mtime_ns, dimensiune) pentru fișierul tabelului, sau None dacă lipsește."""
+        try:
+            stare = os.stat(self.cale(nume))
+        except OSError:
+            return None
+        return stare.st_mtime_ns, stare.st_size
+
+
+_TIPURI_SQL = {'int': 'INTEGER', 'zi': 'INTEGER', 'bool': 'INTEGER'}
+
+
+def _iso(valoare):
+    """Data (Timestamp sau text zz-ll-aaaa) în format ISO, sortabil în SQLite."""
+    if isinstance(valoare, str):
+        valoare = pd.to_datetime(valoare, format=FORMAT_DATA, errors='coerce') if valoare else pd.NaT
+    if valoare is None or pd.isna(valoare):
+        return None
+    return valoare.strftime('%Y-%m-%d')
+
+
+class SQLiteBackend:
+    """
+    Stocare în SQLite (sqlite3 din biblioteca standard). Fiecare fișier CSV devine
+    un tabel cu aceleași coloane, plus `id` (ordinea rândurilor) și `data_urmatoare`
+    (următoarea apariție calculată). Datele sunt ținute în format ISO, iar
+    data_notificare și data_urmatoare sunt indexate, așa că verificarea zilnică
+    citește doar rândurile scadente sau cele al căror calcul a expirat.
+    """
+    def __init__(self, cale_db, director_csv=''):
+        self.cale_db = cale_db
+        self.director_csv = director_csv
+        self.conexiune = sqlite3.connect(cale_db)
+        for nume in FISIERE:
+            self._creeaza_tabel(nume)
+
+    @staticmethod
+    def _tabel_sql(nume):
+        return os.path.splitext(os.path.basename(nume))[0]
+
+    def _coloane(self, nume):
+        return [rand[1] for rand in self.conexiune.execute(f'PRAGMA table_info("{self._tabel_sql(nume)}")')]
+
+    def _creeaza_tabel(self, nume):
+        t = self._tabel_sql(nume)
+        coloane = ', '.join(f'"{c}" {_TIPURI_SQL.get(tip, "TEXT")}' for c, tip in schema(nume).items())
+        with self.conexiune:
+            self.conexiune.execute(f'CREATE TABLE IF NOT EXISTS "{t}" (id INTEGER PRIMARY KEY, {coloane}, data_urmatoare TEXT)')
+            self.conexiune.execute(f'CREATE INDEX IF NOT EXISTS "idx_{t}_notificare" ON "{t}"(data_notificare)')
+            self.conexiune.execute(f'CREATE INDEX IF NOT EXISTS "idx_{t}_urmatoare" ON "{t}"(data_urmatoare)')
+
+    def exista(self, nume):
+        return True
+
+    def este_gol(self, nume):
+        return self.conexiune.execute(f'SELECT COUNT(*) FROM "{self._tabel_sql(nume)}"').fetchone()[0] == 0
+
+    def _din_sql(self, nume, cursor):
+        """Rândurile SQL ca tabel tipizat (același format ca incarca_tabel), indexat după id."""
+        coloane = [d[0] for d in cursor.description]
+        randuri = cursor.fetchall()
+        tabel_text = pd.DataFrame(randuri, columns=coloane, dtype=object).set_index('id')
+        tabel_text = tabel_text.drop(columns=['data_urmatoare'])
+        for coloana, tip in schema(nume).items():
+            if coloana not in tabel_text.columns:
+                continue
+            valori = tabel_text[coloana]
+            if tip == 'data' or coloana == 'data_notificare':
+                valori = pd.to_datetime(valori, format='%Y-%m-%d', errors='coerce').dt.strftime(FORMAT_DATA)
+            elif tip == 'bool':
+                valori = valori.map({1: 'True', 0: 'False'})
+            tabel_text[coloana] = valori.map(lambda v: '' if v is None or (not isinstance(v, str) and pd.isna(v)) else str(v))
+        tabel = normalizeaza(tabel_text.fillna(''), nume)
+        tabel.index.name = None
+        return tabel
+
+    def incarca(self, nume):
+        cursor = self.conexiune.execute(f'SELECT * FROM "{self._tabel_sql(nume)}" ORDER BY id')
+        return self._din_sql(nume, cursor)
+
+    def candidati_scadente(self, nume, zi):
+        """
+        Rândurile care pot avea notificare în ziua `zi`: cele cu data_notificare
+        până la `zi` inclusiv și cele al căror calcul lipsește sau a expirat
+        (data_urmatoare <= zi). Interogarea folosește indecșii pe cele două coloane.
+        """
+        zi = zi.strftime('%Y-%m-%d')
+        cursor = self.conexiune.execute(
+            f'SELECT * FROM "{self._tabel_sql(nume)}" WHERE data_notificare <= ? OR data_notificare IS NULL '
+            f'OR data_urmatoare <= ? OR data_urmatoare IS NULL ORDER BY id', (zi, zi))
+        return self._din_sql(nume, cursor)
+
+    def urmatoarea_scadenta(self, nume, zi):
+        """Cea mai apropiată dată de după `zi` la care un rând necalculat devine candidat (sau None)."""
+        zi = zi.strftime('%Y-%m-%d')
+        t = self._tabel_sql(nume)
+        rand = self.conexiune.execute(
+            f'SELECT MIN(data_notificare), (SELECT MIN(data_urmatoare) FROM "{t}" WHERE data_urmatoare > ?) '
+            f'FROM "{t}" WHERE data_notificare > ?', (zi, zi)).fetchone()
+        date_valide = [v for v in rand if v]
+        return datetime.strptime(min(date_valide), '%Y-%m-%d') if date_valide else None
+
+    def _valoare_sql(self, nume, coloana, valoare):
+        tip = schema(nume).get(coloana, 'text')
+        if tip == 'data' or coloana == 'data_notificare':
+            return _iso(valoare)
+        if valoare is None or (not isinstance(valoare, str) and pd.isna(valoare)):
+            return None
+        if tip in ('int', 'zi', 'bool'):
+            return int(valoare)
+        return str(valoare)
+
+    def salveaza(self, nume, tabel):
+        """Rescrie tot tabelul, într-o singură tranzacție. Calculele derivate se refac la următoarea verificare."""
+        t = self._tabel_sql(nume)
+        existente = set(self._coloane(nume))
+        coloane = list(tabel.columns)
+        with self.conexiune:
+            for coloana in coloane:
+                if coloana not in existente:
+                    self.conexiune.execute(f'ALTER TABLE "{t}" ADD COLUMN "{coloana}" TEXT')
+            self.conexiune.execute(f'DELETE FROM "{t}"')
+            lista = ', '.join(f'"{c}"' for c in coloane)
+            semne = ', '.join('?' for _ in coloane)
+            valori = [[self._valoare_sql(nume, c, v) for c, v in zip(coloane, rand)]
+                      for rand in zip(*(tabel[c].tolist() for c in coloane))]
+            self.conexiune.executemany(
+                f'INSERT INTO "{t}" (id, {lista}) VALUES (?, {semne})',
+                [[i] + rand for i, rand in enumerate(valori)])
+
+    def actualizeaza_valori(self, nume, index, coloana, valoare):
+        """UPDATE pe rândurile date (de obicei unul singur, de ex. schimbarea stării)."""
+        with self.conexiune:
+            self.conexiune.executemany(
+                f'UPDATE "{self._tabel_sql(nume)}" SET "{coloana}" = ? WHERE id = ?',
+                [(self._valoare_sql(nume, coloana, valoare), int(i)) for i in index])
+
+    def actualizeaza_randuri(self, nume, tabel):
+        """UPDATE pe rândurile date, după id; data_urmatoare se recalculează la următoarea verificare."""
+        coloane = list(tabel.columns)
+        atribuiri = ', '.join(f'"{c}" = ?' for c in coloane)
+        with self.conexiune:
+            self.conexiune.executemany(
+                f'UPDATE "{self._tabel_sql(nume)}" SET {atribuiri}, data_urmatoare = NULL WHERE id = ?',
+                [[self._valoare_sql(nume, c, v) for c, v in zip(coloane, rand)] + [int(i)]
+                 for i, rand in zip(tabel.index, zip(*(tabel[c].tolist() for c in coloane)))])
+
+    def actualizeaza_derivate(self, nume, index, date_notificare, date_urmatoare):
+        """Salvează data_notificare și data_urmatoare, scriind doar rândurile care s-au schimbat."""
+        with self.conexiune:
+            self.conexiune.executemany(
+                f'UPDATE "{self._tabel_sql(nume)}" SET data_notificare = ?, data_urmatoare = ? '
+                f'WHERE id = ? AND (data_notificare IS NOT ? OR data_urmatoare IS NOT ?)',
+                [(_iso(n), _iso(u), int(i), _iso(n), _iso(u))
+                 for i, n, u in zip(index, date_notificare, date_urmatoare)])
+
+    def importa_csv(self, nume, cale_csv):
+        self.salveaza(nume, incarca_tabel(cale_csv, nume))
+
+    def exporta_csv(self, nume, cale_csv):
+        salveaza_tabel(self.incarca(nume), cale_csv, nume)
+
+    def inchide(self):
+        self.conexiune.close()
+
+
+class DataRepository:
+    """
+    Deține tabelele tipizate pentru informatii, aniversari și sarbatori.
+    Editorii, verificarea evenimentelor și schimbările de stare lucrează pe aceleași
+    tabele din memorie. Cu stocarea CSV pe disc se scrie doar la flush(), doar ce
+    s-a modificat; cu SQLite modificările de rând se scriu imediat, prin UPDATE.
+    Tabelele CSV de până la `prag_pandas` octeți se țin ca TabelInregistrari, fără pandas.
+    """
+    def __init__(self, backend=None, prag_pandas=PRAG_PANDAS):
+        self.backend = backend if backend is not None else CSVBackend()
+        self.prag_pandas = prag_pandas
+        self._tabele = {}
+        self._modificate = set()
+        self._semnaturi = {}
+
+    def exista(self, nume):
+        return self.backend.exista(nume)
+
+    def foloseste_inregistrari(self, nume):
+        """True dacă tabelul se citește cu modulul csv (backend CSV și fișier mic, sau pandas lipsă)."""
+        if not hasattr(self.backend, 'incarca_inregistrari'):
+            return False
+        return pd is None or self.backend.dimensiune(nume) <= self.prag_pandas
+
+    def incarca(self, nume):
+        if self.foloseste_inregistrari(nume):
+            self._tabele[nume] = self.backend.incarca_inregistrari(nume)
+        else:
+            self._tabele[nume] = self.backend.incarca(nume)
+        self._modificate.discard(nume)
+        self._retine_semnatura(nume)
+        return self._tabele[nume]
+
+    def incarca_tot(self):
+        for nume in FISIERE:
+            self.incarca(nume)
+
+    def tabel(self, nume):
+        if nume not in self._tabele:
+            self.incarca(nume)
+        return self._tabele[nume]
+
+    def _retine_semnatura(self, nume):
+        if hasattr(self.backend, 'semnatura'):
+            self._semnaturi[nume] = self.backend.semnatura(nume)
+
+    def modificate_extern(self):
+        """
+        Tabelele încărcate al căror fișier s-a schimbat pe disc de la ultima citire sau
+        scriere făcută de aplicație (după mtime și dimensiune). Scrierile proprii nu apar aici.
+        """
+        if not hasattr(self.backend, 'semnatura'):
+            return []
+        return [nume for nume in FISIERE
+                if nume in self._tabele and self.backend.semnatura(nume) != self._semnaturi.get(nume)]
+
+    def marcheaza_modificat(self, nume):
+        self._modificate.add(nume)
+
+    def este_modificat(self, nume):
+        return nume in self._modificate
+
+    def candidati_scadente(self, nume, zi):
+        """Rândurile care trebuie recalculate pentru ziua `zi` (la CSV, tot tabelul)."""
+        if hasattr(self.backend, 'candidati_scadente'):
+            return self.backend.candidati_scadente(nume, zi)
+        return self.tabel(nume)
+
+    def urmatoarea_scadenta(self, nume, zi):
+        """
+        Data de după `zi` la care apar rânduri noi printre candidați. La CSV toate
+        rândurile sunt deja candidați, deci nu există o astfel de dată.
+        """
+        if hasattr(self.backend, 'urmatoarea_scadenta'):
+            return self.backend.urmatoarea_scadenta(nume, zi)
+        return None
+
+    def seteaza_valori(self, nume, index, coloana, valoare):
+        """Setează aceeași valoare pe rândurile date. Întoarce True dacă s-a modificat ceva."""
+        index = list(index)
+        if not index:
+            return False
+        modificat = True
+        tabel = self._tabele.get(nume)
+        if isinstance(tabel, TabelInregistrari):
+            modificat = False
+            for i in index:
+                if tabel.randuri[i].get(coloana) != valoare:
+                    tabel.randuri[i][coloana] = valoare
+                    modificat = True
+        elif tabel is not None:
+            modificat = actualizeaza_coloana(tabel, coloana, pd.Series(valoare, index=index, dtype=object))
+        if hasattr(self.backend, 'actualizeaza_valori'):
+            self.backend.actualizeaza_valori(nume, index, coloana, valoare)
+        elif modificat:
+            self.marcheaza_modificat(nume)
+        return modificat
+
+    def seteaza_valoare(self, nume, index, coloana, valoare):
+        return self.seteaza_valori(nume, [index], coloana, valoare)
+
+    def aplica_calcul(self, nume, calcul):
+        """
+        Păstrează data_notificare (și, la SQLite, data_urmatoare) calculate de reminder_engine.
+        Pentru un TabelInregistrari `calcul` este lista de perechi (index, calcul) a variantei fără pandas;
+        aceeași listă vine și din bucla de rezervă (calculeaza_categorie_iterativ) pe un tabel pandas.
+        """
+        tabel = self._tabele.get(nume)
+        if isinstance(calcul, list) and not isinstance(tabel, TabelInregistrari):
+            calcul = pd.DataFrame([c for _, c in calcul], index=[i for i, _ in calcul],
+                                  columns=['valid', 'data_notificare', 'data_urmatoare']).astype({'valid': bool})
+        if isinstance(tabel, TabelInregistrari):
+            modificat = False
+            for index, c in calcul:
+                rand = tabel.randuri[index]
+                if c['valid'] and rand.get('data_notificare') != c['data_notificare']:
+                    rand['data_notificare'] = c['data_notificare']
+                    modificat = True
+            if modificat:
+                self.marcheaza_modificat(nume)
+            return
+        valide = calcul[calcul['valid']]
+        modificat = False
+        if nume in self._tabele:
+            modificat = actualizeaza_coloana(self._tabele[nume], 'data_notificare', valide['data_notificare'])
+        if hasattr(self.backend, 'actualizeaza_derivate'):
+            self.backend.actualizeaza_derivate(nume, valide.index, valide['data_notificare'], valide['data_urmatoare'])
+        elif modificat:
+            self.marcheaza_modificat(nume)
+
+    def bucati_editor(self, nume, dimensiune=1000):
+        """
+        Antetul și un generator de bucăți (rânduri în forma folosită de CustomTableModel,
+        indexul fiecărui rând). Valorile se copiază la apel; conversia la text se face
+        abia la parcurgere, așa că generatorul poate fi consumat pe alt fir.
+        """
+        tabel = self.tabel(nume)
+        if isinstance(tabel, TabelInregistrari):
+            coloane = list(tabel.columns)
+            randuri = [dict(rand) for rand in tabel.randuri]
+
+            def bucati_inregistrari():
+                for inceput in range(0, len(randuri), dimensiune):
+                    bucata = randuri[inceput:inceput + dimensiune]
+                    yield ([[_text_editor_inregistrare(rand.get(c)) for c in coloane] for rand in bucata],
+                           list(range(inceput, inceput + len(bucata))))
+
+            return coloane, bucati_inregistrari()
+        tabel = tabel.copy()
+
+        def bucati():
+            for inceput in range(0, len(tabel), dimensiune):
+                bucata = tabel.iloc[inceput:inceput + dimensiune]
+                coloane = [_text_editor_coloana(bucata[coloana]) for coloana in bucata.columns]
+                yield [list(rand) for rand in zip(*coloane)], bucata.index.tolist()
+
+        return list(tabel.columns), bucati()
+
+    def inlocuieste_din_editor(self, nume, headers, randuri):
+        """Înlocuiește tabelul cu rândurile din editor, normalizate după schemă."""
+        if isinstance(self._tabele.get(nume), TabelInregistrari) or pd is None:
+            self._tabele[nume] = inregistrari_din_text(headers, randuri, nume)
+            self.marcheaza_modificat(nume)
+            return
+        tabel_text = pd.DataFrame([[str(valoare) for valoare in rand] for rand in randuri],
+                                  columns=headers, dtype=object)
+        self._tabele[nume] = normalizeaza(tabel_text, nume)
+        self.marcheaza_modificat(nume)
+
+    def actualizeaza_din_editor(self, nume, headers, randuri):
+        """
+        Scrie doar rândurile editate, dacă backend-ul știe să actualizeze rânduri
+        (SQLite); `randuri` asociază indexul din tabel cu valorile text din editor.
+        Întoarce False dacă backend-ul cere rescrierea întregului tabel.
+        """
+        if not hasattr(self.backend, 'actualizeaza_randuri'):
+            return False
+        tabel_text = pd.DataFrame([[str(valoare) for valoare in rand] for rand in randuri.values()],
+                                  columns=headers, index=list(randuri), dtype=object)
+        partial = normalizeaza(tabel_text, nume)
+        tabel = self.tabel(nume)
+        for coloana in partial.columns:
+            if coloana in tabel.columns and tabel[coloana].dtype == partial[coloana].dtype:
+                tabel.loc[partial.index, coloana] = partial[coloana]
+            else:
+                actualizeaza_coloana(tabel, coloana, partial[coloana])
+        self.backend.actualizeaza_randuri(nume, partial)
+        return True
+
+    def flush(self, nume=None):
+        """Scrie tabelele modificate prin backend. Întoarce lista tabelelor scrise."""
+        de_scris = [nume] if nume is not None else list(self._modificate)
+        scrise = []
+        for n in de_scris:
+            if n in self._modificate and n in self._tabele:
+                self.backend.salveaza(n, self._tabele[n])
+                self._modificate.discard(n)
+                self._retine_semnatura(n)
+                scrise.append(n)
+                logger.info("Date salvate în %s", n)
+        return scrise
@@ -0,0 +1,381 @@
+"""
+Stocarea pe coloane folosită de editorul de tabele (CustomTableModel).
+
+Coloanele cu puține valori distincte (date, numere, ciclu, stare, lună, tip,
+True/False) sunt codificate prin dicționar: un array('I') cu codul fiecărui rând
+și lista valorilor distincte, ca text de afișat, așa că data() nu mai convertește
+nimic la redesenare. Valorile nu se păstrează și tipizate: editorul lucrează cu
+textul din fișier, iar interpretarea lui (cheia de sortare, predicatele filtrului)
+se calculează o singură dată pe valoare distinctă. Coloanele de text liber
+(eveniment, observații) rămân liste de șiruri, cu un index de trigrame (construit
+la prima căutare și actualizat la editare) pentru filtrarea editorului.
+Tot aici sunt funcțiile pentru copierea și lipirea blocurilor de celule.
+"""
+import csv
+import html
+import io
+import unicodedata
+from array import array
+from datetime import datetime
+
+from reminder_engine import LUNI_RO, LUNI_EN
+
+COLOANE_TEXT = ('eveniment', 'observatii')
+
+
+def fara_diacritice(text):
+    """Textul cu litere mici și fără diacritice (ă, â, î, ș/ş, ț/ţ devin a, a, i, s, t)."""
+    return ''.join(c for c in unicodedata.normalize('NFKD', str(text).lower()) if not unicodedata.combining(c))
+
+
+class TrigramIndex:
+    """
+    Index de trigrame peste valorile distincte ale unei coloane de text. Valorile care
+    nu mai apar în coloană rămân în index; filtrarea verifică oricum valoarea rândului.
+    """
+    def __init__(self, valori=()):
+        self._trigrame = {}
+        self._normalizate = {}
+        for valoare in valori:
+            self.adauga(valoare)
+
+    def adauga(self, valoare):
+        if valoare in self._normalizate:
+            return
+        text = self._normalizate[valoare] = fara_diacritice(valoare)
+        for i in range(len(text) - 2):
+            self._trigrame.setdefault(text[i:i + 3], set()).add(valoare)
+
+    def cauta(self, termen):
+        """Valorile care conțin `termen` (deja fără diacritice)."""
+        if len(termen) < 3:
+            return {valoare for valoare, text in self._normalizate.items() if termen in text}
+        multimi = sorted((self._trigrame.get(termen[i:i + 3], set()) for i in range(len(termen) - 2)), key=len)
+        candidati = multimi[0].intersection(*multimi[1:])
+        return {valoare for valoare in candidati if termen in self._normalizate[valoare]}
+
+
+def citeste_bloc(text):
+    """
+    Textul din clipboard ca listă de rânduri de celule: TSV (ca din Excel, cu ghilimele
+    pentru celulele pe mai multe linii), CSV dacă sunt cel puțin două linii și toate au
+    același număr de virgule, altfel câte o celulă pe linie (o singură linie cu virgule
+    rămâne o singură celulă). Liniile goale de la final se ignoră.
+    """
+    linii = [linie for linie in text.splitlines() if linie.strip()]
+    if '\t' in text:
+        separator = '\t'
+    elif len(linii) > 1 and linii[0].count(',') and all(linie.count(',') == linii[0].count(',') for linie in linii):
+        separator = ','
+    else:
+        linii = text.splitlines()
+        while linii and not linii[-1].strip():
+            linii.pop()
+        return [[linie] for linie in linii]
+    randuri = list(csv.reader(io.StringIO(text), delimiter=separator))
+    while randuri and not any(celula.strip() for celula in randuri[-1]):
+        randuri.pop()
+    return randuri
+
+
+def scrie_bloc_tsv(randuri):
+    iesire = io.StringIO()
+    csv.writer(iesire, delimiter='\t', lineterminator='\n').writerows(randuri)
+    return iesire.getvalue()
+
+
+def scrie_bloc_html(randuri, antet=None):
+    parti = ['<table>']
+    if antet:
+        parti.append('<tr>' + ''.join(f'<th>{html.escape(celula)}</th>' for celula in antet) + '</tr>')
+    parti.extend('<tr>' + ''.join(f'<td>{html.escape(celula)}</td>' for celula in rand) + '</tr>' for rand in randuri)
+    parti.append('</table>')
+    return '\n'.join(parti)
+
+
+_LUNI = {}
+for _i, (_ro, _en) in enumerate(zip(LUNI_RO, LUNI_EN)):
+    for _cheie in (_ro, _en, _en[:3], str(_i + 1), f'{_i + 1:02d}'):
+        _LUNI[fara_diacritice(_cheie)] = _ro
+
+_BOOL_LIPIRE = {'true': 'True', 'false': 'False', '1': 'True', '0': 'False', 'da': 'True', 'nu': 'False', '': 'False'}
+
+
+def _data_lipita(valoare):
+    if not valoare:
+        return ''
+    for format_data in ('%d-%m-%Y', '%d.%m.%Y', '%d/%m/%Y', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(valoare, format_data).strftime('%d-%m-%Y')
+        except ValueError:
+            pass
+    return None
+
+
+def _intreg_lipit(valoare, gol='0'):
+    if not valoare:
+        return gol
+    try:
+        numar = float(valoare.replace(',', '.'))
+    except ValueError:
+        return None
+    return str(int(numar)) if numar.is_integer() else None
+
+
+def _zi_lipita(valoare):
+    zi = _intreg_lipit(valoare, gol='')
+    return zi if zi == '' or (zi is not None and 1 <= int(zi) <= 31) else None
+
+
+def _stare_lipita(valoare):
+    stare = fara_diacritice(valoare) or 'pastreaza'
+    return stare if stare in ('pastreaza', 'indeplinit') else None
+
+
+CONVERSII_LIPIRE = {
+    'data': _data_lipita,
+    'int': _intreg_lipit,
+    'zi': _zi_lipita,
+    'bool': lambda valoare: _BOOL_LIPIRE.get(valoare.lower()),
+    'luna': lambda valoare: _LUNI.get(fara_diacritice(valoare)) if valoare else '',
+    'stare': _stare_lipita,
+}
+
+
+def converteste_lipire(tip, valori):
+    """
+    Valorile lipite într-o coloană de tipul `tip` (din schema fișierului), aduse la forma
+    din editor; None pentru cele invalide. Fiecare valoare distinctă se convertește o dată.
+    """
+    conversie = CONVERSII_LIPIRE.get(tip)
+    if conversie is None:
+        return list(valori)
+    rezultate = {}
+    for valoare in valori:
+        if valoare not in rezultate:
+            rezultate[valoare] = conversie(valoare.strip())
+    return [rezultate[valoare] for valoare in valori]
+
+
+def muta(valori, pozitie, numar, destinatie):
+    """
+    Mută pe loc blocul [pozitie, pozitie + numar) din `valori` astfel încât primul
+    element să ajungă la `destinatie` (poziție în lista de după scoaterea blocului).
+    """
+    bloc = valori[pozitie:pozitie + numar]
+    del valori[pozitie:pozitie + numar]
+    valori[destinatie:destinatie] = bloc
+
+
+def intervale(randuri):
+    """Rândurile (o mulțime de poziții) grupate în intervale contigue (început, număr), crescător."""
+    rezultat = []
+    for rand in sorted(randuri):
+        if rezultat and rezultat[-1][0] + rezultat[-1][1] == rand:
+            rezultat[-1][1] += 1
+        else:
+            rezultat.append([rand, 1])
+    return [tuple(interval) for interval in rezultat]
+
+
+class TextColumn:
+    def __init__(self, valori=()):
+        self.valori = [str(v) for v in valori]
+        self._chei = {}
+        self._index = None
+
+    def __len__(self):
+        return len(self.valori)
+
+    def get(self, rand):
+        return self.valori[rand]
+
+    def set(self, rand, valoare):
+        valoare = self.valori[rand] = str(valoare)
+        if self._index is not None:
+            self._index.adauga(valoare)
+
+    def insert(self, pozitie, valori):
+        valori = [str(v) for v in valori]
+        self.valori[pozitie:pozitie] = valori
+        if self._index is not None:
+            for valoare in valori:
+                self._index.adauga(valoare)
+
+    def cauta(self, termen):
+        if self._index is None:
+            self._index = TrigramIndex(set(self.valori))
+        return self._index.cauta(termen)
+
+    def evalueaza(self, functie):
+        rezultate = {}
+        for valoare in self.valori:
+            if valoare not in rezultate:
+                rezultate[valoare] = functie(valoare)
+        return [rezultate[valoare] for valoare in self.valori]
+
+    def remove(self, pozitie, numar):
+        del self.valori[pozitie:pozitie + numar]
+
+    def move(self, pozitie, numar, destinatie):
+        muta(self.valori, pozitie, numar, destinatie)
+
+    def reorder(self, ordine):
+        valori = self.valori
+        self.valori = [valori[i] for i in ordine]
+
+    def sort_keys(self, functie_cheie):
+        chei = self._chei.setdefault(functie_cheie, {})
+        rezultat = []
+        for valoare in self.valori:
+            cheie = chei.get(valoare)
+            if cheie is None:
+                cheie = chei[valoare] = functie_cheie(valoare)
+            rezultat.append(cheie)
+        return rezultat
+
+
+class DictColumn:
+    def __init__(self, valori=()):
+        self.categorii = []
+        self._coduri_categorii = {}
+        self._chei = {}
+        self.coduri = array('I', (self._cod(v) for v in valori))
+
+    def _cod(self, valoare):
+        valoare = str(valoare)
+        cod = self._coduri_categorii.get(valoare)
+        if cod is None:
+            cod = self._coduri_categorii[valoare] = len(self.categorii)
+            self.categorii.append(valoare)
+        return cod
+
+    def __len__(self):
+        return len(self.coduri)
+
+    def get(self, rand):
+        return self.categorii[self.coduri[rand]]
+
+    def set(self, rand, valoare):
+        self.coduri[rand] = self._cod(valoare)
+
+    def insert(self, pozitie, valori):
+        self.coduri[pozitie:pozitie] = array('I', (self._cod(v) for v in valori))
+
+    def remove(self, pozitie, numar):
+        del self.coduri[pozitie:pozitie + numar]
+
+    def move(self, pozitie, numar, destinatie):
+        muta(self.coduri, pozitie, numar, destinatie)
+
+    def reorder(self, ordine):
+        coduri = self.coduri
+        self.coduri = array('I', (coduri[i] for i in ordine))
+
+    def evalueaza(self, functie):
+        rezultate = [functie(categorie) for categorie in self.categorii]
+        return [rezultate[cod] for cod in self.coduri]
+
+    def sort_keys(self, functie_cheie):
+        # O cheie pe categorie; categoriile noi primesc cheia la prima sortare
+        chei = self._chei.setdefault(functie_cheie, [])
+        for categorie in self.categorii[len(chei):]:
+            chei.append(functie_cheie(categorie))
+        return [chei[cod] for cod in self.coduri]
+
+
+class TableStore:
+    """
+    Tabelul editorului: antetul și câte o coloană (TextColumn sau DictColumn); valorile se citesc și se schimbă ca text.
+    `ids` ține, pentru fiecare rând, indexul lui în tabelul din depozit (None pentru rândurile noi).
+    """
+    def __init__(self, headers, randuri=(), ids=None):
+        self.headers = list(headers)
+        randuri = list(randuri)
+        self.coloane = []
+        for i, header in enumerate(self.headers):
+            clasa = TextColumn if header in COLOANE_TEXT else DictColumn
+            self.coloane.append(clasa(rand[i] if i < len(rand) else '' for rand in randuri))
+        self.ids = list(ids) if ids is not None else list(range(len(randuri)))
+
+    def __len__(self):
+        return len(self.coloane[0]) if self.coloane else 0
+
+    def value(self, rand, coloana):
+        return self.coloane[coloana].get(rand)
+
+    def set_value(self, rand, coloana, valoare):
+        self.coloane[coloana].set(rand, valoare)
+
+    def row(self, rand):
+        return [coloana.get(rand) for coloana in self.coloane]
+
+    def rows(self):
+        """Rândurile ca liste de text, în ordinea curentă."""
+        return [list(rand) for rand in zip(*(
+            [coloana.categorii[c] for c in coloana.coduri] if isinstance(coloana, DictColumn) else coloana.valori
+            for coloana in self.coloane))]
+
+    def insert_rows(self, pozitie, randuri, ids=None):
+        randuri = list(randuri)
+        for i, coloana in enumerate(self.coloane):
+            coloana.insert(pozitie, [rand[i] if i < len(rand) else '' for rand in randuri])
+        self.ids[pozitie:pozitie] = list(ids) if ids is not None else [None] * len(randuri)
+
+    def remove_rows(self, pozitie, numar):
+        for coloana in self.coloane:
+            coloana.remove(pozitie, numar)
+        del self.ids[pozitie:pozitie + numar]
+
+    def move_rows(self, pozitie, numar, destinatie):
+        """Mută `numar` rânduri de la `pozitie` astfel încât primul să ajungă la `destinatie`."""
+        for coloana in self.coloane:
+            coloana.move(pozitie, numar, destinatie)
+        muta(self.ids, pozitie, numar, destinatie)
+
+    def reorder(self, ordine):
+        """Rearanjează rândurile; `ordine` conține pozițiile vechi în ordinea nouă."""
+        for coloana in self.coloane:
+            coloana.reorder(ordine)
+        ids = self.ids
+        self.ids = [ids[i] for i in ordine]
+
+    def sort_keys(self, coloana, functie_cheie):
+        return self.coloane[coloana].sort_keys(functie_cheie)
+
+    def filtreaza(self, termeni=(), predicate=()):
+        """
+        Câte un bool pe rând: rândul conține fiecare termen (deja fără diacritice) într-una
+        din coloanele de text și respectă predicatele, perechi (coloană, funcție de valoarea text).
+        Predicatele se evaluează o singură dată pe valoare distinctă.
+        """
+        rezultat = [True] * len(self)
+        coloane_text = [coloana for header, coloana in zip(self.headers, self.coloane) if header in COLOANE_TEXT]
+        for termen in termeni:
+            potrivite = [False] * len(self)
+            for coloana in coloane_text:
+                valori = coloana.cauta(termen)
+                if valori:
+                    potrivite = [gasit or valoare in valori for gasit, valoare in zip(potrivite, coloana.valori)]
+            rezultat = [a and b for a, b in zip(rezultat, potrivite)]
+        for coloana, functie in predicate:
+            rezultat = [a and b for a, b in zip(rezultat, self.coloane[coloana].evalueaza(functie))]
+        return rezultat
+
+    def filtreaza_interval(self, inceput, sfarsit, termeni=(), predicate=()):
+        """filtreaza doar pentru rândurile [inceput, sfarsit), rând cu rând, fără indexul de trigrame."""
+        coloane_text = [coloana for header, coloana in zip(self.headers, self.coloane) if header in COLOANE_TEXT]
+        evaluate = [{} for _ in predicate]
+        rezultat = []
+        for rand in range(inceput, sfarsit):
+            texte = [fara_diacritice(coloana.get(rand)) for coloana in coloane_text]
+            acceptat = all(any(termen in text for text in texte) for termen in termeni)
+            for (coloana, functie), cache in zip(predicate, evaluate):
+                if not acceptat:
+                    break
+                valoare = self.coloane[coloana].get(rand)
+                if valoare not in cache:
+                    cache[valoare] = functie(valoare)
+                acceptat = cache[valoare]
+            rezultat.append(bool(acceptat))
+        return rezultat
@@ -0,0 +1,56 @@
+"""
+Date comune pentru teste. Modulele testate nu depind de Qt; pandas este opțional,
+iar testele care compară varianta pandas cu cea fără pandas se sar dacă lipsește.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import reminder_storage  # noqa: E402
+
+INFORMATII = [
+    ['eveniment', 'data', 'avanszile', 'ciclu', 'weekend', 'rosu', 'stare', 'serviciu', 'observatii', 'data_notificare'],
+    ['Chirie', '31-01-2026', '5', 'lunar', 'True', '2', 'pastreaza', 'False', '', ''],
+    ['Revizie', '29-02-2024', '400', 'la 2 ani', 'False', '0', 'pastreaza', 'False', 'an bisect', ''],
+    ['Impozit', '30-11-2025', '20', 'la 3 luni', 'True', '3', 'indeplinit', 'False', '', ''],
+    ['Raport', '23-12-2026', '10', '', 'True', '1', 'pastreaza', 'True', 'serviciu', ''],
+    ['Întâlnire', '24-12-2026', '7', '', 'False', '0', 'indeplinit', 'False', 'ă î ș ț', ''],
+    ['Fără dată', '', '3', 'lunar', 'False', '0', 'pastreaza', 'False', '', ''],
+    ['Asigurare', '15-03-2020', '30', 'anual', 'true', '5', '', 'false', '', ''],
+]
+
+ANIVERSARI = [
+    ['eveniment', 'data', 'avanszile', 'ciclu', 'rosu', 'stare', 'observatii', 'data_notificare'],
+    ['Ana', '25-12-1990', '10', 'anual', '2', 'pastreaza', '', ''],
+    ['Bogdan', '29-02-1992', '30', 'anual', '0', 'pastreaza', 'an bisect', ''],
+    ['Cristi', '01-01-2000', '15', 'anual', '3', 'indeplinit', '', ''],
+    ['Dana', 'necunoscută', '5', 'anual', '0', 'pastreaza', '', ''],
+]
+
+SARBATORI = [
+    ['eveniment', 'ziua', 'luna', 'avanszile', 'rosu', 'tip', 'sarbatoare_cruce_rosie', 'observatii', 'data_notificare'],
+    ['Crăciunul', '25', 'Decembrie', '14', '3', 'Praznic împărătesc', 'sărbătoare cu cruce roșie', '', ''],
+    ['Sfântul Andrei', '30', 'Noiembrie', '40', '0', 'Sfânt', 'sărbătoare cu cruce roșie', '', ''],
+    ['Anul Nou', '1', 'January', '20', '0', 'Civilă', '', '', ''],
+    ['Zi invalidă', '31', 'Februarie', '10', '0', '', '', '', ''],
+]
+
+TABELE = {'informatii.csv': INFORMATII, 'aniversari.csv': ANIVERSARI, 'sarbatori.csv': SARBATORI}
+
+
+def scrie_csv(cale, randuri):
+    text = ''.join(','.join(f'"{c}"' if ',' in c else c for c in rand) + os.linesep for rand in randuri)
+    with open(cale, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+
+
+@pytest.fixture
+def director_date(tmp_path):
+    """Un director cu cele trei fișiere de date, deja în forma normalizată de pe disc."""
+    for nume, randuri in TABELE.items():
+        scrie_csv(tmp_path / nume, randuri)
+        reminder_storage.incarca_inregistrari(str(tmp_path / nume), nume)
+    return tmp_path
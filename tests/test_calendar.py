@@ -0,0 +1,95 @@
+from datetime import date, datetime
+
+import pytest
+
+import reminder_storage
+from reminder_calendar import BusinessCalendar
+
+from conftest import SARBATORI, scrie_csv
+
+
+def test_saptamana_implicita():
+    calendar = BusinessCalendar()
+    # 19-25 octombrie 2026: luni-duminică
+    assert calendar.este_zi_lucratoare(datetime(2026, 10, 23))
+    assert not calendar.este_zi_lucratoare(datetime(2026, 10, 24))
+    assert calendar.zile_lucratoare(datetime(2026, 10, 19), datetime(2026, 10, 26)) == 5
+    assert calendar.zile_nelucratoare(datetime(2026, 10, 19), datetime(2026, 10, 25)) == 2
+    assert calendar.zile_nelucratoare(datetime(2026, 10, 25), datetime(2026, 10, 19)) == 0
+
+
+def test_saptamana_fara_zile_lucratoare_revine_la_implicit():
+    assert BusinessCalendar([False] * 7).masca_saptamana == BusinessCalendar().masca_saptamana
+
+
+def test_program_de_lucru_din_setari():
+    program = {'Vineri': {'day_off': True}, 'Sâmbătă': {'day_off': False}}
+    calendar = BusinessCalendar.from_settings(program)
+    assert not calendar.este_zi_lucratoare(date(2026, 10, 23))
+    assert calendar.este_zi_lucratoare(date(2026, 10, 24))
+    assert not calendar.este_zi_lucratoare(date(2026, 10, 25))
+
+
+def _sarbatori(tmp_path, pandas):
+    scrie_csv(tmp_path / 'sarbatori.csv', SARBATORI)
+    if pandas:
+        pytest.importorskip('pandas')
+        return reminder_storage.incarca_tabel(str(tmp_path / 'sarbatori.csv'))
+    return reminder_storage.incarca_inregistrari(str(tmp_path / 'sarbatori.csv'))
+
+
+@pytest.mark.parametrize('pandas', [False, True])
+def test_sarbatorile_cu_cruce_rosie_sunt_libere(tmp_path, pandas):
+    calendar = BusinessCalendar.from_settings({}, _sarbatori(tmp_path, pandas), 2026)
+    # Crăciunul 2026 și Sfântul Andrei 2026 pică vineri, respectiv luni
+    assert not calendar.este_zi_lucratoare(date(2026, 12, 25))
+    assert not calendar.este_zi_lucratoare(date(2026, 11, 30))
+    # Anul Nou nu are cruce roșie în date; 1 ianuarie 2027 (vineri) rămâne lucrătoare
+    assert calendar.este_zi_lucratoare(date(2027, 1, 1))
+    assert calendar.zile_nelucratoare(date(2026, 12, 21), date(2026, 12, 27)) == 3
+    # Sărbătorile se repetă și în anii următori
+    assert date(2030, 12, 25) in {d.item() for d in calendar.sarbatori}
+
+
+def test_aceleasi_sarbatori_cu_si_fara_pandas(tmp_path):
+    cu_pandas = BusinessCalendar.from_settings({}, _sarbatori(tmp_path, True), 2026)
+    fara_pandas = BusinessCalendar.from_settings({}, _sarbatori(tmp_path, False), 2026)
+    assert list(cu_pandas.sarbatori) == list(fara_pandas.sarbatori)
+
+
+def _mesaj(*argumente):
+    pytest.importorskip('PyQt5')
+    from Reminder import obtine_mesaj_eveniment
+    return obtine_mesaj_eveniment(*argumente)
+
+
+@pytest.mark.parametrize('azi, eveniment, asteptat', [
+    (date(2026, 10, 24), date(2026, 10, 24), "evenimentul este astăzi, e weekend și probabil că nu mai pot fi efectuate acțiuni"),
+    (date(2026, 10, 24), date(2026, 10, 25), "evenimentul este mâine, e weekend și probabil că nu mai pot fi efectuate acțiuni"),
+    (date(2026, 10, 23), date(2026, 10, 24), "evenimentul este mâine"),
+    (date(2026, 10, 23), date(2026, 10, 25), "astăzi e ultima zi utilă, deoarece evenimentul pică în weekend"),
+    (date(2026, 10, 22), date(2026, 10, 24), "mai sunt două zile utile, astăzi și mâine, deoarece evenimentul pică în weekend"),
+    (date(2026, 10, 23), date(2026, 10, 31), "mai sunt 6 zile lucrătoare"),
+    (date(2026, 10, 19), date(2026, 10, 22), "mai sunt 3 zile lucrătoare, cu tot cu ziua evenimentului"),
+])
+def test_mesaj_saptamana_implicita(azi, eveniment, asteptat):
+    assert _mesaj(azi, eveniment, True, BusinessCalendar()) == asteptat
+
+
+def test_mesaj_dupa_program_si_sarbatori(tmp_path):
+    # Vinerea liberă și sâmbăta lucrătoare
+    program = BusinessCalendar.from_settings({'Vineri': {'day_off': True}, 'Sâmbătă': {'day_off': False}})
+    assert _mesaj(date(2026, 10, 23), date(2026, 10, 24), True, program) == "evenimentul este mâine"
+    assert _mesaj(date(2026, 10, 22), date(2026, 10, 25), True, program) == "mai sunt 2 zile lucrătoare"
+    assert _mesaj(date(2026, 10, 21), date(2026, 10, 23), True, program) == \
+        "mai sunt două zile utile, astăzi și mâine, deoarece evenimentul pică într-o zi liberă"
+    assert _mesaj(date(2026, 10, 23), date(2026, 10, 23), True, program) == \
+        "evenimentul este astăzi, e zi liberă și probabil că nu mai pot fi efectuate acțiuni"
+
+    # Crăciunul (vineri) este liber: joi e ultima zi utilă
+    sarbatori = BusinessCalendar.from_settings({}, _sarbatori(tmp_path, False), 2026)
+    assert _mesaj(date(2026, 12, 24), date(2026, 12, 26), True, sarbatori) == \
+        "astăzi e ultima zi utilă, deoarece evenimentul pică în weekend"
+    assert _mesaj(date(2026, 12, 24), date(2026, 12, 25), True, sarbatori) == "evenimentul este mâine"
+    assert _mesaj(date(2026, 12, 23), date(2026, 12, 25), True, sarbatori) == \
+        "mai sunt două zile utile, astăzi și mâine, deoarece evenimentul pică într-o zi liberă"
@@ -0,0 +1,84 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import reminder_check
+
+from conftest import TABELE
+
+RADACINA = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def verifica(capsys, *argumente):
+    cod = reminder_check.main(['--check', *argumente])
+    iesire = capsys.readouterr()
+    return cod, iesire.out, iesire.err
+
+
+def test_json(director_date, capsys):
+    cod, iesire, _ = verifica(capsys, '--data-dir', str(director_date), '--date', '2026-12-20', '--format', 'json')
+    assert cod == 0
+    rezultat = json.loads(iesire)
+    assert rezultat['data'] == '2026-12-20'
+    # Setările implicite ascund elementele îndeplinite; ordinea este cronologică
+    assert [(e['categorie'], e['eveniment'], e['data']) for e in rezultat['notificari']] == [
+        ('eveniment', 'Raport', '2026-12-23'),
+        ('sarbatoare', 'Crăciunul', '2026-12-25'),
+        ('aniversare', 'Ana', '2026-12-25'),
+        ('sarbatoare', 'Anul Nou', '2027-01-01'),
+    ]
+    raport = rezultat['notificari'][0]
+    assert raport == {'categorie': 'eveniment', 'eveniment': 'Raport', 'data': '2026-12-23', 'zile': 3,
+                      'urgent': False, 'zile_lucratoare': 3, 'ciclu': '', 'serviciu': True,
+                      'observatii': 'serviciu'}
+
+
+def test_data_in_formatul_din_fisiere_si_text(director_date, capsys):
+    cod, iesire, _ = verifica(capsys, '--data-dir', str(director_date), '--date', '20-12-2026')
+    assert cod == 0
+    linii = iesire.splitlines()
+    assert linii[0] == 'Scadențe pentru 20-12-2026: 4'
+    assert linii[1].split() == ['23-12-2026', 'peste', '3', 'zile', 'Raport', '(eveniment,', '3', 'zile', 'lucrătoare)']
+
+
+def test_setarile_din_directorul_de_date(director_date, capsys):
+    with open(director_date / 'window_settings.json', 'w', encoding='utf-8') as f:
+        json.dump({'visibility_index': 0, 'service_visibility': 'Evenimente serviciu ascunse',
+                   'show_commemorations': False}, f)
+    _, iesire, _ = verifica(capsys, '--data-dir', str(director_date), '--date', '2026-12-20', '--format', 'json')
+    assert [e['eveniment'] for e in json.loads(iesire)['notificari']] == ['Întâlnire', 'Ana', 'Cristi']
+
+
+def test_nu_modifica_datele(director_date, capsys):
+    inainte = {nume: (director_date / nume).read_bytes() for nume in TABELE}
+    verifica(capsys, '--data-dir', str(director_date), '--date', '2026-12-20')
+    assert {nume: (director_date / nume).read_bytes() for nume in TABELE} == inainte
+    assert sorted(os.listdir(director_date)) == sorted(TABELE)
+
+
+def test_director_fara_date(tmp_path, capsys):
+    cod, iesire, eroare = verifica(capsys, '--data-dir', str(tmp_path))
+    assert cod == 1 and iesire == ''
+    assert 'nu conține fișiere de date' in eroare
+    assert os.listdir(tmp_path) == []
+
+
+def test_data_invalida(capsys):
+    with pytest.raises(SystemExit) as iesire:
+        reminder_check.main(['--check', '--date', '31-31-2026'])
+    assert iesire.value.code == 2
+
+
+def test_reminder_check_nu_importa_qt(director_date):
+    cod = ("import runpy, sys\n"
+           f"sys.argv = ['Reminder.py', '--check', '--data-dir', {str(director_date)!r}, '--format', 'json']\n"
+           "try:\n"
+           f"    runpy.run_path({os.path.join(RADACINA, 'Reminder.py')!r}, run_name='__main__')\n"
+           "except SystemExit as e:\n"
+           "    print(e.code, 'PyQt5' in sys.modules, file=sys.stderr)\n")
+    rezultat = subprocess.run([sys.executable, '-c', cod], capture_output=True, text=True, timeout=60)
+    assert rezultat.stderr.split()[-2:] == ['0', 'False']
+    assert 'notificari' in json.loads(rezultat.stdout)
@@ -0,0 +1,183 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+import reminder_engine
+import reminder_storage
+from reminder_calendar import BusinessCalendar
+
+from conftest import TABELE, scrie_csv
+
+ZILE = [datetime(2026, 1, 1), datetime(2026, 2, 27), datetime(2026, 10, 18), datetime(2026, 12, 20),
+        datetime(2027, 2, 28), datetime(2028, 2, 29)]
+
+
+def tabel_inregistrari(tmp_path, nume, randuri):
+    scrie_csv(tmp_path / nume, randuri)
+    return reminder_storage.incarca_inregistrari(str(tmp_path / nume), nume)
+
+
+def tabel_pandas(tmp_path, nume, randuri):
+    pytest.importorskip('pandas')
+    scrie_csv(tmp_path / nume, randuri)
+    return reminder_storage.incarca_tabel(str(tmp_path / nume), nume)
+
+
+@pytest.mark.parametrize('ciclu, luni', [
+    ('lunar', 1), ('anual', 12), ('la 3 luni', 3), ('la 1 luna', 1), ('la 2 ani', 24), ('la 1 an', 12),
+    ('', 0), ('la x luni', 0), ('saptamanal', 0), (None, 0),
+])
+def test_luni_ciclu(ciclu, luni):
+    assert reminder_engine.luni_ciclu(ciclu) == luni
+
+
+# Ca în bucla inițială (adjust_date_custom), ziua limitată într-o lună scurtă nu mai revine:
+# 31 ianuarie lunar rămâne pe 28 după februarie, 29 februarie „la 2 ani” devine 28.
+SFARSIT_DE_LUNA = [
+    ('31-01-2026', 'lunar', datetime(2026, 10, 18), datetime(2026, 10, 28)),
+    ('31-01-2026', 'lunar', datetime(2026, 2, 10), datetime(2026, 2, 28)),
+    ('31-01-2026', 'lunar', datetime(2026, 3, 1), datetime(2026, 3, 28)),
+    ('31-01-2026', 'lunar', datetime(2026, 1, 31), datetime(2026, 2, 28)),
+    ('31-01-2026', 'anual', datetime(2030, 5, 1), datetime(2031, 1, 31)),
+    ('31-03-2026', 'la 2 luni', datetime(2027, 2, 1), datetime(2027, 3, 30)),
+    ('29-02-2024', 'la 2 ani', datetime(2026, 10, 18), datetime(2028, 2, 28)),
+    ('29-02-2024', 'anual', datetime(2026, 10, 18), datetime(2027, 2, 28)),
+    ('29-02-2096', 'la 4 ani', datetime(2100, 3, 1), datetime(2104, 2, 28)),
+    ('30-11-2025', 'la 3 luni', datetime(2026, 2, 27), datetime(2026, 2, 28)),
+    ('30-11-2025', 'la 3 luni', datetime(2026, 3, 1), datetime(2026, 5, 28)),
+]
+
+
+def _eveniment(data, ciclu):
+    return [TABELE['informatii.csv'][0], ['E', data, '5', ciclu, 'False', '0', 'pastreaza', 'False', '', '']]
+
+
+@pytest.mark.parametrize('data, ciclu, moment, asteptat', SFARSIT_DE_LUNA)
+def test_sfarsit_de_luna_scalar(data, ciclu, moment, asteptat):
+    data = datetime.strptime(data, '%d-%m-%Y')
+    assert reminder_engine.ajusteaza_data(data, moment, ciclu) == asteptat
+    assert reminder_engine.urmatoarea_aparitie(data, moment, ciclu) == asteptat
+
+
+@pytest.mark.parametrize('data, ciclu, moment, asteptat', SFARSIT_DE_LUNA)
+def test_sfarsit_de_luna_inregistrari(tmp_path, data, ciclu, moment, asteptat):
+    tabel = tabel_inregistrari(tmp_path, 'informatii.csv', _eveniment(data, ciclu))
+    calcul = reminder_engine.calculeaza_evenimente_inregistrari(tabel.perechi(), moment, BusinessCalendar())
+    assert calcul[0][1]['data_urmatoare'] == asteptat
+
+
+@pytest.mark.parametrize('data, ciclu, moment, asteptat', SFARSIT_DE_LUNA)
+def test_sfarsit_de_luna_pandas(tmp_path, data, ciclu, moment, asteptat):
+    tabel = tabel_pandas(tmp_path, 'informatii.csv', _eveniment(data, ciclu))
+    calcul = reminder_engine.calculeaza_evenimente(tabel, moment, BusinessCalendar())
+    assert calcul['data_urmatoare'].iloc[0].to_pydatetime() == asteptat
+
+
+@pytest.mark.parametrize('data, ciclu, moment, asteptat', SFARSIT_DE_LUNA)
+def test_sfarsit_de_luna_iterativ(tmp_path, data, ciclu, moment, asteptat):
+    tabel = tabel_inregistrari(tmp_path, 'informatii.csv', _eveniment(data, ciclu))
+    _, calcul, _ = reminder_engine.calculeaza_categorie_iterativ(
+        'informatii.csv', tabel, moment, BusinessCalendar(), True, True)
+    assert calcul[0][1]['data_urmatoare'] == asteptat
+
+
+def test_aparitii_ca_bucla_initiala():
+    """Formula directă, scalar și pe vectori, față de adunarea pas cu pas, pe date aleatoare."""
+    np = pytest.importorskip('numpy')
+    aleator = random.Random(7)
+    cicluri = ['lunar', 'anual', 'la 2 luni', 'la 3 luni', 'la 5 luni', 'la 18 luni', 'la 2 ani', 'la 4 ani']
+    date, pasi, asteptate = [], [], []
+    moment = datetime(2026, 10, 18)
+    for _ in range(2000):
+        # Mai ales zile de sfârșit de lună (29-31, sau 1-2 în luna următoare dacă luna e scurtă)
+        data = datetime(aleator.randint(1890, 2030), aleator.randint(1, 12), 1) + \
+            timedelta(days=aleator.choice([0, 14, 27, 28, 29, 30]))
+        ciclu = aleator.choice(cicluri)
+        asteptat = reminder_engine.ajusteaza_data(data, moment, ciclu)
+        assert reminder_engine.urmatoarea_aparitie(data, moment, ciclu) == asteptat, (data, ciclu)
+        date.append(data)
+        pasi.append(reminder_engine.luni_ciclu(ciclu))
+        asteptate.append(asteptat)
+    vector = reminder_engine.urmatoarele_aparitii(np.array(date, dtype='datetime64[ns]'), moment, pasi)
+    assert vector.tolist() == np.array(asteptate, dtype='datetime64[ns]').tolist()
+
+
+def _normalizeaza(notificari):
+    """Tuplurile de notificare cu scalarii NumPy/pandas aduși la tipuri Python."""
+    def simplu(valoare):
+        if isinstance(valoare, float) and valoare != valoare:
+            return None
+        if hasattr(valoare, 'to_pydatetime'):
+            return valoare.to_pydatetime()
+        if hasattr(valoare, 'item') and not isinstance(valoare, str):
+            return valoare.item()
+        return valoare
+    return [tuple(simplu(v) if v != '' else None for v in n) for n in notificari]
+
+
+@pytest.mark.parametrize('moment', ZILE)
+@pytest.mark.parametrize('arata_ascunse, arata_serviciu', [(True, True), (False, False), (False, True)])
+def test_pandas_si_inregistrari_dau_aceleasi_notificari(tmp_path, moment, arata_ascunse, arata_serviciu):
+    for nume, randuri in TABELE.items():
+        pandas = tabel_pandas(tmp_path, nume, randuri)
+        inregistrari = tabel_inregistrari(tmp_path, nume, randuri)
+        calendar = BusinessCalendar.from_settings({}, inregistrari, moment.year)
+        _, calcul_pd, notificari_pd = reminder_engine.calculeaza_categorie(
+            nume, pandas, moment, calendar, arata_ascunse, arata_serviciu)
+        sortat, calcul_rec, notificari_rec = reminder_engine.calculeaza_categorie(
+            nume, inregistrari, moment, calendar, arata_ascunse, arata_serviciu)
+        assert _normalizeaza(notificari_pd) == _normalizeaza(notificari_rec), nume
+        for tabel in (pandas, inregistrari):
+            _, calcul_it, notificari_it = reminder_engine.calculeaza_categorie_iterativ(
+                nume, tabel, moment, calendar, arata_ascunse, arata_serviciu)
+            assert _normalizeaza(notificari_it) == _normalizeaza(notificari_rec), nume
+            assert [(i, c['data_notificare'] if c['valid'] else None) for i, c in calcul_it] == \
+                [(i, c['data_notificare'] if c['valid'] else None) for i, c in calcul_rec], nume
+            if nume == 'informatii.csv':
+                assert reminder_engine.randuri_de_resetat(calcul_it) == reminder_engine.randuri_de_resetat(calcul_rec)
+        assert [d if v else None for d, v in zip(calcul_pd['data_notificare'], calcul_pd['valid'])] == \
+            [c['data_notificare'] if c['valid'] else None for _, c in calcul_rec], nume
+        momente_pd = reminder_engine.momente_de_interes(pandas.loc[calcul_pd.index], calcul_pd, moment)
+        assert momente_pd == reminder_engine.momente_de_interes_inregistrari(sortat, calcul_rec, moment), nume
+
+
+def test_notificari_evenimente(tmp_path):
+    tabel = tabel_inregistrari(tmp_path, 'informatii.csv', TABELE['informatii.csv'])
+    moment = datetime(2026, 12, 20)
+    _, _, notificari = reminder_engine.calculeaza_categorie(
+        'informatii.csv', tabel, moment, BusinessCalendar(), True, True)
+    pe_nume = {n[0]: n for n in notificari}
+    # Chirie (31 decembrie) e încă în afara celor 5 zile de avans
+    assert set(pe_nume) == {'Raport', 'Întâlnire'}
+    raport = pe_nume['Raport']
+    assert raport[1] == datetime(2026, 12, 23) and raport[2] == 3
+    # 20 decembrie 2026 este duminică: până pe 23 (miercuri) rămâne o zi de weekend
+    assert raport[4] == 1 and raport[3] == 3 and raport[6] is False
+
+    for arata_ascunse, arata_serviciu, asteptat in ((False, True, {'Raport'}), (False, False, set())):
+        _, _, vizibile = reminder_engine.calculeaza_categorie(
+            'informatii.csv', tabel, moment, BusinessCalendar(), arata_ascunse, arata_serviciu)
+        assert {n[0] for n in vizibile} == asteptat
+
+
+def test_randuri_de_resetat(tmp_path):
+    tabel = tabel_inregistrari(tmp_path, 'informatii.csv', TABELE['informatii.csv'])
+    _, calcul, _ = reminder_engine.calculeaza_categorie(
+        'informatii.csv', tabel, datetime(2026, 10, 18), BusinessCalendar(), True, True)
+    # Doar evenimentul recurent îndeplinit a cărui apariție s-a mutat; cel nerecurent rămâne îndeplinit
+    assert [tabel.randuri[i]['eveniment'] for i in reminder_engine.randuri_de_resetat(calcul)] == ['Impozit']
+
+
+def test_aniversari_si_sarbatori(tmp_path):
+    moment = datetime(2026, 12, 20)
+    aniversari = tabel_inregistrari(tmp_path, 'aniversari.csv', TABELE['aniversari.csv'])
+    _, _, notificari = reminder_engine.calculeaza_categorie('aniversari.csv', aniversari, moment, None, True, True)
+    assert [(n[0], n[1], n[3], n[4]) for n in notificari] == [
+        ('Ana', datetime(2026, 12, 25), 36, False), ('Cristi', datetime(2027, 1, 1), 27, False)]
+
+    sarbatori = tabel_inregistrari(tmp_path, 'sarbatori.csv', TABELE['sarbatori.csv'])
+    _, calcul, notificari = reminder_engine.calculeaza_categorie('sarbatori.csv', sarbatori, moment, None, True, True)
+    assert [(n[0], n[2]) for n in notificari] == [('Crăciunul', 5), ('Anul Nou', 12)]
+    # 31 februarie nu există în niciun an
+    assert [c['valid'] for i, c in calcul if sarbatori.randuri[i]['eveniment'] == 'Zi invalidă'] == [False]
@@ -0,0 +1,69 @@
+import gzip
+import struct
+from datetime import date, datetime
+
+import reminder_history
+from reminder_history import HistoryWriter, citeste_index, citeste_istoric
+
+
+def _scrie_istoric(cale, zile, comprima=False):
+    """Un istoric cu câte două înregistrări pe zi și indexul lui, ca cel scris de HistoryWriter."""
+    continut, index = b'', b''
+    for zi in zile:
+        index += struct.pack(reminder_history.FORMAT_INDEX, zi.toordinal(), len(continut))
+        for ora in (9, 18):
+            continut += f"{datetime(zi.year, zi.month, zi.day, ora).isoformat()}\tintrat\tinformatii.csv\t{zi}\t{zi}\n".encode()
+    deschide = gzip.open if comprima else open
+    with deschide(cale, 'wb') as f:
+        f.write(continut)
+    with open(cale + '.idx', 'wb') as f:
+        f.write(index)
+
+
+def test_citeste_istoric_dupa_index(tmp_path):
+    zile = [date(2026, 10, 1), date(2026, 10, 3), date(2026, 10, 7), date(2026, 10, 8)]
+    for comprima, nume in ((False, 'log.txt'), (True, 'log-arhiva.txt.gz')):
+        cale = str(tmp_path / nume)
+        _scrie_istoric(cale, zile, comprima)
+        assert [zi for zi, _ in citeste_index(cale + '.idx')] == [zi.toordinal() for zi in zile]
+        inregistrari = citeste_istoric(cale, date(2026, 10, 2), date(2026, 10, 7))
+        assert [r[3] for r in inregistrari] == ['2026-10-03', '2026-10-03', '2026-10-07', '2026-10-07']
+        assert len(citeste_istoric(cale, date(2026, 10, 8))) == 2
+        assert citeste_istoric(cale, date(2026, 10, 9)) == []
+
+
+def test_index_trunchiat(tmp_path):
+    cale = str(tmp_path / 'log.txt')
+    _scrie_istoric(cale, [date(2026, 10, 1), date(2026, 10, 2)])
+    with open(cale + '.idx', 'ab') as f:
+        f.write(b'\x01\x02')
+    assert len(citeste_index(cale + '.idx')) == 2
+
+
+def test_se_scriu_doar_schimbarile_de_stare(tmp_path):
+    cale = str(tmp_path / 'log.txt')
+    scriitor = HistoryWriter(cale)
+    scriitor.inregistreaza_notificari([('informatii.csv', 'Chirie', '2026-10-31', False)])
+    scriitor.inregistreaza_notificari([('informatii.csv', 'Chirie', '2026-10-31', False)])
+    scriitor.inregistreaza_notificari([('informatii.csv', 'Chirie', '2026-10-31', True),
+                                       ('aniversari.csv', 'Ana', '2026-12-25', False)])
+    scriitor.inregistreaza_indeplinit('informatii.csv', 'Chirie', '2026-10-31')
+    scriitor.inregistreaza_indeplinit('informatii.csv', 'Chirie', '2026-10-31')
+    scriitor.inchide()
+
+    with open(cale, encoding='utf-8') as f:
+        linii = [linie.rstrip('\n').split('\t')[1:] for linie in f]
+    assert linii == [
+        ['intrat', 'informatii.csv', 'Chirie', '2026-10-31'],
+        ['rosu', 'informatii.csv', 'Chirie', '2026-10-31'],
+        ['intrat', 'aniversari.csv', 'Ana', '2026-12-25'],
+        ['indeplinit', 'informatii.csv', 'Chirie', '2026-10-31'],
+    ]
+    assert len(citeste_istoric(cale, date.today())) == 4
+
+    # Starea se păstrează între porniri: aceeași notificare nu se mai scrie
+    scriitor = HistoryWriter(cale)
+    scriitor.inregistreaza_notificari([('aniversari.csv', 'Ana', '2026-12-25', False)])
+    scriitor.inchide()
+    with open(cale, encoding='utf-8') as f:
+        assert len(f.readlines()) == 4
@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from reminder_scheduler import NotificationScheduler, momente_program_lucru, urmatoarea_zi
+
+ACUM = datetime(2026, 10, 21, 12, 0)
+
+
+def test_urmatorul_moment_in_ordine():
+    planificator = NotificationScheduler()
+    planificator.inlocuieste('informatii.csv', [datetime(2026, 10, 25), datetime(2026, 10, 23)])
+    planificator.inlocuieste('zi', [datetime(2026, 10, 22)], 'zi nouă')
+    assert planificator.urmatorul(ACUM) == (datetime(2026, 10, 22), 'zi nouă')
+    assert planificator.urmatorul(datetime(2026, 10, 22, 0, 0, 1)) == (datetime(2026, 10, 23), 'informatii.csv')
+    assert len(planificator) == 2
+
+
+def test_inlocuirea_unei_categorii_ignora_momentele_vechi():
+    planificator = NotificationScheduler()
+    planificator.inlocuieste('informatii.csv', [datetime(2026, 10, 22)])
+    planificator.inlocuieste('aniversari.csv', [datetime(2026, 10, 30)])
+    planificator.inlocuieste('informatii.csv', [datetime(2026, 11, 2)])
+    assert planificator.urmatorul(ACUM) == (datetime(2026, 10, 30), 'aniversari.csv')
+    assert planificator.momente('informatii.csv', ACUM) == [datetime(2026, 11, 2)]
+    planificator.inlocuieste('aniversari.csv', [])
+    assert planificator.urmatorul(ACUM) == (datetime(2026, 11, 2), 'informatii.csv')
+
+
+def test_coada_goala():
+    planificator = NotificationScheduler()
+    planificator.inlocuieste('zi', [datetime(2026, 10, 20)])
+    assert planificator.urmatorul(ACUM) == (None, None)
+    # Momentele trecute se scot din coadă la extragere
+    assert len(planificator) == 0
+    assert planificator.momente('zi', ACUM) == []
+
+
+def test_urmatoarea_zi():
+    assert urmatoarea_zi(ACUM) == datetime(2026, 10, 22)
+    assert urmatoarea_zi(datetime(2026, 12, 31, 23, 59)) == datetime(2027, 1, 1)
+
+
+def test_momente_program_lucru():
+    program = {
+        'Miercuri': {'start': '08:00', 'end': '16:00', 'day_off': False},
+        'Joi': {'start': '09:30', 'end': '17:00', 'day_off': False},
+        'Vineri': {'start': '08:00', 'end': '16:00', 'day_off': True},
+        'Sâmbătă': {'start': 'greșit', 'end': '12:00', 'day_off': False},
+    }
+    momente = momente_program_lucru(program, ACUM, zile=4)
+    # Miercuri 21: începutul a trecut; sfârșitul e inclusiv, deci schimbarea e la 16:00:01
+    assert momente == [datetime(2026, 10, 21, 16, 0, 1), datetime(2026, 10, 22, 9, 30),
+                       datetime(2026, 10, 22, 17, 0, 1), datetime(2026, 10, 24, 12, 0, 1)]
+
+
+def test_inlocuirile_repetate_nu_cresc_coada():
+    planificator = NotificationScheduler()
+    planificator.inlocuieste('zi', [datetime(2026, 10, 22)])
+    momente = [datetime(2026, 10, 22, ora) for ora in range(1, 24)]
+    for _ in range(500):
+        planificator.inlocuieste('informatii.csv', momente)
+        planificator.inlocuieste('aniversari.csv', momente[:5])
+    assert len(planificator) == 1 + len(momente) + 5
+    assert planificator.momente('informatii.csv', ACUM) == momente
+    assert planificator.urmatorul(ACUM) == (datetime(2026, 10, 22), 'zi')
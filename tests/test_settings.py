@@ -0,0 +1,48 @@
+import json
+
+from reminder_settings import DEFAULT_SETTINGS, SettingsStore
+
+
+class TimerFals:
+    def __init__(self, functie):
+        self.functie = functie
+        self.porniri = 0
+
+    def start(self, interval):
+        self.porniri += 1
+
+    def stop(self):
+        pass
+
+
+def test_orice_modificare_programeaza_scrierea(tmp_path):
+    timere = []
+    setari = SettingsStore(str(tmp_path / 'setari.json'), {'a': 1},
+                           fabrica_timer=lambda functie: timere.append(TimerFals(functie)) or timere[-1])
+    setari['b'] = 2
+    setari.update(c=3)
+    del setari['a']
+    setari.setdefault('d', 4)
+    setari.pop('c')
+    assert setari.murdar and timere[0].porniri == 5
+
+    timere[0].functie()
+    assert json.loads((tmp_path / 'setari.json').read_text(encoding='utf-8')) == {'b': 2, 'd': 4}
+    assert not setari.murdar
+
+
+def test_scrie_doar_daca_textul_s_a_schimbat(tmp_path):
+    cale = tmp_path / 'setari.json'
+    setari = SettingsStore.incarca(str(cale), DEFAULT_SETTINGS)
+    assert setari == DEFAULT_SETTINGS
+    setari['x'] = 10
+    assert setari.scrie_acum()
+    setari['x'] = 10
+    assert not setari.scrie_acum()
+    assert SettingsStore.incarca(str(cale))['x'] == 10
+
+
+def test_fisier_corupt(tmp_path):
+    cale = tmp_path / 'setari.json'
+    cale.write_text('[1, 2', encoding='utf-8')
+    assert SettingsStore.incarca(str(cale), {'y': 1}) == {'y': 1}
@@ -0,0 +1,57 @@
+import os
+from datetime import date, datetime
+
+import numpy as np
+
+from reminder_calendar import BusinessCalendar
+from reminder_snapshot import NotificationSnapshot, amprenta
+
+NOTIFICARI = {'informatii.csv': [('Chirie', datetime(2026, 10, 23), np.int64(5), np.bool_(True), float('nan'))]}
+MOMENTE = {'informatii.csv': [datetime(2026, 10, 19, 0, 0)]}
+
+
+def test_instantaneu_dus_intors(tmp_path):
+    fisier = tmp_path / 'informatii.csv'
+    fisier.write_text('eveniment\n', encoding='utf-8')
+    intrari = amprenta([str(fisier)], {})
+    instantaneu = NotificationSnapshot(str(tmp_path / 'instantaneu.json'))
+    instantaneu.salveaza(date(2026, 10, 18), intrari, NOTIFICARI, MOMENTE, BusinessCalendar())
+
+    incarcat = NotificationSnapshot(str(tmp_path / 'instantaneu.json')).incarca(date(2026, 10, 18), intrari)
+    assert incarcat['notificari'] == {'informatii.csv': [('Chirie', datetime(2026, 10, 23), 5, True, None)]}
+    assert incarcat['momente'] == MOMENTE
+    assert incarcat['calendar']['masca'] == [True] * 5 + [False] * 2
+
+    # Altă zi sau altă amprentă: instantaneul nu se folosește
+    assert instantaneu.incarca(date(2026, 10, 19), intrari) is None
+    assert instantaneu.incarca(date(2026, 10, 18), amprenta([str(fisier)], {'visibility_index': 1})) is None
+
+
+def test_instantaneul_nu_se_rescrie_daca_nu_s_a_schimbat(tmp_path):
+    cale = tmp_path / 'instantaneu.json'
+    instantaneu = NotificationSnapshot(str(cale))
+    instantaneu.salveaza(date(2026, 10, 18), {}, NOTIFICARI, MOMENTE, BusinessCalendar())
+    os.utime(cale, ns=(0, 0))
+    instantaneu.salveaza(date(2026, 10, 18), {}, NOTIFICARI, MOMENTE, BusinessCalendar())
+    assert os.stat(cale).st_mtime_ns == 0
+
+
+def test_instantaneu_lipsa_sau_corupt(tmp_path):
+    cale = tmp_path / 'instantaneu.json'
+    assert NotificationSnapshot(str(cale)).incarca(date(2026, 10, 18), {}) is None
+    cale.write_text('{"versiune": 1, "zi"', encoding='utf-8')
+    assert NotificationSnapshot(str(cale)).incarca(date(2026, 10, 18), {}) is None
+
+
+def test_amprenta(tmp_path):
+    fisier = tmp_path / 'informatii.csv'
+    lipsa = str(tmp_path / 'aniversari.csv')
+    fisier.write_text('eveniment\n', encoding='utf-8')
+    setari = {'visibility_index': 0, 'font_size': 12}
+    initiala = amprenta([str(fisier), lipsa], setari)
+    assert initiala['fisiere'][lipsa] is None
+    # Fonturile nu influențează lista; vizibilitatea și fișierele de date, da
+    assert amprenta([str(fisier), lipsa], dict(setari, font_size=20)) == initiala
+    assert amprenta([str(fisier), lipsa], dict(setari, visibility_index=1)) != initiala
+    fisier.write_text('eveniment\nChirie\n', encoding='utf-8')
+    assert amprenta([str(fisier), lipsa], setari) != initiala
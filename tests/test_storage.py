@@ -0,0 +1,172 @@
+import os
+from datetime import datetime
+
+import pytest
+
+import reminder_engine
+import reminder_storage
+from reminder_calendar import BusinessCalendar
+
+from conftest import TABELE, scrie_csv
+
+
+def citeste(cale):
+    with open(cale, encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+def test_scrie_atomic(tmp_path):
+    cale = tmp_path / 'date.csv'
+    reminder_storage.scrie_atomic(str(cale), 'a,b\r\nă,ș\n')
+    assert citeste(cale) == 'a,b\r\nă,ș\n'
+    reminder_storage.scrie_atomic(str(cale), 'nou\n')
+    assert citeste(cale) == 'nou\n'
+    assert os.listdir(tmp_path) == ['date.csv']
+
+
+def test_scrie_atomic_pastreaza_originalul_la_eroare(tmp_path):
+    cale = tmp_path / 'date.csv'
+    reminder_storage.scrie_atomic(str(cale), 'original\n')
+    with pytest.raises(TypeError):
+        reminder_storage.scrie_atomic(str(cale), b'nu este text')
+    assert citeste(cale) == 'original\n'
+    assert os.listdir(tmp_path) == ['date.csv']
+
+
+@pytest.mark.parametrize('prag', [reminder_storage.PRAG_PANDAS, -1])
+def test_flush_scrie_o_singura_data(director_date, prag):
+    if prag < 0:
+        pytest.importorskip('pandas')
+    cale = director_date / 'informatii.csv'
+    repository = reminder_storage.DataRepository(reminder_storage.CSVBackend(str(director_date)), prag)
+    repository.incarca_tot()
+    assert repository.flush() == []
+
+    assert repository.seteaza_valoare('informatii.csv', 0, 'stare', 'indeplinit')
+    assert not repository.seteaza_valoare('informatii.csv', 0, 'stare', 'indeplinit')
+    assert repository.flush() == ['informatii.csv']
+    assert ',indeplinit,' in citeste(cale).splitlines()[1]
+    assert repository.flush() == []
+
+
+def test_calculul_salvat_este_idempotent(director_date):
+    repository = reminder_storage.DataRepository(reminder_storage.CSVBackend(str(director_date)))
+    moment = datetime(2026, 10, 18)
+    for _ in range(2):
+        tabel = repository.tabel('informatii.csv')
+        _, calcul, _ = reminder_engine.calculeaza_categorie(
+            'informatii.csv', tabel, moment, BusinessCalendar(), True, True)
+        repository.aplica_calcul('informatii.csv', calcul)
+        repository.seteaza_valori('informatii.csv', reminder_engine.randuri_de_resetat(calcul), 'stare', 'pastreaza')
+        scrise = repository.flush()
+    assert scrise == []
+    # 31 ianuarie lunar rămâne pe 28 după februarie: 28 octombrie minus 5 zile de avans
+    assert repository.tabel('informatii.csv').randuri[0]['data_notificare'] == '23-10-2026'
+
+
+def incarca(cale, mod):
+    """Fișierul citit cu pandas sau cu modulul csv, ca listă de dicționare cu valorile lipsă None."""
+    if mod == 'pandas':
+        pytest.importorskip('pandas')
+        tabel = reminder_storage.incarca_tabel(str(cale))
+        return list(tabel.columns), tabel.astype(object).where(tabel.notna(), None).to_dict('records')
+    tabel = reminder_storage.incarca_inregistrari(str(cale))
+    return tabel.columns, tabel.randuri
+
+
+@pytest.mark.parametrize('mod', ['pandas', 'inregistrari'])
+def test_normalizare_intr_o_singura_trecere(tmp_path, mod):
+    cale = tmp_path / 'informatii.csv'
+    scrie_csv(cale, TABELE['informatii.csv'])
+    _, randuri = incarca(cale, mod)
+    asigurare = randuri[-1]
+    assert asigurare['data'] == datetime(2020, 3, 15)
+    assert asigurare['weekend'] and not asigurare['serviciu']
+    assert asigurare['stare'] == 'pastreaza' and asigurare['avanszile'] == 30
+    assert randuri[5]['data'] is None
+    text = citeste(cale)
+    assert 'true' not in text and ',True,5,pastreaza,False,' in text
+
+    # Un fișier deja normalizat nu se mai rescrie
+    inainte = os.stat(cale).st_mtime_ns
+    incarca(cale, mod)
+    assert os.stat(cale).st_mtime_ns == inainte
+
+
+@pytest.mark.parametrize('mod', ['pandas', 'inregistrari'])
+def test_coloane_lipsa_si_luni_in_engleza(tmp_path, mod):
+    cale = tmp_path / 'sarbatori.csv'
+    scrie_csv(cale, [['eveniment', 'ziua', 'luna'], ['Anul Nou', '1', 'January'], ['Fără zi', '', 'Martie']])
+    coloane, randuri = incarca(cale, mod)
+    assert coloane == list(reminder_storage.SCHEME['sarbatori.csv'])
+    assert randuri[0]['luna'] == 'Ianuarie' and randuri[0]['ziua'] == 1
+    assert randuri[1]['ziua'] is None and randuri[1]['avanszile'] == 0
+
+
+@pytest.mark.parametrize('nume', list(TABELE))
+def test_pandas_si_modulul_csv_normalizeaza_la_fel(tmp_path, nume):
+    pytest.importorskip('pandas')
+    (tmp_path / 'pd').mkdir()
+    (tmp_path / 'csv').mkdir()
+    scrie_csv(tmp_path / 'pd' / nume, TABELE[nume])
+    scrie_csv(tmp_path / 'csv' / nume, TABELE[nume])
+    tabel = reminder_storage.incarca_tabel(str(tmp_path / 'pd' / nume))
+    inregistrari = reminder_storage.incarca_inregistrari(str(tmp_path / 'csv' / nume))
+    assert citeste(tmp_path / 'pd' / nume) == citeste(tmp_path / 'csv' / nume)
+    assert reminder_storage.serializeaza(tabel, nume) == reminder_storage.serializeaza_inregistrari(inregistrari)
+
+
+def test_prag_pandas(director_date):
+    backend = reminder_storage.CSVBackend(str(director_date))
+    assert reminder_storage.DataRepository(backend).foloseste_inregistrari('informatii.csv')
+    if reminder_storage.pd is not None:
+        assert not reminder_storage.DataRepository(backend, prag_pandas=-1).foloseste_inregistrari('informatii.csv')
+    assert not reminder_storage.DataRepository(object()).foloseste_inregistrari('informatii.csv')
+
+
+@pytest.fixture
+def sqlite(director_date):
+    pytest.importorskip('pandas')
+    backend = reminder_storage.SQLiteBackend(str(director_date / 'reminder.db'), str(director_date))
+    yield backend
+    backend.inchide()
+
+
+def test_sqlite_dus_intors(director_date, sqlite, tmp_path):
+    for nume in TABELE:
+        assert sqlite.este_gol(nume)
+        sqlite.importa_csv(nume, str(director_date / nume))
+        assert not sqlite.este_gol(nume)
+        sqlite.exporta_csv(nume, str(tmp_path / ('export_' + nume)))
+        assert citeste(tmp_path / ('export_' + nume)) == citeste(director_date / nume)
+
+
+def test_sqlite_candidati_scadente(director_date, sqlite):
+    sqlite.importa_csv('informatii.csv', str(director_date / 'informatii.csv'))
+    repository = reminder_storage.DataRepository(sqlite)
+    moment = datetime(2026, 10, 18)
+    tabel = repository.tabel('informatii.csv')
+    assert len(repository.candidati_scadente('informatii.csv', moment)) == len(tabel)
+
+    _, calcul, _ = reminder_engine.calculeaza_categorie('informatii.csv', tabel, moment, BusinessCalendar(), True, True)
+    repository.aplica_calcul('informatii.csv', calcul)
+    candidati = repository.candidati_scadente('informatii.csv', moment)
+    # Rămân doar rândurile fără calcul valid sau aflate deja în fereastra de notificare
+    assert set(candidati['eveniment']) == {'Fără dată'}
+    assert repository.urmatoarea_scadenta('informatii.csv', moment) == datetime(2026, 10, 23)
+
+
+def test_modificari_externe(director_date):
+    cale = director_date / 'informatii.csv'
+    repository = reminder_storage.DataRepository(reminder_storage.CSVBackend(str(director_date)))
+    repository.incarca_tot()
+    repository.seteaza_valoare('informatii.csv', 0, 'stare', 'indeplinit')
+    repository.flush()
+    # Scrierea proprie nu apare ca modificare externă; una făcută de altcineva, da
+    assert repository.modificate_extern() == []
+    reminder_storage.scrie_atomic(str(cale), citeste(cale) + 'Nou,01-01-2027,1,,False,0,pastreaza,False,,\n')
+    assert repository.modificate_extern() == ['informatii.csv']
+    # Până la reîncărcare
+    repository.incarca('informatii.csv')
+    assert repository.modificate_extern() == []
+    assert repository.tabel('informatii.csv').randuri[-1]['eveniment'] == 'Nou'
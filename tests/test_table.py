@@ -0,0 +1,142 @@
+from array import array
+
+import pytest
+
+from reminder_table import (DictColumn, TableStore, TextColumn, TrigramIndex, citeste_bloc, converteste_lipire,
+                            fara_diacritice, intervale, muta, scrie_bloc_html, scrie_bloc_tsv)
+
+ANTET = ['eveniment', 'data', 'stare', 'observatii']
+RANDURI = [
+    ['Chirie', '31-01-2026', 'pastreaza', ''],
+    ['Impozit', '30-11-2025', 'indeplinit', 'anual'],
+    ['Raport', '31-01-2026', 'pastreaza', 'serviciu'],
+]
+
+
+def test_coloane_codificate_prin_dictionar():
+    tabel = TableStore(ANTET, RANDURI, ids=[10, 11, 12])
+    assert isinstance(tabel.coloane[0], TextColumn) and isinstance(tabel.coloane[1], DictColumn)
+    data = tabel.coloane[1]
+    assert isinstance(data.coduri, array) and data.coduri.typecode == 'I'
+    assert data.categorii == ['31-01-2026', '30-11-2025'] and list(data.coduri) == [0, 1, 0]
+    assert tabel.rows() == RANDURI and tabel.row(1) == RANDURI[1] and tabel.value(2, 2) == 'pastreaza'
+
+    tabel.set_value(1, 2, 'pastreaza')
+    tabel.set_value(0, 1, '01-02-2026')
+    assert tabel.coloane[2].categorii == ['pastreaza', 'indeplinit'] and list(tabel.coloane[2].coduri) == [0, 0, 0]
+    assert tabel.value(0, 1) == '01-02-2026' and tabel.ids == [10, 11, 12]
+
+
+def test_inserare_stergere_mutare_reordonare():
+    tabel = TableStore(ANTET, RANDURI, ids=[10, 11, 12])
+    tabel.insert_rows(1, [['Nou', '', 'pastreaza']])
+    assert tabel.row(1) == ['Nou', '', 'pastreaza', ''] and tabel.ids == [10, None, 11, 12]
+
+    tabel.move_rows(0, 2, 2)
+    assert [r[0] for r in tabel.rows()] == ['Impozit', 'Raport', 'Chirie', 'Nou'] and tabel.ids == [11, 12, 10, None]
+
+    tabel.remove_rows(1, 2)
+    assert [r[0] for r in tabel.rows()] == ['Impozit', 'Nou'] and tabel.ids == [11, None]
+
+    tabel.reorder([1, 0])
+    assert tabel.rows() == [['Nou', '', 'pastreaza', ''], RANDURI[1]] and tabel.ids == [None, 11]
+
+
+def test_cheile_de_sortare_o_data_pe_valoare():
+    tabel = TableStore(ANTET, RANDURI)
+    apeluri = []
+
+    def cheie(valoare):
+        apeluri.append(valoare)
+        return valoare[::-1]
+
+    assert tabel.sort_keys(1, cheie) == ['6202-10-13', '5202-11-03', '6202-10-13']
+    assert apeluri == ['31-01-2026', '30-11-2025']
+    tabel.insert_rows(3, [['Altul', '01-01-2027', 'pastreaza', '']])
+    tabel.sort_keys(1, cheie)
+    # Doar valoarea nouă primește cheie; cele vechi vin din cache
+    assert apeluri == ['31-01-2026', '30-11-2025', '01-01-2027']
+
+
+@pytest.mark.parametrize('pozitie, numar, destinatie, asteptat', [
+    (0, 2, 3, [2, 3, 4, 0, 1]),
+    (3, 2, 0, [3, 4, 0, 1, 2]),
+    (1, 1, 1, [0, 1, 2, 3, 4]),
+    (2, 1, 4, [0, 1, 3, 4, 2]),
+])
+def test_muta(pozitie, numar, destinatie, asteptat):
+    for valori in (list(range(5)), array('I', range(5))):
+        muta(valori, pozitie, numar, destinatie)
+        assert list(valori) == asteptat
+
+
+def test_intervale():
+    assert intervale(set()) == []
+    assert intervale({7, 2, 3, 4, 9, 10, 0}) == [(0, 1), (2, 3), (7, 1), (9, 2)]
+    assert intervale([5]) == [(5, 1)]
+
+
+def test_fara_diacritice():
+    assert fara_diacritice('Ștefan Țăran Ânîşţ') == 'stefan taran anist'
+
+
+def test_index_de_trigrame():
+    index = TrigramIndex(['Plată chirie', 'Revizie mașină', 'Chiriaș nou'])
+    assert index.cauta('chiri') == {'Plată chirie', 'Chiriaș nou'}
+    assert index.cauta('masina') == {'Revizie mașină'}
+    assert index.cauta('ie') == {'Plată chirie', 'Revizie mașină'}
+    assert index.cauta('xyz') == set()
+    index.adauga('Chirie garaj')
+    assert index.cauta('chirie') == {'Plată chirie', 'Chirie garaj'}
+
+
+def test_filtrul_pe_tot_tabelul_si_pe_interval():
+    tabel = TableStore(ANTET, RANDURI + [['Revizie', '31-01-2026', 'pastreaza', 'chirie auto']])
+    predicate = [(2, lambda stare: stare == 'pastreaza')]
+    assert tabel.filtreaza(['chirie']) == [True, False, False, True]
+    assert tabel.filtreaza(['ser'], predicate) == [False, False, True, False]
+    assert tabel.filtreaza([], predicate) == [True, False, True, True]
+    assert tabel.filtreaza(['chirie', 'auto']) == [False, False, False, True]
+    for termeni in ([], ['chirie'], ['an'], ['r']):
+        assert tabel.filtreaza_interval(1, 4, termeni, predicate) == tabel.filtreaza(termeni, predicate)[1:4]
+
+    # Editarea actualizează indexul construit la prima căutare
+    tabel.set_value(1, 0, 'Chirie birou')
+    assert tabel.filtreaza(['chirie']) == [True, True, False, True]
+
+
+@pytest.mark.parametrize('text, asteptat', [
+    ('', []),
+    ('Plată, chirie', [['Plată, chirie']]),
+    ('Plată, chirie\r\n', [['Plată, chirie']]),
+    ('unu\r\ndoi\r\n\r\n', [['unu'], ['doi']]),
+    ('unu\n\ndoi\n', [['unu'], [''], ['doi']]),
+    ('a\tb\r\nc\td\r\n', [['a', 'b'], ['c', 'd']]),
+    ('"pe două\nlinii"\tb\n', [['pe două\nlinii', 'b']]),
+    ('a,1\nb,2\n', [['a', '1'], ['b', '2']]),
+    ('a,1\nb\n', [['a,1'], ['b']]),
+])
+def test_citeste_bloc(text, asteptat):
+    assert citeste_bloc(text) == asteptat
+
+
+def test_blocul_copiat_se_citeste_inapoi():
+    bloc = [['Plată, chirie', 'pe două\nlinii'], ['<b>', '"citat"']]
+    assert citeste_bloc(scrie_bloc_tsv(bloc)) == bloc
+    assert scrie_bloc_html(bloc, ['eveniment', 'observatii']) == (
+        '<table>\n<tr><th>eveniment</th><th>observatii</th></tr>\n'
+        '<tr><td>Plată, chirie</td><td>pe două\nlinii</td></tr>\n'
+        '<tr><td>&lt;b&gt;</td><td>&quot;citat&quot;</td></tr>\n</table>')
+
+
+@pytest.mark.parametrize('tip, valori, asteptat', [
+    ('data', ['31.01.2026', '2026-01-31', '31/01/2026', '', '31-02-2026'], ['31-01-2026'] * 3 + ['', None]),
+    ('int', ['5', '5,0', '', '2.5', 'x'], ['5', '5', '0', None, None]),
+    ('zi', ['7', '', '32'], ['7', '', None]),
+    ('bool', ['true', 'Da', '0', '', 'poate'], ['True', 'True', 'False', 'False', None]),
+    ('luna', ['martie', 'March', 'mar', '3', '', 'x'], ['Martie'] * 4 + ['', None]),
+    ('stare', ['Păstrează', '', 'indeplinit', 'gata'], ['pastreaza', 'pastreaza', 'indeplinit', None]),
+    ('text', [' liber '], [' liber ']),
+])
+def test_converteste_lipire(tip, valori, asteptat):
+    assert converteste_lipire(tip, valori) == asteptat